@@ -0,0 +1,148 @@
+#ifndef QUADRATURERULES_DATA_C
+
+#define QUADRATURERULES_DATA_C
+
+#include <stdatomic.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include "quadraturerules.h"
+
+#if !defined(__GNUC__)
+#error "The binary data file can only be embedded by GCC and Clang"
+#endif
+
+/// The data file rules.bin is embedded in the library when it is compiled. The assembler looks
+/// for rules.bin in the directory that the compiler is run from.
+#if defined(__APPLE__)
+#define QR_DATA_SECTION ".const_data\n"
+#elif defined(_WIN32)
+#define QR_DATA_SECTION ".section .rdata, \"dr\"\n"
+#else
+#define QR_DATA_SECTION ".section .rodata\n"
+#endif
+#define QR_STRING_(x) #x
+#define QR_STRING(x) QR_STRING_(x)
+#define QR_SYMBOL(name) QR_STRING(__USER_LABEL_PREFIX__) #name
+
+__asm__(
+    QR_DATA_SECTION
+    ".balign 8\n"
+    ".globl " QR_SYMBOL(quadraturerules_data_start) "\n"
+    QR_SYMBOL(quadraturerules_data_start) ":\n"
+    ".incbin \"rules.bin\"\n"
+    ".globl " QR_SYMBOL(quadraturerules_data_end) "\n"
+    QR_SYMBOL(quadraturerules_data_end) ":\n"
+    ".text\n"
+);
+
+extern const int64_t quadraturerules_data_start[];
+extern const unsigned char quadraturerules_data_end[];
+
+static const char qr_data_magic[8] = {'Q', 'R', 'U', 'L', 'E', 'S', 0, 1};
+
+/// The number of integers in each entry of the index of the data file.
+#define QR_ENTRY_SIZE 7
+
+/// A rule in the data file.
+typedef struct
+{
+  int family;
+  QuadratureRuleData data;
+} QrRule;
+
+/// The rules in the data file.
+typedef struct
+{
+  size_t count;
+  QrRule rules[];
+} QrTable;
+
+/// The table of rules, which is built the first time a rule is used.
+static QrTable* _Atomic qr_table = NULL;
+
+/// Build the table of rules from the index of the data file.
+///
+/// The numbers in the file are little-endian, so the file can only be read on little-endian
+/// platforms. Returns NULL if the file is invalid or the table cannot be allocated.
+static QrTable* qr_build_table(void)
+{
+  const uint16_t endian_test = 1;
+  if (*(const unsigned char*)&endian_test != 1)
+    return NULL;
+
+  const int64_t* data = quadraturerules_data_start;
+  const size_t size = quadraturerules_data_end - (const unsigned char*)data;
+  if (size < 16 || size % 8 != 0 || memcmp(data, qr_data_magic, sizeof(qr_data_magic)) != 0)
+    return NULL;
+  const uint64_t words = size / 8;
+  const uint64_t count = data[1];
+  if (count > (words - 2) / QR_ENTRY_SIZE)
+    return NULL;
+
+  QrTable* table = malloc(sizeof(QrTable) + count * sizeof(QrRule));
+  if (table == NULL)
+    return NULL;
+  table->count = count;
+  for (size_t i = 0; i < count; ++i)
+  {
+    const int64_t* entry = data + 2 + QR_ENTRY_SIZE * i;
+    const uint64_t npoints = entry[3];
+    const uint64_t point_dim = entry[4];
+    const uint64_t second_point_dim = entry[5];
+    const uint64_t offset = entry[6];
+    // Check that the rule's points and weights are inside the file
+    if (npoints > words || point_dim > words || second_point_dim > words || offset % 8 != 0
+        || offset / 8 > words
+        || npoints > (words - offset / 8) / (point_dim + second_point_dim + 1))
+    {
+      free(table);
+      return NULL;
+    }
+    const double* numbers = (const double*)(data + offset / 8);
+    QuadratureRuleData* rule = &table->rules[i].data;
+    table->rules[i].family = entry[0];
+    rule->domain = (Domain)entry[1];
+    rule->order = entry[2];
+    rule->npoints = npoints;
+    rule->point_dim = point_dim;
+    rule->points = numbers;
+    rule->second_point_dim = second_point_dim;
+    rule->second_points = second_point_dim == 0 ? NULL : numbers + npoints * point_dim;
+    rule->weights = numbers + npoints * (point_dim + second_point_dim);
+  }
+  return table;
+}
+
+/// Get the points and weights of a rule from the data file.
+///
+/// This function can be called from any thread: if several threads build the table of rules at
+/// the same time, the first table to be stored is used and the others are freed. Returns NULL if
+/// the rule does not exist or the data file is invalid.
+static const QuadratureRuleData* qr_load(
+    int family,
+    Domain domain,
+    int order
+)
+{
+  QrTable* table = atomic_load(&qr_table);
+  if (table == NULL)
+  {
+    QrTable* expected = NULL;
+    table = qr_build_table();
+    if (table == NULL)
+      return NULL;
+    if (!atomic_compare_exchange_strong(&qr_table, &expected, table))
+    {
+      free(table);
+      table = expected;
+    }
+  }
+  for (size_t i = 0; i < table->count; ++i)
+    if (table->rules[i].family == family && table->rules[i].data.domain == domain
+        && table->rules[i].data.order == order)
+      return &table->rules[i].data;
+  return NULL;
+}
+
+#endif // QUADRATURERULES_DATA_C
@@ -0,0 +1,88 @@
+#include "data.h"
+
+#include <bit>
+#include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <tuple>
+#include <vector>
+
+/// The data file used if the environment variable QUADRATURERULES_DATA is not set.
+#ifndef QUADRATURERULES_DATA_FILE
+#define QUADRATURERULES_DATA_FILE "rules.bin"
+#endif
+
+static_assert(std::endian::native == std::endian::little,
+              "The binary data file can only be read on little-endian platforms");
+
+namespace {
+
+constexpr char magic[8] = {'Q', 'R', 'U', 'L', 'E', 'S', 0, 1};
+constexpr std::size_t entry_size = 7;
+
+/// The contents of the binary data file.
+struct Data
+{
+  /// The numbers in the file, stored as doubles so that they are aligned
+  std::vector<double> numbers;
+  std::map<std::tuple<int, int, std::size_t>, quadraturerules::data::Rule> rules;
+};
+
+/// Read the binary data file.
+Data read()
+{
+  const char* filename = std::getenv("QUADRATURERULES_DATA");
+  if (filename == nullptr || filename[0] == '\0')
+    filename = QUADRATURERULES_DATA_FILE;
+  std::ifstream f(filename, std::ios::binary | std::ios::ate);
+  if (!f)
+    throw std::runtime_error(std::string("Cannot open data file: ") + filename);
+  const std::size_t size = f.tellg();
+  f.seekg(0);
+
+  Data data;
+  data.numbers.resize(size / sizeof(double));
+  char* bytes = reinterpret_cast<char*>(data.numbers.data());
+  if (size < 16 || size % sizeof(double) != 0
+      || !f.read(bytes, size) || std::memcmp(bytes, magic, sizeof(magic)) != 0)
+    throw std::runtime_error(std::string("Invalid data file: ") + filename);
+
+  auto integer = [&](std::size_t position) {
+    std::int64_t i;
+    std::memcpy(&i, bytes + sizeof(magic) + 8 * position, 8);
+    return static_cast<std::size_t>(i);
+  };
+  for (std::size_t i = 0; i < integer(0); ++i)
+  {
+    const std::size_t entry = 1 + entry_size * i;
+    const std::size_t npoints = integer(entry + 3);
+    const std::size_t point_dim = integer(entry + 4);
+    const std::size_t second_point_dim = integer(entry + 5);
+    const double* numbers = data.numbers.data() + integer(entry + 6) / sizeof(double);
+    data.rules[{static_cast<int>(integer(entry)), static_cast<int>(integer(entry + 1)),
+                integer(entry + 2)}]
+        = {{numbers, npoints * point_dim},
+           {numbers + npoints * point_dim, npoints * second_point_dim},
+           {numbers + npoints * (point_dim + second_point_dim), npoints}};
+  }
+  return data;
+}
+
+} // namespace
+
+const quadraturerules::data::Rule& quadraturerules::data::load(
+    int family,
+    Domain domain,
+    std::size_t order
+)
+{
+  static const Data data = read();
+  auto rule = data.rules.find({family, static_cast<int>(domain), order});
+  if (rule == data.rules.end())
+    throw std::runtime_error("Invalid order");
+  return rule->second;
+}
@@ -0,0 +1,30 @@
+/// Loading points and weights from the binary data file
+
+#pragma once
+
+#include <span>
+#include "quadraturerules.h"
+
+namespace quadraturerules::data {
+
+/// The points and weights of a quadrature rule in the binary data file.
+///
+/// The second points are empty for rules for single integrals.
+struct Rule
+{
+  std::span<const double> points;
+  std::span<const double> second_points;
+  std::span<const double> weights;
+};
+
+/// Get the points and weights of a rule from the binary data file.
+///
+/// The data file is read the first time this function is called. The file given by the
+/// environment variable QUADRATURERULES_DATA is used if it is set.
+const Rule& load(
+    int family,
+    Domain domain,
+    std::size_t order
+);
+
+} // namespace quadraturerules::data
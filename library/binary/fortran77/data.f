@@ -0,0 +1,77 @@
+c Finds a quadrature rule in the binary data file
+c
+c The data file is opened on unit 41 the first time a rule is used.
+c The file given by the environment variable QUADRATURERULES_DATA is
+c used if it is set, otherwise the file rules.bin in the current
+c directory is used. The numbers in the file are little-endian, so the
+c file can only be read on little-endian platforms.
+c
+c pos is set to the position of the rule's data in the file, or to 0 if
+c the rule does not exist. npts, d1 and d2 are set to the number of
+c points and the dimensions of the points and second points.
+      SUBROUTINE qrfind(rtype, dtype, order, pos, npts, d1, d2)
+      INTEGER rtype
+      INTEGER dtype
+      INTEGER order
+      INTEGER*8 pos
+      INTEGER npts
+      INTEGER d1
+      INTEGER d2
+      INTEGER*8 count
+      INTEGER*8 entry
+      DIMENSION entry(0:6)
+      INTEGER*8 i
+      INTEGER length
+      INTEGER status
+      LOGICAL op
+      CHARACTER*8 magic
+      CHARACTER*4096 fname
+
+      pos = 0
+      INQUIRE (UNIT=41, OPENED=op)
+      IF (.NOT. op) THEN
+      CALL GET_ENVIRONMENT_VARIABLE("QUADRATURERULES_DATA", fname,
+     & length, status)
+      IF (status .NE. 0 .OR. length .EQ. 0) THEN
+      fname = "rules.bin"
+      END IF
+      OPEN (UNIT=41, FILE=fname, ACCESS="STREAM", FORM="UNFORMATTED",
+     & STATUS="OLD", ACTION="READ")
+      READ (41, POS=1) magic
+      IF (magic .NE. "QRULES" // CHAR(0) // CHAR(1)) THEN
+      STOP "Invalid data file"
+      END IF
+      END IF
+
+      READ (41, POS=9) count
+      DO i = 0, count - 1
+      READ (41, POS=17 + 56 * i) entry
+      IF (entry(0) .EQ. rtype .AND. entry(1) .EQ. dtype
+     & .AND. entry(2) .EQ. order) THEN
+      npts = INT(entry(3))
+      d1 = INT(entry(4))
+      d2 = INT(entry(5))
+      pos = entry(6) + 1
+      RETURN
+      END IF
+      END DO
+      END
+
+c Reads n columns of d numbers from the binary data file into a
+c
+c The numbers are read from the position pos in the file.
+      SUBROUTINE qrrows(pos, a, adim, na, d, n)
+      INTEGER*8 pos
+      INTEGER adim
+      INTEGER na
+      DOUBLE PRECISION a
+      DIMENSION a(0:adim, 0:na)
+      INTEGER d
+      INTEGER n
+      INTEGER i
+      INTEGER j
+
+      DO j = 0, n - 1
+      READ (41, POS=pos + 8 * d * j) (a(i, j), i = 0, d - 1)
+      END DO
+      END
@@ -0,0 +1,81 @@
+module quadraturerules_data
+  implicit none
+  private
+  public qr_load
+
+  ! The index of the data file: seven integers for each rule
+  integer(kind=8), allocatable :: qr_index(:,:)
+  ! Every number in the data file
+  real(kind=8), allocatable, target :: qr_numbers(:)
+
+contains
+
+  ! Read the data file the first time it is used
+  !
+  ! The file given by the environment variable QUADRATURERULES_DATA is read if it is set,
+  ! otherwise the file rules.bin in the current directory is read. The numbers in the file are
+  ! little-endian, so the file can only be read on little-endian platforms.
+  subroutine qr_read()
+    implicit none
+    character(len=8) :: magic
+    character(len=:), allocatable :: filename
+    integer :: unit, length, status
+    integer(kind=8) :: count, nbytes
+
+    if (allocated(qr_numbers)) return
+    call get_environment_variable("QUADRATURERULES_DATA", length=length, status=status)
+    if (status == 0 .and. length > 0) then
+      allocate(character(len=length) :: filename)
+      call get_environment_variable("QUADRATURERULES_DATA", filename)
+    else
+      filename = "rules.bin"
+    end if
+
+    open(newunit=unit, file=filename, access="stream", form="unformatted", status="old", &
+         action="read")
+    inquire(unit=unit, size=nbytes)
+    read(unit) magic, count
+    if (magic /= "QRULES" // achar(0) // achar(1)) then
+      error stop "Invalid data file"
+    end if
+    allocate(qr_index(0:6, 0:count-1))
+    read(unit) qr_index
+    allocate(qr_numbers(0:nbytes/8-1))
+    read(unit, pos=1) qr_numbers
+    close(unit)
+  end subroutine
+
+  ! Get pointers to the points and weights of a rule in the data file
+  !
+  ! The pointers are not associated if the rule does not exist. For rules for single integrals,
+  ! second_points has size 0.
+  subroutine qr_load(family, domain, order, points, second_points, weights)
+    implicit none
+    integer, value :: family
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), pointer, intent(out) :: points(:,:)
+    real(kind=8), pointer, intent(out) :: second_points(:,:)
+    real(kind=8), pointer, intent(out) :: weights(:)
+    integer(kind=8) :: i, npoints, point_dim, second_point_dim, start
+
+    call qr_read()
+    nullify(points, second_points, weights)
+    do i = 0, size(qr_index, 2) - 1
+      if (qr_index(0, i) == family .and. qr_index(1, i) == domain .and. qr_index(2, i) == order) then
+        npoints = qr_index(3, i)
+        point_dim = qr_index(4, i)
+        second_point_dim = qr_index(5, i)
+        start = qr_index(6, i) / 8
+        points(0:point_dim-1,0:npoints-1) => qr_numbers(start:start+point_dim*npoints-1)
+        start = start + point_dim * npoints
+        second_points(0:second_point_dim-1,0:npoints-1) => &
+          qr_numbers(start:start+second_point_dim*npoints-1)
+        start = start + second_point_dim * npoints
+        weights(0:npoints-1) => qr_numbers(start:start+npoints-1)
+        return
+      end if
+    end do
+  end subroutine
+
+end module quadraturerules_data
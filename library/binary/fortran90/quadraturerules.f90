@@ -0,0 +1,132 @@
+include "data.f90"
+{{for Q in rules}}
+include "{{Q.snake_case_name}}.f90"
+{{end for}}
+
+module quadraturerules
+  implicit none
+
+  public single_integral_quadrature
+  public double_integral_quadrature
+  public single_integral_quadrature_pointer
+  public double_integral_quadrature_pointer
+  {{for D in domains}}
+  public QR_{{D.PascalCaseName}}
+  {{end for}}
+  {{for R in rules}}
+  public QR_{{R.PascalCaseName}}
+  {{end for}}
+  enum, bind(C)
+    {{for D in domains}}
+    enumerator :: QR_{{D.PascalCaseName}} = {{D.index}}
+    {{end for}}
+  end enum
+  enum, bind(C)
+    {{for R in rules}}
+    enumerator :: QR_{{R.PascalCaseName}} = {{R.index}}
+    {{end for}}
+  end enum
+
+contains
+
+  subroutine single_integral_quadrature(rtype, domain, order, points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == single}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), allocatable, intent(out) :: points(:,:)
+    real(kind=8), allocatable, intent(out) :: weights(:)
+
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == single}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}(order, points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
+  subroutine double_integral_quadrature(rtype, domain, order, first_points, second_points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == double}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), allocatable, intent(out) :: first_points(:,:)
+    real(kind=8), allocatable, intent(out) :: second_points(:,:)
+    real(kind=8), allocatable, intent(out) :: weights(:)
+
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == double}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}(order, first_points, second_points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
+  subroutine single_integral_quadrature_pointer(rtype, domain, order, points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == single}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), pointer, intent(out) :: points(:,:)
+    real(kind=8), pointer, intent(out) :: weights(:)
+
+    nullify(points, weights)
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == single}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}_pointer(order, points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
+  subroutine double_integral_quadrature_pointer(rtype, domain, order, first_points, second_points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == double}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), pointer, intent(out) :: first_points(:,:)
+    real(kind=8), pointer, intent(out) :: second_points(:,:)
+    real(kind=8), pointer, intent(out) :: weights(:)
+
+    nullify(first_points, second_points, weights)
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == double}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}_pointer(order, first_points, second_points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
+end module quadraturerules
@@ -0,0 +1,47 @@
+using Mmap
+
+"The data file used if the environment variable QUADRATURERULES_DATA is not set."
+const data_file = joinpath(@__DIR__, "rules.bin")
+const data_magic = codeunits("QRULES\0\x01")
+
+"The numbers in the data file and the position of each rule in it, read the first time a rule is used."
+const rule_data = Ref{Union{Nothing, Tuple{Vector{Float64}, Dict{NTuple{3, Int}, NTuple{4, Int}}}}}(nothing)
+
+"Read the data file. The numbers in the file are little-endian, so it can only be read on little-endian platforms."
+function read_rule_data()
+    ENDIAN_BOM == 0x04030201 || throw("The data file can only be read on little-endian platforms")
+    filename = get(ENV, "QUADRATURERULES_DATA", "")
+    isempty(filename) && (filename = data_file)
+    numbers = open(filename) do f
+        Mmap.mmap(f, Vector{Float64}, (filesize(f) ÷ 8,))
+    end
+    length(numbers) >= 2 && reinterpret(UInt8, numbers)[1:8] == data_magic || throw("Invalid data file: $filename")
+    integers = reinterpret(Int64, numbers)
+    index = Dict{NTuple{3, Int}, NTuple{4, Int}}()
+    for i in 0:integers[2] - 1
+        family, domain, order, npoints, point_dim, second_point_dim, offset = integers[3 + 7i:9 + 7i]
+        index[(family, domain, order)] = (npoints, point_dim, second_point_dim, offset ÷ 8)
+    end
+    return numbers, index
+end
+
+"Get views of the points, second points and weights of a rule in the data file. The second points are empty for rules for single integrals."
+function load_rule(
+    family::Integer,
+    domain::Domain,
+    order::Integer,
+)
+    if rule_data[] === nothing
+        rule_data[] = read_rule_data()
+    end
+    numbers, index = rule_data[]
+    entry = get(index, (Int(family), Int(domain), Int(order)), nothing)
+    entry === nothing && throw("Invalid domain or order: ($domain, $order)")
+    npoints, point_dim, second_point_dim, start = entry
+    points = reshape(view(numbers, start + 1:start + point_dim * npoints), point_dim, npoints)
+    start += point_dim * npoints
+    second_points = reshape(view(numbers, start + 1:start + second_point_dim * npoints), second_point_dim, npoints)
+    start += second_point_dim * npoints
+    weights = view(numbers, start + 1:start + npoints)
+    return points, second_points, weights
+end
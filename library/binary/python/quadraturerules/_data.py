@@ -0,0 +1,71 @@
+"""Loading points and weights from the binary data file."""
+
+import functools as _functools
+import os as _os
+import typing as _typing
+
+import numpy as _np
+import numpy.typing as _npt
+
+_magic = b"QRULES\x00\x01"
+_entry = _np.dtype(
+    [
+        (name, "<i8")
+        for name in [
+            "family",
+            "domain",
+            "order",
+            "npoints",
+            "point_dim",
+            "second_point_dim",
+            "offset",
+        ]
+    ]
+)
+_file = _os.path.join(_os.path.dirname(_os.path.realpath(__file__)), "rules.bin")
+
+
+@_functools.cache
+def _index() -> _typing.Dict[_typing.Tuple[int, int, int], _typing.Tuple[int, int, int, int]]:
+    """Read the index of the binary data file."""
+    data = _np.memmap(_file, dtype=_np.uint8, mode="r")
+    if bytes(data[: len(_magic)]) != _magic:
+        raise ValueError(f"Invalid data file: {_file}")
+    count = int(data[len(_magic) : len(_magic) + 8].view("<i8")[0])
+    start = len(_magic) + 8
+    entries = _np.frombuffer(data, dtype=_entry, count=count, offset=start)
+    return {
+        (int(e["family"]), int(e["domain"]), int(e["order"])): (
+            int(e["npoints"]),
+            int(e["point_dim"]),
+            int(e["second_point_dim"]),
+            int(e["offset"]),
+        )
+        for e in entries
+    }
+
+
+def load(family: int, domain: int, order: int) -> _typing.List[_npt.NDArray[_np.float64]]:
+    """Load the points and weights of a rule.
+
+    Args:
+        family: The index of the rule family
+        domain: The index of the domain
+        order: The order of the rule
+
+    Returns:
+        The points (or first points and second points) and weights of the rule
+    """
+    try:
+        npoints, point_dim, second_point_dim, offset = _index()[(family, domain, order)]
+    except KeyError:
+        raise ValueError(f"Invalid order: {order}")
+    shapes = [(npoints, point_dim), (npoints, second_point_dim), (npoints,)]
+    if second_point_dim == 0:
+        shapes.pop(1)
+    arrays = []
+    for shape in shapes:
+        a = _np.memmap(_file, dtype="<f8", mode="r", offset=offset, shape=shape)
+        arrays.append(_np.array(a, dtype=_np.float64))
+        offset += a.nbytes
+    return arrays
@@ -0,0 +1,10 @@
+//! Definitions of quadrature rules.
+mod data;
+
+{{for Q in rules}}
+mod {{Q.snake_case_name}};
+
+{{end for}}
+{{for Q in rules}}
+pub use {{Q.snake_case_name}}::{{{Q.snake_case_name}}, {{Q.snake_case_name}}_slices};
+{{end for}}
@@ -0,0 +1,57 @@
+//! Points and weights of quadrature rules, read from the binary data file.
+
+use crate::Domain;
+
+#[cfg(not(target_endian = "little"))]
+compile_error!("The binary data file can only be read on little-endian targets");
+
+/// Bytes aligned so that they can be read as f64.
+#[repr(C, align(8))]
+struct Aligned<T: ?Sized>(T);
+
+static DATA: &Aligned<[u8]> = &Aligned(*include_bytes!("rules.bin"));
+
+const MAGIC: &[u8] = b"QRULES\x00\x01";
+const ENTRY_SIZE: usize = 7;
+
+/// Read the integer at a position in the data file.
+fn integer(position: usize) -> usize {
+    let start = MAGIC.len() + 8 * position;
+    i64::from_le_bytes(DATA.0[start..start + 8].try_into().unwrap()) as usize
+}
+
+/// Get a slice of numbers in the data file.
+fn numbers(offset: usize, len: usize) -> &'static [f64] {
+    let bytes = &DATA.0[offset..offset + 8 * len];
+    // SAFETY: The data is aligned to 8 bytes, every offset is a multiple of 8, and the numbers
+    // are stored as little-endian f64.
+    unsafe { std::slice::from_raw_parts(bytes.as_ptr() as *const f64, len) }
+}
+
+/// Get the points, second points and weights of a rule.
+///
+/// The second points will be empty for rules for single integrals.
+pub fn load(
+    family: usize,
+    domain: Domain,
+    order: usize,
+) -> Result<(&'static [f64], &'static [f64], &'static [f64]), &'static str> {
+    assert_eq!(&DATA.0[..MAGIC.len()], MAGIC);
+    for i in 0..integer(0) {
+        let entry = 1 + ENTRY_SIZE * i;
+        if integer(entry) == family && integer(entry + 1) == domain as usize && integer(entry + 2) == order {
+            let npoints = integer(entry + 3);
+            let point_dim = integer(entry + 4);
+            let second_point_dim = integer(entry + 5);
+            let offset = integer(entry + 6);
+            let second_offset = offset + 8 * npoints * point_dim;
+            let weights_offset = second_offset + 8 * npoints * second_point_dim;
+            return Ok((
+                numbers(offset, npoints * point_dim),
+                numbers(second_offset, npoints * second_point_dim),
+                numbers(weights_offset, npoints),
+            ));
+        }
+    }
+    Err("Invalid quadrature order")
+}
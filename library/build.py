@@ -1,13 +1,12 @@
 """Build library."""
 
 import argparse
+import json
 import os
-import re
-import typing
 from datetime import datetime
 
-import generate
-from qrtools import generate_qr, rules, settings
+from qrtools import profiling, settings
+from qrtools.libraries import build_libraries, libraries
 from webtools.tools import join
 
 start_all = datetime.now()
@@ -15,73 +14,66 @@ path = os.path.dirname(os.path.realpath(__file__))
 settings.set_root_path(join(path, ".."))
 
 parser = argparse.ArgumentParser(description="Build quadraturerules library")
-parser.add_argument("library", metavar="library", nargs=1, default=None, help="Library to build")
+parser.add_argument(
+    "library",
+    metavar="library",
+    nargs="+",
+    help="Libraries to build, or 'all' to build every library",
+)
+parser.add_argument(
+    "--data",
+    default="source",
+    choices=["source", "binary"],
+    help="Store the points and weights as numbers in the source code or in a binary data file",
+)
+parser.add_argument(
+    "--processes",
+    metavar="processes",
+    default=None,
+    type=int,
+    help="The number of processes to use when building more than one library "
+    "(default: number of CPUs).",
+)
+parser.add_argument(
+    "--clean",
+    action="store_true",
+    help="Delete each library before building it instead of only updating the files that changed.",
+)
+parser.add_argument(
+    "--timing-report",
+    metavar="timing_report",
+    default=None,
+    help="Write a JSON report of the time taken to build each library and file.",
+)
+parser.add_argument(
+    "--profile",
+    metavar="profile",
+    default=None,
+    help="Record the time taken by each stage of the build and write it to this file.",
+)
+parser.add_argument(
+    "--profile-format",
+    default="json",
+    choices=["json", "chrome"],
+    help="The format of the profile: a JSON summary of each stage, or a Chrome trace.",
+)
 
 args = parser.parse_args()
-lib = args.library[0]
-
-assert lib in os.listdir(path)
-
-source_dir = join(path, lib)
-assert os.path.isdir(source_dir)
-target_dir = join(path, f"{lib}.build")
-if os.path.isdir(target_dir):
-    os.system(f"rm -r {target_dir}")
-
-os.mkdir(target_dir)
+if args.profile is not None:
+    profiling.enable()
+libs = libraries() if args.library == ["all"] else args.library
+for lib in libs:
+    assert lib in libraries()
+processes = args.processes if args.processes is not None else (os.cpu_count() or 1)
 
-with open(join(path, "..", "VERSION")) as f:
-    version = f.read().strip()
-with open(join(path, "..", "LICENSE")) as f:
-    license = "\n".join(f.read().split("\n")[2:])
-with open(join(path, "..", "README.md")) as f:
-    readme = f.read()
-readme = re.sub(r"\(website/pages/([^\)]+)\.md\)", r"(https://quadraturerules.org/\1.html)", readme)
+report = build_libraries(libs, args.data, processes, args.clean)
 
-all_rules = []
-for file in os.listdir(settings.rules_path):
-    if file.endswith(".qr"):
-        all_rules.append(rules.load_rule(file[:-3]))
-all_rules.sort(key=lambda r: r.name())
-
-domains = list(set(i.domain for r in all_rules for i in r.rules))
-domains.sort(key=lambda d: (rules.dim(d), rules.sort_name(d)))
-
-
-def load_library_file(m):
-    """Load the content of a files in website/pages/libraries/."""
-    with open(join(path, "..", "website", "pages", "libraries", f"{m[1]}.md")) as f:
-        return "#" + f.read()
-
-
-loop_targets: typing.Dict[str, typing.List[generate.substitute.Substitutor]] = {
-    "rules": [generate_qr.RuleFamily(r) for r in all_rules],
-    "domains": [generate_qr.Domain(d, i) for i, d in enumerate(domains)],
-}
-
-
-def extra_subs(content):
-    """Make substitutions in a file."""
-    content = content.replace("{{VERSION}}", version)
-    content = content.replace("{{LICENSE}}", license)
-    content = content.replace("{{README}}", readme)
-    content = re.sub(r"{{website/pages/libraries/([^}]+)}}", load_library_file, content)
-    return content
-
-
-generate.folder.generate(
-    source_dir,
-    target_dir,
-    loop_targets=loop_targets,
-    extra_subs=extra_subs,
-    print_timing=True,
-)
+if args.timing_report is not None:
+    with open(args.timing_report, "w") as f:
+        json.dump(report, f, indent=2)
 
-# Linting
-if lib == "python":
-    os.system(f"cd {target_dir} && ruff format .")
-if lib == "rust":
-    os.system(f"cd {target_dir} && cargo fmt")
+if args.profile is not None:
+    profiling.write_profile(args.profile, args.profile_format)
 
 end_all = datetime.now()
 print(f"Total time: {(end_all - start_all).total_seconds():.2f}s")
@@ -1,4 +1,5 @@
 #include "quadraturerules.h"
+
 {{for Q in rules}}
 #include "{{Q.snake_case_name}}.c"
 {{end for}}
@@ -48,6 +49,44 @@ int double_integral_quadrature(
   }
 }
 
+const QuadratureRuleData* single_integral_quadrature_data(
+    QuadratureRule rtype,
+    Domain domain,
+    int order
+)
+{
+  switch (rtype)
+  {
+  {{for Q in rules}}
+  {{if Q.itype == single}}
+  case QR_{{Q.PascalCaseName}}:
+    return {{Q.snake_case_name}}_data(domain, order);
+  {{end if}}
+  {{end for}}
+  default:
+    return NULL;
+  }
+}
+
+const QuadratureRuleData* double_integral_quadrature_data(
+    QuadratureRule rtype,
+    Domain domain,
+    int order
+)
+{
+  switch (rtype)
+  {
+  {{for Q in rules}}
+  {{if Q.itype == double}}
+  case QR_{{Q.PascalCaseName}}:
+    return {{Q.snake_case_name}}_data(domain, order);
+  {{end if}}
+  {{end for}}
+  default:
+    return NULL;
+  }
+}
+
 int single_integral_quadrature_points_size(
     QuadratureRule rtype,
     Domain domain,
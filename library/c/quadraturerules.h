@@ -2,6 +2,8 @@
 
 #define QUADRATURERULES_H
 
+#include <stddef.h>
+
 /// A domain of an integral.
 typedef enum
 {
@@ -18,6 +20,42 @@ typedef enum
   {{end for}}
 } QuadratureRule;
 
+/// The points and weights of a quadrature rule.
+///
+/// The points are stored as a flattened array of npoints points, each with
+/// point_dim barycentric coordinates. For rules for a double integral, points
+/// are the points for the first integral and second_points are the points for
+/// the second integral; for rules for a single integral, second_points is NULL.
+typedef struct
+{
+  Domain domain;
+  int order;
+  int npoints;
+  int point_dim;
+  const double* points;
+  int second_point_dim;
+  const double* second_points;
+  const double* weights;
+} QuadratureRuleData;
+
+/// Get a quadrature rule for a single integral without copying its points and weights.
+///
+/// Returns NULL if the rule does not exist.
+extern const QuadratureRuleData* single_integral_quadrature_data(
+    QuadratureRule rtype,
+    Domain domain,
+    int order
+);
+
+/// Get a quadrature rule for a double integral without copying its points and weights.
+///
+/// Returns NULL if the rule does not exist.
+extern const QuadratureRuleData* double_integral_quadrature_data(
+    QuadratureRule rtype,
+    Domain domain,
+    int order
+);
+
 /// Get a quadrature rule for a single integral.
 extern int single_integral_quadrature(
     QuadratureRule rtype,
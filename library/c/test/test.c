@@ -18,5 +18,18 @@ int main()
 
     assert(fabs(1.0 - sum) < 1e-8);
 
+    const QuadratureRuleData* data = single_integral_quadrature_data(QR_GaussLegendre, QR_Interval, 3);
+    assert(data != NULL);
+    assert(data->npoints == wts_size);
+    assert(data->npoints * data->point_dim == pts_size);
+    assert(data->second_points == NULL);
+    for (int i=0; i<pts_size; ++i)
+      assert(data->points[i] == pts[i]);
+    for (int i=0; i<wts_size; ++i)
+      assert(data->weights[i] == wts[i]);
+
+    assert(single_integral_quadrature_data(QR_GaussLegendre, QR_Interval, 1000) == NULL);
+    assert(double_integral_quadrature_data(QR_GaussLegendre, QR_Interval, 3) == NULL);
+
     return 0;
 }
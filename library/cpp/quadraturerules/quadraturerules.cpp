@@ -47,3 +47,43 @@ quadraturerules::double_integral_quadrature(
     throw std::runtime_error("Unsupported rule for double integral");
   }
 }
+
+std::pair<std::span<const double>, std::span<const double>>
+quadraturerules::single_integral_quadrature_span(
+    QuadratureRule rtype,
+    Domain domain,
+    std::size_t order
+)
+{
+  switch (rtype)
+  {
+  {{for Q in rules}}
+  {{if Q.itype == single}}
+  case QuadratureRule::{{Q.PascalCaseName}}:
+    return {{Q.snake_case_name}}_span(domain, order);
+  {{end if}}
+  {{end for}}
+  default:
+    throw std::runtime_error("Unsupported rule for single integral");
+  }
+}
+
+std::tuple<std::span<const double>, std::span<const double>, std::span<const double>>
+quadraturerules::double_integral_quadrature_span(
+    QuadratureRule rtype,
+    Domain domain,
+    std::size_t order
+)
+{
+  switch (rtype)
+  {
+  {{for Q in rules}}
+  {{if Q.itype == double}}
+  case QuadratureRule::{{Q.PascalCaseName}}:
+    return {{Q.snake_case_name}}_span(domain, order);
+  {{end if}}
+  {{end for}}
+  default:
+    throw std::runtime_error("Unsupported rule for double integral");
+  }
+}
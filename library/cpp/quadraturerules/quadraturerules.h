@@ -2,6 +2,7 @@
 
 #pragma once
 
+#include <span>
 #include <tuple>
 #include <utility>
 #include <vector>
@@ -40,4 +41,20 @@ double_integral_quadrature(
     std::size_t order
 );
 
+/// Get views of the points and weights of a quadrature rule for a single integral.
+std::pair<std::span<const double>, std::span<const double>>
+single_integral_quadrature_span(
+    QuadratureRule rtype,
+    Domain domain,
+    std::size_t order
+);
+
+/// Get views of the points and weights of a quadrature rule for a double integral.
+std::tuple<std::span<const double>, std::span<const double>, std::span<const double>>
+double_integral_quadrature_span(
+    QuadratureRule rtype,
+    Domain domain,
+    std::size_t order
+);
+
 } // namespace quadraturerules
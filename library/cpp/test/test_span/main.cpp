@@ -0,0 +1,33 @@
+#include <quadraturerules/quadraturerules.h>
+#include <quadraturerules/gauss_legendre.h>
+#include <cassert>
+
+using namespace quadraturerules;
+
+constexpr double sum_weights(std::size_t order)
+{
+  auto [pts, wts] = gauss_legendre_span(Domain::Interval, order);
+  double sum = 0.0;
+  for (std::size_t i = 0; i < wts.size(); ++i)
+    sum += wts[i];
+  return sum;
+}
+
+static_assert(gauss_legendre_span(Domain::Interval, 3).second.size() == 3);
+static_assert(sum_weights(3) > 1.0 - 1e-7 && sum_weights(3) < 1.0 + 1e-7);
+
+int main() {
+  for (std::size_t order = 1; order <= 5; ++order)
+  {
+    auto [pts, wts] = single_integral_quadrature(
+        QuadratureRule::GaussLegendre, Domain::Interval, order);
+    auto [pts_span, wts_span] = single_integral_quadrature_span(
+        QuadratureRule::GaussLegendre, Domain::Interval, order);
+    assert(pts.size() == pts_span.size());
+    assert(wts.size() == wts_span.size());
+    for (std::size_t i = 0; i < pts.size(); ++i)
+      assert(pts[i] == pts_span[i]);
+    for (std::size_t i = 0; i < wts.size(); ++i)
+      assert(wts[i] == wts_span[i]);
+  }
+}
@@ -1,5 +1,6 @@
 #include <quadraturerules/quadraturerules.h>
 #include <cassert>
+#include <cmath>
 
 using namespace quadraturerules;
 
@@ -11,6 +12,6 @@ int main() {
     double sum = 0.0;
     for (std::size_t i = 0; i < wts.size(); ++i)
       sum += wts[i];
-    assert(abs(sum - 1.0) < 1e-7);
+    assert(std::abs(sum - 1.0) < 1e-7);
   }
 }
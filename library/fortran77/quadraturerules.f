@@ -21,9 +21,9 @@ c   {{D.index}} = {{D.name}}
       INTEGER order
       INTEGER ptdim
       INTEGER npts
-      REAL pts
+      DOUBLE PRECISION pts
       DIMENSION pts(0:ptdim, 0:npts)
-      REAL wts
+      DOUBLE PRECISION wts
       DIMENSION wts(0:npts)
 
       {{for Q in rules}}
@@ -55,16 +55,16 @@ c   {{D.index}} = {{D.name}}
       INTEGER p1d
       INTEGER p2d
       INTEGER npts
-      REAL p1
+      DOUBLE PRECISION p1
       DIMENSION p1(0:p1d, 0:npts)
-      REAL p2
+      DOUBLE PRECISION p2
       DIMENSION p2(0:p2d, 0:npts)
-      REAL wts
+      DOUBLE PRECISION wts
       DIMENSION wts(0:npts)
 
       {{for Q in rules}}
       {{if Q.itype == double}}
-      IF (rtype == {{Q.index}}) THEN
+      IF (rt == {{Q.index}}) THEN
       CALL {{Q.abbrv_name}}(dt, order, p1, p2, wts, npts, p1d, p2d)
       END IF
       {{end if}}
@@ -1,7 +1,8 @@
       INCLUDE "quadraturerules.f"
 
       PROGRAM test
-      REAL p,w
+      DOUBLE PRECISION p,w
+      DOUBLE PRECISION sumto
       DIMENSION p(0:2, 0:5)
       DIMENSION w(0:5)
 
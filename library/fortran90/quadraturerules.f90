@@ -7,6 +7,8 @@ module quadraturerules
 
   public single_integral_quadrature
   public double_integral_quadrature
+  public single_integral_quadrature_pointer
+  public double_integral_quadrature_pointer
   {{for D in domains}}
   public QR_{{D.PascalCaseName}}
   {{end for}}
@@ -36,8 +38,8 @@ contains
     integer, value :: rtype
     integer, value :: domain
     integer, value :: order
-    real, allocatable, intent(out) :: points(:,:)
-    real, allocatable, intent(out) :: weights(:)
+    real(kind=8), allocatable, intent(out) :: points(:,:)
+    real(kind=8), allocatable, intent(out) :: weights(:)
 
     {{for Q in rules}}
     {{for D in domains}}
@@ -60,9 +62,9 @@ contains
     integer, value :: rtype
     integer, value :: domain
     integer, value :: order
-    real, allocatable, intent(out) :: first_points(:,:)
-    real, allocatable, intent(out) :: second_points(:,:)
-    real, allocatable, intent(out) :: weights(:)
+    real(kind=8), allocatable, intent(out) :: first_points(:,:)
+    real(kind=8), allocatable, intent(out) :: second_points(:,:)
+    real(kind=8), allocatable, intent(out) :: weights(:)
 
     {{for Q in rules}}
     {{for D in domains}}
@@ -75,4 +77,55 @@ contains
     {{end for}}
   end subroutine
 
+  subroutine single_integral_quadrature_pointer(rtype, domain, order, points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == single}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), pointer, intent(out) :: points(:,:)
+    real(kind=8), pointer, intent(out) :: weights(:)
+
+    nullify(points, weights)
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == single}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}_pointer(order, points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
+  subroutine double_integral_quadrature_pointer(rtype, domain, order, first_points, second_points, weights)
+    {{for Q in rules}}
+    {{if Q.itype == double}}
+    use {{Q.snake_case_name}}
+    {{end if}}
+    {{end for}}
+    implicit none
+    integer, value :: rtype
+    integer, value :: domain
+    integer, value :: order
+    real(kind=8), pointer, intent(out) :: first_points(:,:)
+    real(kind=8), pointer, intent(out) :: second_points(:,:)
+    real(kind=8), pointer, intent(out) :: weights(:)
+
+    nullify(first_points, second_points, weights)
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{if Q.itype == double}}
+    if (rtype == QR_{{Q.PascalCaseName}} .and. domain == QR_{{D.PascalCaseName}}) then
+      call {{Q.abbrv_name}}_{{D.abbrv_name}}_pointer(order, first_points, second_points, weights)
+    end if
+    {{end if}}
+    {{end for}}
+    {{end for}}
+  end subroutine
+
 end module quadraturerules
@@ -2,7 +2,10 @@ include "quadraturerules.f90"
 
 program test
   use quadraturerules
-  real, allocatable :: points(:,:), weights(:)
+  real(kind=8), allocatable :: points(:,:), weights(:)
+  real(kind=8), pointer :: points_pointer(:,:), weights_pointer(:)
+  real(kind=8) :: sum
+  integer :: i
 
   call single_integral_quadrature(QR_GaussLegendre, QR_Interval, 5, points, weights)
 
@@ -11,7 +14,15 @@ program test
     sum = sum + weights(i)
   end do
 
-  if (abs(1 - sum) < 1e-8) then
+  if (abs(1 - sum) < 1e-14) then
+    print *, "Test passed"
+  else
+    print *, "Test failed"
+  end if
+
+  call single_integral_quadrature_pointer(QR_GaussLegendre, QR_Interval, 5, points_pointer, weights_pointer)
+
+  if (all(points_pointer == points) .and. all(weights_pointer == weights)) then
     print *, "Test passed"
   else
     print *, "Test failed"
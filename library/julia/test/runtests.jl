@@ -8,4 +8,13 @@ using Test
         4
     )
     @test isapprox(sum(weights), 1.0)
+
+    points_view, weights_view = TabulatedQuadratureRules.single_integral_quadrature_view(
+        TabulatedQuadratureRules.QR_GaussLobattoLegendre,
+        TabulatedQuadratureRules.Domain_Interval,
+        4
+    )
+    @test points_view == points
+    @test weights_view == weights
+    @test size(points_view) == (2, 6)
 end
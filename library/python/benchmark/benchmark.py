@@ -0,0 +1,237 @@
+"""Benchmarks for the quadraturerules library.
+
+This script measures the time taken to import the library, the time taken to get each rule the
+first time and on repeated calls, the memory used by the library after every rule has been got,
+and the number of points per second at which a vectorised integrand can be integrated using each
+rule. The results are written as JSON so that they can be compared between releases.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from quadraturerules import (
+    Domain,
+    QuadratureRule,
+    double_integral_quadrature,
+    single_integral_quadrature,
+)
+
+Arrays = typing.Tuple[npt.NDArray[np.float64], ...]
+
+version = "{{VERSION}}"
+
+# The family, integral type, domain and order of every rule in the library
+all_rules: typing.List[typing.Tuple[QuadratureRule, str, Domain, int]] = [
+    {{for Q in rules}}
+    {{for D in domains}}
+    {{for R in Q.rules}}
+    {{if R.domain == D.name}}
+    (QuadratureRule.{{Q.PascalCaseName}}, "{{Q.itype}}", Domain.{{D.PascalCaseName}}, {{R.order}}),
+    {{end if}}
+    {{end for}}
+    {{end for}}
+    {{end for}}
+]
+
+_import_code = (
+    "import time\n"
+    "import numpy\n"
+    "start = time.perf_counter()\n"
+    "import quadraturerules\n"
+    "print(time.perf_counter() - start)\n"
+)
+_import_with_numpy_code = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import quadraturerules\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def get_rule(rtype: QuadratureRule, itype: str, domain: Domain, order: int) -> Arrays:
+    """Get the arrays of a rule."""
+    if itype == "single":
+        return single_integral_quadrature(rtype, domain, order)
+    return double_integral_quadrature(rtype, domain, order)
+
+
+def integrand(points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Evaluate a smooth integrand at every point."""
+    return np.exp(-np.sum(points**2, axis=1)) * np.cos(points[:, 0])
+
+
+def integrate(rule: Arrays) -> float:
+    """Integrate the integrand using a rule."""
+    *points, weights = rule
+    return float(weights @ integrand(np.hstack(points)))
+
+
+def time_import(repeats: int) -> typing.Dict[str, typing.Any]:
+    """Measure the time taken to import the library in a new Python process.
+
+    Args:
+        repeats: The number of times to import the library
+
+    Returns:
+        The median time taken to import the library, with and without the time taken to import
+        numpy
+    """
+    times: typing.Dict[str, typing.List[float]] = {"time": [], "time_without_numpy": []}
+    for _ in range(repeats):
+        for key, code in [("time", _import_with_numpy_code), ("time_without_numpy", _import_code)]:
+            result = subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            )
+            times[key].append(float(result.stdout))
+    return {"repeats": repeats, **{key: statistics.median(t) for key, t in times.items()}}
+
+
+def max_rss() -> int | None:
+    """Get the maximum resident set size of this process in bytes."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # The maximum resident set size is given in bytes on macOS and in kilobytes elsewhere
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure_memory(rules: typing.List[typing.Tuple[QuadratureRule, str, Domain, int]]):
+    """Print the memory used after getting every rule as JSON.
+
+    This is run in a new Python process, so that the memory used is not affected by the
+    other benchmarks. The maximum resident set size is not available on Windows.
+    """
+    after_import = max_rss()
+    loaded = [get_rule(*r) for r in rules]
+    memory = {
+        "rules": len(loaded),
+        "array_bytes": sum(a.nbytes for rule in loaded for a in rule),
+        "max_rss_after_import_bytes": after_import,
+        "max_rss_bytes": max_rss(),
+    }
+    print(json.dumps(memory))
+
+
+def time_rules(
+    rules: typing.List[typing.Tuple[QuadratureRule, str, Domain, int]], repeats: int
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Measure the time taken to get each rule and to integrate using it.
+
+    Args:
+        rules: The rules to benchmark
+        repeats: The number of times to repeat each measurement
+
+    Returns:
+        For each rule, the time taken to get it the first time, the median time taken to get it
+        on repeated calls, and the number of points per second at which the integrand is
+        integrated
+    """
+    results = []
+    for rtype, itype, domain, order in rules:
+        start = time.perf_counter()
+        rule = get_rule(rtype, itype, domain, order)
+        first_call = time.perf_counter() - start
+
+        calls = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            get_rule(rtype, itype, domain, order)
+            calls.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(repeats):
+            integrate(rule)
+        integration = time.perf_counter() - start
+
+        npoints = rule[-1].shape[0]
+        results.append(
+            {
+                "family": rtype.name,
+                "domain": domain.name,
+                "order": order,
+                "npoints": npoints,
+                "first_call": first_call,
+                "repeat_call": statistics.median(calls),
+                "integration": integration / repeats,
+                "points_per_second": npoints * repeats / integration,
+            }
+        )
+    return results
+
+
+def run(
+    families: typing.List[str] | None = None, repeats: int = 100, import_repeats: int = 5
+) -> typing.Dict[str, typing.Any]:
+    """Run the benchmarks.
+
+    Args:
+        families: The names of the rule families to benchmark (default: all families)
+        repeats: The number of times to repeat each measurement of a rule
+        import_repeats: The number of times to import the library
+
+    Returns:
+        The results of the benchmarks
+    """
+    rules = [r for r in all_rules if families is None or r[0].name in families]
+    command = [sys.executable, __file__, "--memory"]
+    if families is not None:
+        command += ["--family", *families]
+    memory = subprocess.run(command, capture_output=True, text=True, check=True)
+    results = time_rules(rules, repeats)
+    integration = sum(r["integration"] for r in results)
+    return {
+        "version": version,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "import": time_import(import_repeats),
+        "memory": json.loads(memory.stdout),
+        "rules": results,
+        "throughput": {
+            "points": sum(r["npoints"] for r in results),
+            "time": integration,
+            "points_per_second": sum(r["npoints"] for r in results) / integration,
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the quadraturerules library")
+    parser.add_argument(
+        "--family", nargs="+", default=None, help="The rule families to benchmark (default: all)"
+    )
+    parser.add_argument(
+        "--repeats", default=100, type=int, help="The number of times to repeat each measurement"
+    )
+    parser.add_argument(
+        "--import-repeats",
+        default=5,
+        type=int,
+        help="The number of times to measure the import time",
+    )
+    parser.add_argument("--output", default=None, help="The file to write the results to")
+    parser.add_argument("--memory", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.memory:
+        measure_memory(
+            [r for r in all_rules if args.family is None or r[0].name in args.family]
+        )
+    else:
+        results = run(args.family, args.repeats, args.import_repeats)
+        if args.output is None:
+            print(json.dumps(results, indent=2))
+        else:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
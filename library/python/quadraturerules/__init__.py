@@ -5,7 +5,7 @@ import typing as _typing
 import numpy.typing as _npt
 import numpy as _np
 
-from quadraturerules import rules
+from quadraturerules import _orbits, instrumentation, rules
 from quadraturerules.domain import Domain
 
 
@@ -23,6 +23,17 @@ def single_integral_quadrature(
     order: int,
 ) -> _typing.Tuple[_npt.NDArray[_np.float64], _npt.NDArray[_np.float64]]:
     """Get a quadrature rule for a single integral."""
+    if instrumentation._recordings:
+        return instrumentation.call(_single_integral_quadrature, rtype, domain, order)
+    return _single_integral_quadrature(rtype, domain, order)
+
+
+def _single_integral_quadrature(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+):
+    """Get a quadrature rule for a single integral without instrumentation."""
     match rtype:
         {{for Q in rules}}
         {{if Q.itype == single}}
@@ -34,12 +45,74 @@ def single_integral_quadrature(
             raise ValueError(f"Unsupported rule for single integral: {rtype}")
 
 
+def single_integral_orbits(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+) -> _typing.Tuple[_typing.List[str], _npt.NDArray[_np.float64], _npt.NDArray[_np.float64]]:
+    """Get the symmetry orbits of a quadrature rule for a single integral.
+
+    The symmetries of an interval, triangle or tetrahedron are the permutations of the barycentric
+    coordinates of a point. Each orbit is given by its type, the barycentric coordinates of one
+    point in the orbit (the generator) and the weight of each point in the orbit. An error is
+    raised if the points of the rule do not come in full symmetry orbits.
+    """
+    match rtype:
+        {{for Q in rules}}
+        {{if Q.itype == single}}
+        case QuadratureRule.{{Q.PascalCaseName}}:
+            return rules.{{Q.snake_case_name}}_orbits(domain, order)
+        {{end if}}
+        {{end for}}
+        case _:
+            raise ValueError(f"Unsupported rule for single integral: {rtype}")
+
+
+def symmetric_single_integral_quadrature(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+) -> _typing.Tuple[_npt.NDArray[_np.float64], _npt.NDArray[_np.float64]]:
+    """Get a quadrature rule for a single integral of a symmetric integrand.
+
+    If the integrand is invariant under every permutation of the barycentric coordinates, it takes
+    the same value at every point in an orbit. The rule returned contains one point per orbit,
+    with the weight of the orbit multiplied by the number of points in the orbit, so the integrand
+    is only evaluated once per orbit. This rule must not be used for other integrands.
+    """
+    if instrumentation._recordings:
+        return instrumentation.call(_symmetric_single_integral_quadrature, rtype, domain, order)
+    return _symmetric_single_integral_quadrature(rtype, domain, order)
+
+
+def _symmetric_single_integral_quadrature(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+):
+    """Get a rule for a single integral of a symmetric integrand without instrumentation."""
+    types, generators, weights = single_integral_orbits(rtype, domain, order)
+    sizes = _np.array([len(_orbits.permutations(t)) for t in types], dtype=_np.float64)
+    return generators, weights * sizes
+
+
 def double_integral_quadrature(
     rtype: QuadratureRule,
     domain: Domain,
     order: int,
 ) -> _typing.Tuple[_npt.NDArray[_np.float64], _npt.NDArray[_np.float64], _npt.NDArray[_np.float64]]:
     """Get a quadrature rule for a double integral."""
+    if instrumentation._recordings:
+        return instrumentation.call(_double_integral_quadrature, rtype, domain, order)
+    return _double_integral_quadrature(rtype, domain, order)
+
+
+def _double_integral_quadrature(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+):
+    """Get a quadrature rule for a double integral without instrumentation."""
     match rtype:
         {{for Q in rules}}
         {{if Q.itype == double}}
@@ -0,0 +1,66 @@
+"""Expanding rules that are stored as symmetry orbits."""
+
+import functools as _functools
+import itertools as _itertools
+import typing as _typing
+
+import numpy as _np
+import numpy.typing as _npt
+
+
+@_functools.cache
+def permutations(otype: str) -> _npt.NDArray[_np.int64]:
+    """Get the permutations that map the generator of an orbit to each point in the orbit.
+
+    Args:
+        otype: The type of the orbit: S followed by the number of times each distinct
+            coordinate of the generator is repeated
+
+    Returns:
+        For each point in the orbit (row), the index of the coordinate of the generator that
+        gives each of its coordinates
+    """
+    m = [int(i) for i in otype[1:]]
+    first = _np.cumsum([0] + m[:-1])
+    labels = [i for i, j in enumerate(m) for _ in range(j)]
+    out = _np.array(
+        [[first[i] for i in p] for p in sorted(set(_itertools.permutations(labels)))],
+        dtype=_np.int64,
+    )
+    out.flags.writeable = False
+    return out
+
+
+def expand(
+    types: _typing.List[str],
+    generators: _npt.NDArray[_np.float64],
+    weights: _npt.NDArray[_np.float64],
+    order: _typing.List[int] | None = None,
+) -> _typing.Tuple[_npt.NDArray[_np.float64], _npt.NDArray[_np.float64]]:
+    """Get the points and weights of a rule from its orbits.
+
+    The points of each orbit are computed together for every orbit of the same type.
+
+    Args:
+        types: The type of each orbit
+        generators: The barycentric coordinates of the generator of each orbit
+        weights: The weight of each point in each orbit
+        order: The position in the expanded orbits of each point of the rule, or None if the
+            points of the rule are in the order of the orbits
+
+    Returns:
+        The points, one point per row, and the weights
+    """
+    sizes = _np.array([len(permutations(t)) for t in types], dtype=_np.int64)
+    start = _np.concatenate([[0], _np.cumsum(sizes)[:-1]]).astype(_np.int64)
+    tdim = generators.shape[1]
+    points = _np.empty((sizes.sum(), tdim))
+    otypes = _np.array(types)
+    for otype in set(types):
+        i = _np.where(otypes == otype)[0]
+        p = permutations(otype)
+        rows = start[i, _np.newaxis] + _np.arange(len(p))
+        points[rows.reshape(-1)] = generators[i][:, p].reshape(-1, tdim)
+    if order is not None:
+        return points[order], _np.repeat(weights, sizes)[order]
+    return points, _np.repeat(weights, sizes)
@@ -0,0 +1,165 @@
+"""Opt-in instrumentation of the rules that are requested.
+
+When instrumentation is enabled, every call to `single_integral_quadrature`,
+`symmetric_single_integral_quadrature` and `double_integral_quadrature` is recorded. For each
+family, domain and order, the number of calls, the total time spent getting the rule, the number
+of bytes returned and the number of calls that raised an error are recorded. A call is counted as
+a cache hit if the same rule has already been requested while recording, and as a miss otherwise:
+this is the hit rate that a cache of rules in the calling code would achieve.
+
+When instrumentation is disabled, the only cost of each call is checking if it is enabled.
+"""
+
+import contextlib as _contextlib
+import threading as _threading
+import time as _time
+import typing as _typing
+
+Key = _typing.Tuple[str, str, int]
+Stats = _typing.Dict[str, _typing.Any]
+
+
+class Recording:
+    """The statistics recorded while instrumentation is enabled."""
+
+    def __init__(self):
+        """Create a recording."""
+        self._stats: _typing.Dict[Key, Stats] = {}
+        self._lock = _threading.Lock()
+
+    def add(self, key: Key, time: float, nbytes: int, error: bool):
+        """Add a call to the recording.
+
+        Args:
+            key: The name of the family, the name of the domain and the order of the rule
+            time: The time taken by the call in seconds
+            nbytes: The number of bytes in the arrays that were returned
+            error: If True, the call raised an error
+        """
+        with self._lock:
+            stats = self._stats.get(key)
+            hit = stats is not None
+            if stats is None:
+                stats = self._stats[key] = {
+                    "calls": 0,
+                    "time": 0.0,
+                    "hits": 0,
+                    "misses": 0,
+                    "bytes": 0,
+                    "errors": 0,
+                }
+            stats["calls"] += 1
+            stats["time"] += time
+            stats["hits" if hit else "misses"] += 1
+            stats["bytes"] += nbytes
+            stats["errors"] += int(error)
+
+    def snapshot(self) -> _typing.Dict[Key, Stats]:
+        """Get a copy of the statistics recorded so far.
+
+        Returns:
+            The number of calls, total time in seconds, cache hits, cache misses, bytes returned
+            and errors for each family name, domain name and order
+        """
+        with self._lock:
+            return {key: dict(stats) for key, stats in self._stats.items()}
+
+    def totals(self) -> Stats:
+        """Get the statistics recorded so far, summed over every rule."""
+        totals: Stats = {"calls": 0, "time": 0.0, "hits": 0, "misses": 0, "bytes": 0, "errors": 0}
+        for stats in self.snapshot().values():
+            for name, value in stats.items():
+                totals[name] += value
+        return totals
+
+
+# The recordings that calls are currently added to: this is empty if instrumentation is disabled
+_recordings: _typing.List[Recording] = []
+_global = Recording()
+
+
+def enable():
+    """Start recording calls in the global recording."""
+    if _global not in _recordings:
+        _recordings.append(_global)
+
+
+def disable():
+    """Stop recording calls in the global recording."""
+    if _global in _recordings:
+        _recordings.remove(_global)
+
+
+def enabled() -> bool:
+    """Check if calls are currently being recorded."""
+    return len(_recordings) > 0
+
+
+def reset():
+    """Discard the statistics in the global recording."""
+    global _global
+    active = _global in _recordings
+    disable()
+    _global = Recording()
+    if active:
+        enable()
+
+
+def snapshot() -> _typing.Dict[Key, Stats]:
+    """Get a copy of the statistics in the global recording.
+
+    Returns:
+        The number of calls, total time in seconds, cache hits, cache misses, bytes returned and
+        errors for each family name, domain name and order
+    """
+    return _global.snapshot()
+
+
+@_contextlib.contextmanager
+def record() -> _typing.Iterator[Recording]:
+    """Record the calls made inside a with block.
+
+    The global recording is not affected, and recordings can be nested.
+
+    Example:
+        with quadraturerules.instrumentation.record() as r:
+            solve()
+        print(r.snapshot())
+
+    Yields:
+        The recording
+    """
+    recording = Recording()
+    _recordings.append(recording)
+    try:
+        yield recording
+    finally:
+        _recordings.remove(recording)
+
+
+def call(f: _typing.Callable[..., _typing.Tuple], rtype, domain, order: int) -> _typing.Tuple:
+    """Call a function that gets a rule and add the call to every active recording.
+
+    Args:
+        f: The function
+        rtype: The rule family
+        domain: The domain
+        order: The order of the rule
+
+    Returns:
+        The output of the function
+    """
+    key = (getattr(rtype, "name", str(rtype)), getattr(domain, "name", str(domain)), order)
+    start = _time.perf_counter()
+    try:
+        out = f(rtype, domain, order)
+    except Exception:
+        time = _time.perf_counter() - start
+        for r in list(_recordings):
+            r.add(key, time, 0, True)
+        raise
+    time = _time.perf_counter() - start
+    nbytes = sum(a.nbytes for a in out)
+    for r in list(_recordings):
+        r.add(key, time, nbytes, False)
+    return out
@@ -2,4 +2,7 @@
 
 {{for Q in rules}}
 from quadraturerules.rules.{{Q.snake_case_name}} import {{Q.snake_case_name}}
+{{if Q.itype == single}}
+from quadraturerules.rules.{{Q.snake_case_name}} import {{Q.snake_case_name}}_orbits
+{{end if}}
 {{end for}}
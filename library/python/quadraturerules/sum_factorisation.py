@@ -0,0 +1,154 @@
+"""Sum factorised kernels for tensor product rules on quadrilaterals and hexahedra.
+
+A tensor product rule on a quadrilateral or hexahedron uses the same rule on an interval in each
+direction. If a basis is also a tensor product of bases on an interval, it can be evaluated and
+integrated by applying the tabulation of the interval basis at the points of the interval rule
+along each axis in turn. For a rule with n points in each direction in d dimensions, this costs
+O(n^(d+1)) operations rather than the O(n^(2d)) operations needed to use the full tabulation.
+
+Arrays of values at the points of a tensor product rule have one axis for each direction, in the
+order (x, y, z). Any additional axes at the start of the arrays (for example, one axis indexing
+the cells of a mesh) are kept.
+"""
+
+import typing as _typing
+
+import numpy as _np
+import numpy.typing as _npt
+
+from quadraturerules import Domain, QuadratureRule, single_integral_quadrature
+
+Array = _npt.NDArray[_np.float64]
+
+# The number of directions in the tensor product rules on each domain
+dimensions = {
+    Domain.Interval: 1,
+    Domain.Quadrilateral: 2,
+    Domain.Hexahedron: 3,
+}
+
+
+def interval_rule(rtype: QuadratureRule, order: int) -> _typing.Tuple[Array, Array]:
+    """Get the rule on an interval used in each direction of a tensor product rule.
+
+    Args:
+        rtype: The rule family, for example `QuadratureRule.GaussLegendre` or
+            `QuadratureRule.GaussLobattoLegendre`
+        order: The order of the rule
+
+    Returns:
+        The coordinates of the points in the interval [0, 1], in increasing order, and the
+        weights
+    """
+    points, weights = single_integral_quadrature(rtype, Domain.Interval, order)
+    sort = _np.argsort(points[:, 1])
+    return points[sort, 1], weights[sort]
+
+
+def tensor_product_quadrature(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: int,
+) -> _typing.Tuple[Array, Array]:
+    """Get the points and weights of a tensor product rule.
+
+    The points are in the same order as the values used by the kernels in this module, and are
+    represented using barycentric coordinates.
+
+    Args:
+        rtype: The rule family
+        domain: The domain: an interval, quadrilateral or hexahedron
+        order: The order of the rule on an interval
+
+    Returns:
+        The points and weights
+    """
+    if domain not in dimensions:
+        raise ValueError(f"Unsupported domain for tensor product rule: {domain}")
+    x, weights = interval_rule(rtype, order)
+    points = _np.array([1 - x, x]).T
+    # The barycentric coordinate of vertex v is the product over each direction a of the
+    # interval barycentric coordinate given by bit a of v
+    tp_points = _np.ones((1, 1))
+    tp_weights = _np.ones(1)
+    for _ in range(dimensions[domain]):
+        tp_points = _np.einsum("ia,jb->ijba", tp_points, points).reshape(
+            len(tp_points) * len(points), -1
+        )
+        tp_weights = _np.outer(tp_weights, weights).reshape(-1)
+    return tp_points, tp_weights
+
+
+def _apply(matrices: _typing.Sequence[Array], values: Array, transpose: bool) -> Array:
+    """Apply a matrix along each of the final axes of an array.
+
+    Args:
+        matrices: The matrix to apply along each axis
+        values: The array
+        transpose: If True, the transpose of each matrix is applied
+
+    Returns:
+        The result
+    """
+    offset = values.ndim - len(matrices)
+    if offset < 0:
+        raise ValueError(
+            f"Array with {values.ndim} axes cannot be used in {len(matrices)} dimensions"
+        )
+    for a, m in enumerate(matrices):
+        axis = offset + a
+        values = _np.moveaxis(_np.tensordot(m, values, axes=(0 if transpose else 1, axis)), 0, axis)
+    return values
+
+
+def evaluate(tables: _typing.Sequence[Array], coefficients: Array) -> Array:
+    """Evaluate a function in a tensor product basis at the points of a tensor product rule.
+
+    Args:
+        tables: For each direction, the values of each interval basis function (columns) at each
+            point of the interval rule (rows)
+        coefficients: The coefficients of the function, with one axis for each direction
+
+    Returns:
+        The values of the function at the points, with one axis for each direction
+    """
+    return _apply(tables, coefficients, False)
+
+
+def integrate(
+    tables: _typing.Sequence[Array],
+    weights: _typing.Sequence[Array],
+    values: Array,
+) -> Array:
+    """Integrate a function against each function in a tensor product basis.
+
+    Args:
+        tables: For each direction, the values of each interval basis function (columns) at each
+            point of the interval rule (rows)
+        weights: For each direction, the weights of the interval rule
+        values: The values of the function at the points, with one axis for each direction
+
+    Returns:
+        The integral of the function multiplied by each basis function, with one axis for each
+        direction
+    """
+    return _apply([t * w[:, _np.newaxis] for t, w in zip(tables, weights)], values, True)
+
+
+def integral(weights: _typing.Sequence[Array], values: Array) -> Array:
+    """Integrate a function using a tensor product rule.
+
+    Args:
+        weights: For each direction, the weights of the interval rule
+        values: The values of the function at the points, with one axis for each direction
+
+    Returns:
+        The integral of the function
+    """
+    if values.ndim < len(weights):
+        raise ValueError(
+            f"Array with {values.ndim} axes cannot be used in {len(weights)} dimensions"
+        )
+    for w in reversed(weights):
+        values = values @ w
+    return values
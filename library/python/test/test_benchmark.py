@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+
+def test_benchmark(tmp_path):
+    output = os.path.join(tmp_path, "benchmark.json")
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(
+                os.path.dirname(os.path.realpath(__file__)), "..", "benchmark", "benchmark.py"
+            ),
+            "--family",
+            "GaussLegendre",
+            "--repeats",
+            "2",
+            "--import-repeats",
+            "1",
+            "--output",
+            output,
+        ],
+        check=True,
+    )
+    with open(output) as f:
+        results = json.load(f)
+
+    assert results["import"]["time"] > 0
+    assert results["memory"]["array_bytes"] > 0
+    assert len(results["rules"]) > 0
+    for r in results["rules"]:
+        assert r["family"] == "GaussLegendre"
+        assert r["first_call"] > 0
+        assert r["repeat_call"] > 0
+        assert r["points_per_second"] > 0
+    assert results["throughput"]["points"] == sum(r["npoints"] for r in results["rules"])
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from quadraturerules import (
+    Domain,
+    QuadratureRule,
+    double_integral_quadrature,
+    instrumentation,
+    single_integral_quadrature,
+)
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled():
+    instrumentation.reset()
+    assert not instrumentation.enabled()
+    single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 2)
+    assert instrumentation.snapshot() == {}
+
+
+def test_snapshot(enabled):
+    for _ in range(3):
+        pts, wts = single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 2)
+    single_integral_quadrature(QuadratureRule.XiaoGimbutas, Domain.Triangle, 3)
+    with pytest.raises(ValueError):
+        single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 1000)
+
+    stats = instrumentation.snapshot()
+    assert set(stats) == {
+        ("GaussLegendre", "Interval", 2),
+        ("XiaoGimbutas", "Triangle", 3),
+        ("GaussLegendre", "Interval", 1000),
+    }
+    s = stats[("GaussLegendre", "Interval", 2)]
+    assert s["calls"] == 3
+    assert s["hits"] == 2
+    assert s["misses"] == 1
+    assert s["bytes"] == 3 * (pts.nbytes + wts.nbytes)
+    assert s["time"] > 0
+    assert s["errors"] == 0
+    assert stats[("GaussLegendre", "Interval", 1000)]["errors"] == 1
+
+
+def test_double_integral(enabled):
+    rules = double_integral_quadrature(
+        QuadratureRule.SauterSchwab, Domain.EdgeAdjacentTriangles, 1
+    )
+    s = instrumentation.snapshot()[("SauterSchwab", "EdgeAdjacentTriangles", 1)]
+    assert s["bytes"] == sum(a.nbytes for a in rules)
+
+
+def test_record():
+    instrumentation.reset()
+    with instrumentation.record() as outer:
+        single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 2)
+        with instrumentation.record() as inner:
+            single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 2)
+    assert not instrumentation.enabled()
+    single_integral_quadrature(QuadratureRule.GaussLegendre, Domain.Interval, 2)
+
+    assert outer.totals()["calls"] == 2
+    assert outer.totals()["hits"] == 1
+    assert inner.totals()["calls"] == 1
+    assert inner.totals()["misses"] == 1
+    assert instrumentation.snapshot() == {}
+
+
+def test_results_unchanged(enabled):
+    with_instrumentation = single_integral_quadrature(
+        QuadratureRule.GaussLegendre, Domain.Interval, 4
+    )
+    instrumentation.disable()
+    without_instrumentation = single_integral_quadrature(
+        QuadratureRule.GaussLegendre, Domain.Interval, 4
+    )
+    for a, b in zip(with_instrumentation, without_instrumentation):
+        assert np.array_equal(a, b)
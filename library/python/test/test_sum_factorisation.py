@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from quadraturerules import Domain, QuadratureRule
+from quadraturerules import sum_factorisation as sf
+
+
+def monomials(x, n):
+    return np.array([x**i for i in range(n)]).T
+
+
+@pytest.mark.parametrize(
+    "rtype", [QuadratureRule.GaussLegendre, QuadratureRule.GaussLobattoLegendre]
+)
+@pytest.mark.parametrize("domain", [Domain.Quadrilateral, Domain.Hexahedron])
+def test_tensor_product_quadrature(rtype, domain):
+    d = sf.dimensions[domain]
+    pts, wts = sf.tensor_product_quadrature(rtype, domain, 4)
+    x, w = sf.interval_rule(rtype, 4)
+    assert np.all(np.diff(x) > 0)
+    assert pts.shape == (len(x) ** d, 2**d)
+    assert np.allclose(pts.sum(axis=1), 1)
+    assert np.isclose(sum(wts), 1)
+    # Reference coordinates of the points
+    ref = np.array(
+        [[p[[v for v in range(2**d) if v >> a & 1]].sum() for a in range(d)] for p in pts]
+    )
+    assert np.allclose(ref, np.stack(np.meshgrid(*[x] * d, indexing="ij"), axis=-1).reshape(-1, d))
+    assert np.isclose(wts @ (ref[:, 0] ** 3 * ref[:, -1] ** 2), 1 / 12)
+
+
+@pytest.mark.parametrize(
+    "rtype", [QuadratureRule.GaussLegendre, QuadratureRule.GaussLobattoLegendre]
+)
+@pytest.mark.parametrize("d", [1, 2, 3])
+def test_against_full_tabulation(rtype, d):
+    x, w = sf.interval_rule(rtype, 5)
+    table = monomials(x, 4)
+    full_table = table
+    full_weights = w
+    for _ in range(d - 1):
+        full_table = np.kron(full_table, table)
+        full_weights = np.kron(full_weights, w)
+
+    coefficients = np.random.default_rng(0).random((4,) * d)
+    values = sf.evaluate([table] * d, coefficients)
+    assert values.shape == (len(x),) * d
+    assert np.allclose(values.reshape(-1), full_table @ coefficients.reshape(-1))
+
+    moments = sf.integrate([table] * d, [w] * d, values)
+    assert moments.shape == (4,) * d
+    assert np.allclose(moments.reshape(-1), full_table.T @ (full_weights * values.reshape(-1)))
+
+    assert np.isclose(sf.integral([w] * d, values), full_weights @ values.reshape(-1))
+
+
+def test_batch():
+    x, w = sf.interval_rule(QuadratureRule.GaussLegendre, 3)
+    tables = [monomials(x, 2), monomials(x, 3)]
+    coefficients = np.random.default_rng(1).random((6, 2, 3))
+    values = sf.evaluate(tables, coefficients)
+    assert values.shape == (6, 3, 3)
+    for c, v in zip(coefficients, values):
+        assert np.allclose(sf.evaluate(tables, c), v)
+    integrals = sf.integral([w, w], values)
+    assert integrals.shape == (6,)
+    # The integral of x^i y^j over the unit square is 1 / ((i + 1)(j + 1))
+    exact = coefficients @ (1 / np.arange(1, 4)) @ (1 / np.arange(1, 3))
+    assert np.allclose(integrals, exact)
+
+
+def test_unsupported_domain():
+    with pytest.raises(ValueError):
+        sf.tensor_product_quadrature(QuadratureRule.GaussLegendre, Domain.Triangle, 2)
+    x, w = sf.interval_rule(QuadratureRule.GaussLegendre, 2)
+    with pytest.raises(ValueError):
+        sf.integral([w] * 3, np.ones((2, 2)))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from quadraturerules import (
+    Domain,
+    QuadratureRule,
+    single_integral_orbits,
+    single_integral_quadrature,
+    symmetric_single_integral_quadrature,
+)
+
+
+@pytest.mark.parametrize(
+    ("rtype", "domain", "order"),
+    [
+        (QuadratureRule.GaussLegendre, Domain.Interval, 5),
+        (QuadratureRule.XiaoGimbutas, Domain.Triangle, 1),
+        (QuadratureRule.XiaoGimbutas, Domain.Triangle, 10),
+        (QuadratureRule.XiaoGimbutas, Domain.Tetrahedron, 5),
+    ],
+)
+def test_symmetric_integrand(rtype, domain, order):
+    def f(p):
+        return np.prod(p, axis=1) + np.sum(p**4, axis=1)
+
+    points, weights = single_integral_quadrature(rtype, domain, order)
+    sym_points, sym_weights = symmetric_single_integral_quadrature(rtype, domain, order)
+    assert len(sym_points) < len(points) or len(points) == 1
+    assert np.isclose(sum(sym_weights), 1)
+    assert np.isclose(sym_weights @ f(sym_points), weights @ f(points))
+
+
+def test_orbits():
+    types, generators, weights = single_integral_orbits(
+        QuadratureRule.XiaoGimbutas, Domain.Triangle, 3
+    )
+    _, all_weights = single_integral_quadrature(QuadratureRule.XiaoGimbutas, Domain.Triangle, 3)
+    assert len(types) == len(generators) == len(weights)
+    assert generators.shape[1] == 3
+    assert np.allclose(np.sort(np.unique(weights)), np.sort(np.unique(all_weights)))
+
+
+def test_not_symmetric():
+    with pytest.raises(ValueError):
+        symmetric_single_integral_quadrature(
+            QuadratureRule.XiaoGimbutas, Domain.Quadrilateral, 3
+        )
+
+
+def test_point_order():
+    # Rules stored as orbits keep the order of their points
+    points, weights = single_integral_quadrature(
+        QuadratureRule.ClosedNewtonCotes, Domain.Interval, 5
+    )
+    assert np.all(np.diff(points[:, 0]) < 0)
+    assert np.allclose(weights, weights[::-1])
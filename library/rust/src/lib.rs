@@ -58,6 +58,38 @@ pub fn double_integral_quadrature(
     }
 }
 
+/// Get the points and weights of a quadrature rule for a single integral without copying them.
+pub fn single_integral_quadrature_slices(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: usize,
+) -> Result<(&'static [f64], &'static [f64]), &'static str> {
+    match rtype {
+        {{for Q in rules}}
+        {{if Q.itype == single}}
+        QuadratureRule::{{Q.PascalCaseName}} => rules::{{Q.snake_case_name}}_slices(domain, order),
+        {{end if}}
+        {{end for}}
+        _ => Err("Unsupported rule for single integral"),
+    }
+}
+
+/// Get the points and weights of a quadrature rule for a double integral without copying them.
+pub fn double_integral_quadrature_slices(
+    rtype: QuadratureRule,
+    domain: Domain,
+    order: usize,
+) -> Result<(&'static [f64], &'static [f64], &'static [f64]), &'static str> {
+    match rtype {
+        {{for Q in rules}}
+        {{if Q.itype == double}}
+        QuadratureRule::{{Q.PascalCaseName}} => rules::{{Q.snake_case_name}}_slices(domain, order),
+        {{end if}}
+        {{end for}}
+        _ => Err("Unsupported rule for double integral"),
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -80,4 +112,21 @@ mod tests {
         let weights = single_integral_quadrature(QuadratureRule::GaussLegendre, Domain::Interval, 3).unwrap().1;
         assert_relative_eq!(weights.iter().sum::<f64>(), 1.0);
     }
+
+    #[test]
+    fn test_slices() {
+        let (points, weights) = single_integral_quadrature(QuadratureRule::GaussLegendre, Domain::Interval, 3).unwrap();
+        let (points_slice, weights_slice) = single_integral_quadrature_slices(QuadratureRule::GaussLegendre, Domain::Interval, 3).unwrap();
+        assert_eq!(points, points_slice);
+        assert_eq!(weights, weights_slice);
+    }
+
+    #[test]
+    fn test_double_slices() {
+        let (first_points, second_points, weights) = double_integral_quadrature(QuadratureRule::SauterSchwab, Domain::EdgeAdjacentTriangles, 2).unwrap();
+        let (first_points_slice, second_points_slice, weights_slice) = double_integral_quadrature_slices(QuadratureRule::SauterSchwab, Domain::EdgeAdjacentTriangles, 2).unwrap();
+        assert_eq!(first_points, first_points_slice);
+        assert_eq!(second_points, second_points_slice);
+        assert_eq!(weights, weights_slice);
+    }
 }
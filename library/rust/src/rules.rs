@@ -4,5 +4,5 @@ mod {{Q.snake_case_name}};
 
 {{end for}}
 {{for Q in rules}}
-pub use {{Q.snake_case_name}}::{{Q.snake_case_name}};
+pub use {{Q.snake_case_name}}::{{{Q.snake_case_name}}, {{Q.snake_case_name}}_slices};
 {{end for}}
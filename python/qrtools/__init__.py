@@ -1,3 +1,3 @@
 """Website builder."""
 
-from qrtools import generate_qr, rules, settings
+from qrtools import catalogue, generate_qr, incremental, libraries, rules, settings, verification
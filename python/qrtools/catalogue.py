@@ -0,0 +1,140 @@
+"""Machine-readable catalogue of quadrature rules."""
+
+import json
+import os
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from qrtools.rules import QRuleFamily, sort_name
+
+dtype = "<f8"
+library_data_magic = b"QRULES\x00\x01"
+library_data_fields = [
+    "family",
+    "domain",
+    "order",
+    "npoints",
+    "point_dim",
+    "second_point_dim",
+    "offset",
+]
+
+
+def write_catalogue(families: typing.List[QRuleFamily], json_file: str, data_file: str):
+    """Write a catalogue of rules and a binary file containing their points and weights.
+
+    The binary file contains the arrays of every rule as little-endian 64-bit floats in
+    row-major order. For each rule, the catalogue includes the byte offset and shape of each
+    of its arrays in the binary file.
+
+    Args:
+        families: The families of rules to include
+        json_file: The file to write the catalogue to
+        data_file: The file to write the points and weights to
+    """
+    catalogue: typing.Dict[str, typing.Any] = {
+        "data": os.path.basename(data_file),
+        "dtype": dtype,
+        "families": [],
+    }
+    offset = 0
+    with open(data_file, "wb") as f:
+        for q in sorted(families, key=lambda q: q.index):
+            rules = []
+            for r in sorted(q.rules, key=lambda r: (sort_name(r.domain), r.order or 0)):
+                values = r.arrays
+                arrays = {}
+                for name, a in values.items():
+                    data = np.ascontiguousarray(a, dtype=dtype).tobytes()
+                    f.write(data)
+                    arrays[name] = {"offset": offset, "shape": list(a.shape)}
+                    offset += len(data)
+                rules.append(
+                    {
+                        "domain": r.domain,
+                        "order": r.order,
+                        "npoints": r.npoints,
+                        "exact-degree": q.exact_degree(r.order),
+                        "positive-weights": bool(np.all(values["weights"] > 0)),
+                        "arrays": arrays,
+                    }
+                )
+            catalogue["families"].append(
+                {
+                    "code": q.code,
+                    "name": q.name(),
+                    "integral-type": q.itype,
+                    "rules": rules,
+                }
+            )
+
+    with open(json_file, "w") as f:
+        json.dump(catalogue, f, separators=(",", ":"))
+
+
+def load_arrays(
+    data_file: str, rule: typing.Dict[str, typing.Any]
+) -> typing.Dict[str, npt.NDArray[np.float64]]:
+    """Load the points and weights of a rule in a catalogue without reading the whole file.
+
+    Args:
+        data_file: The binary file containing the points and weights
+        rule: The entry for the rule in the catalogue
+
+    Returns:
+        Read-only memory-mapped arrays of the rule's points and weights
+    """
+    return {
+        name: np.memmap(
+            data_file, dtype=dtype, mode="r", offset=a["offset"], shape=tuple(a["shape"])
+        )
+        for name, a in rule["arrays"].items()
+    }
+
+
+def write_library_data(
+    families: typing.List[QRuleFamily], domains: typing.Sequence[str | None], data_file: str
+):
+    """Write the points and weights of rules to a binary file that can be loaded by a library.
+
+    The file begins with the eight bytes ``QRULES``, 0 and 1, followed by the number of rules.
+    This is followed by an index containing one entry for each rule, then the points and weights
+    of every rule. All integers are little-endian signed 64-bit integers and all numbers are
+    little-endian 64-bit floats.
+
+    Each entry in the index contains seven integers: the index of the rule family, the index of
+    the domain, the order, the number of points, the dimension of the points, the dimension of
+    the second points (or 0 for rules for single integrals), and the byte offset of the rule's
+    data in the file. The data of each rule consists of its points (or first points then second
+    points for rules for double integrals), in row-major order, followed by its weights.
+
+    Args:
+        families: The families of rules to include
+        domains: The domains in the order used by the library
+        data_file: The file to write to
+    """
+    entries = []
+    data = []
+    offset = len(library_data_magic) + 8 * (
+        1 + len(library_data_fields) * sum(len(q.rules) for q in families)
+    )
+    for q in sorted(families, key=lambda q: q.index):
+        for r in sorted(q.rules, key=lambda r: (domains.index(r.domain), r.order)):
+            arrays = r.arrays
+            points = [a for name, a in arrays.items() if name != "weights"]
+            dims = [p.shape[1] for p in points] + [0]
+            entries.append(
+                [q.index, domains.index(r.domain), r.order, r.npoints, dims[0], dims[1], offset]
+            )
+            for a in points + [arrays["weights"]]:
+                data.append(np.ascontiguousarray(a, dtype=dtype).tobytes())
+                offset += len(data[-1])
+
+    with open(data_file, "wb") as f:
+        f.write(library_data_magic)
+        f.write(np.array([len(entries)], dtype="<i8").tobytes())
+        f.write(np.array(entries, dtype="<i8").tobytes())
+        for d in data:
+            f.write(d)
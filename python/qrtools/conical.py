@@ -0,0 +1,153 @@
+"""Conical product (collapsed Gauss--Jacobi) quadrature rules.
+
+A conical product rule on a triangle, tetrahedron or square-based pyramid is created by mapping a
+tensor product rule on the unit square or cube onto the domain using a collapsed (Duffy)
+coordinate transformation. The Jacobian of the transformation is absorbed into the weight
+function of the rule in each collapsed direction, so a Gauss--Jacobi rule is used in these
+directions. A rule of order n uses n points in each direction and integrates polynomials of
+degree 2n-1 exactly.
+"""
+
+import functools
+import os
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from qrtools.rules import QRuleSingle, rule_file
+
+Rule = typing.Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+
+# Domains that conical product rules can be created on
+domains = ["triangle", "tetrahedron", "square-based pyramid"]
+
+
+@functools.cache
+def gauss_jacobi(npoints: int, alpha: int) -> Rule:
+    """Get a Gauss--Jacobi rule on the interval [0, 1] with the weight function (1-x)^alpha.
+
+    The rule is computed using the Golub--Welsch algorithm: the points are the eigenvalues of the
+    symmetric tridiagonal Jacobi matrix of the three-term recurrence of the Jacobi polynomials,
+    and the weights are given by the first entries of its eigenvectors.
+
+    Args:
+        npoints: The number of points
+        alpha: The exponent of the weight function
+
+    Returns:
+        The points and the weights, scaled so that they sum to 1
+    """
+    if npoints < 1:
+        raise ValueError(f"Invalid number of points: {npoints}")
+    k = np.arange(npoints, dtype=np.float64)
+    # Recurrence coefficients of the Jacobi polynomials P^(alpha, 0) on [-1, 1]
+    s = 2 * k + alpha
+    diagonal = np.divide(-(alpha**2), s * (s + 2), out=np.zeros(npoints), where=s > 0)
+    k = k[1:]
+    s = s[1:]
+    off_diagonal = np.sqrt(4 * k * k * (k + alpha) * (k + alpha) / (s * s * (s + 1) * (s - 1)))
+    eigenvalues, eigenvectors = np.linalg.eigh(
+        np.diag(diagonal) + np.diag(off_diagonal, 1) + np.diag(off_diagonal, -1)
+    )
+    weights = eigenvectors[0] ** 2
+    points = (1 + eigenvalues) / 2
+    points.flags.writeable = False
+    weights = weights / weights.sum()
+    weights.flags.writeable = False
+    return points, weights
+
+
+@functools.cache
+def conical_product(domain: str, order: int) -> Rule:
+    """Get a conical product rule.
+
+    Args:
+        domain: The domain
+        order: The number of points in each direction
+
+    Returns:
+        The barycentric coordinates of the points, one point per row, and the weights, which sum
+        to 1
+    """
+    # Exponent of (1-x) in the Jacobian of the transformation in each direction
+    match domain:
+        case "triangle":
+            alphas = [0, 1]
+        case "tetrahedron":
+            alphas = [0, 1, 2]
+        case "square-based pyramid":
+            alphas = [0, 0, 2]
+        case _:
+            raise ValueError(f"Unsupported domain: {domain}")
+
+    rules = [gauss_jacobi(order, a) for a in alphas]
+    x = [c.reshape(-1) for c in np.meshgrid(*[r[0] for r in rules], indexing="ij")]
+    w = [c.reshape(-1) for c in np.meshgrid(*[r[1] for r in rules], indexing="ij")]
+    weights = np.prod(w, axis=0)
+
+    match domain:
+        case "triangle":
+            # (x, y) = (x0 (1 - x1), x1)
+            points = np.array([(1 - x[0]) * (1 - x[1]), x[0] * (1 - x[1]), x[1]])
+        case "tetrahedron":
+            # (x, y, z) = (x0 (1 - x1) (1 - x2), x1 (1 - x2), x2)
+            points = np.array(
+                [
+                    (1 - x[0]) * (1 - x[1]) * (1 - x[2]),
+                    x[0] * (1 - x[1]) * (1 - x[2]),
+                    x[1] * (1 - x[2]),
+                    x[2],
+                ]
+            )
+        case "square-based pyramid":
+            # (x, y, z) = (x0 (1 - x2), x1 (1 - x2), x2)
+            points = np.array(
+                [
+                    (1 - x[0]) * (1 - x[1]) * (1 - x[2]),
+                    x[0] * (1 - x[1]) * (1 - x[2]),
+                    (1 - x[0]) * x[1] * (1 - x[2]),
+                    x[0] * x[1] * (1 - x[2]),
+                    x[2],
+                ]
+            )
+    points = points.T
+    points.flags.writeable = False
+    weights.flags.writeable = False
+    return points, weights
+
+
+def rule(domain: str, order: int) -> QRuleSingle:
+    """Get a conical product rule.
+
+    Args:
+        domain: The domain
+        order: The number of points in each direction
+
+    Returns:
+        The rule
+    """
+    points, weights = conical_product(domain, order)
+    return QRuleSingle(
+        domain,
+        order,
+        points.tolist(),
+        weights.tolist(),
+        rule_file(domain, order, points, weights),
+    )
+
+
+def write_rules(folder: str, orders: typing.Iterable[int], domains: typing.List[str] = domains):
+    """Write conical product rules to .rule files.
+
+    Args:
+        folder: The folder to write the files to
+        orders: The orders of the rules
+        domains: The domains of the rules
+    """
+    os.makedirs(folder, exist_ok=True)
+    for domain in domains:
+        for order in orders:
+            points, weights = conical_product(domain, order)
+            with open(os.path.join(folder, f"{domain.replace(' ', '-')}-{order}.rule"), "w") as f:
+                f.write(rule_file(domain, order, points, weights))
@@ -4,7 +4,7 @@ import re
 import typing
 
 from generate.substitute import IndexedArray, IndexedFloat, Substitutor, replace
-from qrtools import rules
+from qrtools import profiling, rules
 
 abbrv_names: typing.Dict[str, str] = {}
 
@@ -25,6 +25,83 @@ def get_abbrv_name(long_name: str) -> str:
     return abbrv_names[long_name]
 
 
+def fortran_double(value: str) -> str:
+    """Convert a formatted number to a Fortran double precision literal."""
+    if "e" in value:
+        return value.replace("e", "d")
+    return f"{value}d0"
+
+
+class NumberBlock(Substitutor):
+    """Substitutor for a block of consecutive points or weights."""
+
+    def __init__(self, values: typing.List[str], start: int, end: int):
+        """Initialise.
+
+        Args:
+            values: The formatted numbers in the block, flattened
+            start: The index of the first point or weight in the block
+            end: The index of the last point or weight in the block
+        """
+        self.values = values
+        self.start = start
+        self.end = end
+
+    def substitute(self, code: str, variable: str, bracketed: bool = True) -> str:
+        """Substitute."""
+        return replace(
+            code,
+            [
+                (f"{variable}.start", lambda: f"{self.start}"),
+                (f"{variable}.end", lambda: f"{self.end}"),
+                (
+                    f"{variable}.fortran_double_list",
+                    lambda: ", &\n    ".join(
+                        ", ".join(fortran_double(c) for c in self.values[i : i + 3])
+                        for i in range(0, len(self.values), 3)
+                    ),
+                ),
+                (
+                    f"{variable}.fixed_form_fortran_double_list",
+                    lambda: ",".join(
+                        "\n     &" + ", ".join(fortran_double(c) for c in self.values[i : i + 2])
+                        for i in range(0, len(self.values), 2)
+                    ),
+                ),
+            ],
+            bracketed,
+        )
+
+    def loop_targets(
+        self,
+        variable: str,
+    ) -> typing.Dict[str, typing.Generator[Substitutor, None, None]]:
+        """Get list of loop targets."""
+        return {}
+
+
+def blocks(
+    values: typing.List[str], dim: int = 1, max_numbers: int = 32
+) -> typing.Generator[Substitutor, None, None]:
+    """Split points or weights into blocks.
+
+    Blocks are kept small so that Fortran DATA statements initialising them stay within the
+    standard's limits on continuation lines.
+
+    Args:
+        values: The formatted points or weights, flattened
+        dim: The number of coordinates of each point, or 1 for weights
+        max_numbers: The maximum number of numbers in each block
+
+    Returns:
+        The blocks
+    """
+    size = max(1, max_numbers // dim)
+    for start in range(0, len(values) // dim, size):
+        block = values[start * dim : (start + size) * dim]
+        yield NumberBlock(block, start, start + len(block) // dim - 1)
+
+
 class RuleFamily(Substitutor):
     """Substitutor for a rule family."""
 
@@ -36,6 +113,10 @@ class RuleFamily(Substitutor):
         """Format as string."""
         return self.family.name()
 
+    @profiling.profiled(
+        "generate_qr.family",
+        lambda out, self, *args, **kwargs: {"family": self.family.code, "bytes": len(out)},
+    )
     def substitute(self, code: str, variable: str, bracketed: bool = True) -> str:
         """Substitute."""
         return replace(
@@ -44,6 +125,10 @@ class RuleFamily(Substitutor):
                 (f"{variable}.code", lambda: f"{self.family.code}"),
                 (f"{variable}.index", lambda: f"{self.family.index}"),
                 (f"{variable}.itype", lambda: self.family.itype),
+                (
+                    f"{variable}.has_orbits",
+                    lambda: "true" if self.family.has_orbits() else "false",
+                ),
                 (f"{variable}.name", lambda: self.family.name()),
                 (f"{variable}.PascalCaseName", lambda: self.family.name("PascalCase")),
                 (f"{variable}.camelCaseName", lambda: self.family.name("camelCase")),
@@ -68,6 +153,10 @@ class Rule(Substitutor):
         """Initialise."""
         self.rule = rule
 
+    @profiling.profiled(
+        "generate_qr.rule",
+        lambda out, self, *args, **kwargs: {**self.rule.profile_info(), "bytes": len(out)},
+    )
     def substitute(self, code: str, variable: str, bracketed: bool = True) -> str:
         """Substitute."""
         assert isinstance(self.rule, rules.QRuleSingle | rules.QRuleDouble)
@@ -83,6 +172,21 @@ class Rule(Substitutor):
         ]
         if isinstance(self.rule, rules.QRuleSingle):
             subs += [
+                (
+                    f"{variable}.storage",
+                    lambda: "points" if self.rule.orbits is None else "orbits",
+                ),
+                (
+                    f"{variable}.symmetric",
+                    lambda: "false" if self.rule.symmetry_orbits is None else "true",
+                ),
+                (f"{variable}.orbit_order_as_list", lambda: self.rule.orbit_order_as_list()),
+                (f"{variable}.orbit_types_as_list", lambda: self.rule.orbit_types_as_list()),
+                (
+                    f"{variable}.orbit_generators_as_list",
+                    lambda: self.rule.orbit_generators_as_list(),
+                ),
+                (f"{variable}.orbit_weights_as_list", lambda: self.rule.orbit_weights_as_list()),
                 (f"{variable}.point_dim", lambda: f"{len(self.rule.points[0])}"),
                 (
                     f"{variable}.len_flat_points",
@@ -172,33 +276,23 @@ class Rule(Substitutor):
         variable: str,
     ) -> typing.Dict[str, typing.Generator[Substitutor, None, None]]:
         """Get list of loop targets."""
+        weights = self.rule.formatted("weights")
         out: typing.Dict[str, typing.Generator[Substitutor, None, None]] = {
-            f"{variable}.weights": (IndexedFloat(w, i) for i, w in enumerate(self.rule.weights))
+            f"{variable}.weights": (IndexedFloat(w, i) for i, w in enumerate(weights)),
+            f"{variable}.weight_blocks": blocks(weights),
         }
         if isinstance(self.rule, rules.QRuleSingle):
-            out[f"{variable}.flat_points"] = (
-                IndexedFloat(c, i * len(self.rule.points[0]) + j)
-                for i, p in enumerate(self.rule.points)
-                for j, c in enumerate(p)
-            )
-            out[f"{variable}.points"] = (IndexedArray(p, i) for i, p in enumerate(self.rule.points))
+            arrays = ["points"]
         if isinstance(self.rule, rules.QRuleDouble):
-            out[f"{variable}.first_points"] = (
-                IndexedArray(p, i) for i, p in enumerate(self.rule.first_points)
-            )
-            out[f"{variable}.second_points"] = (
-                IndexedArray(p, i) for i, p in enumerate(self.rule.second_points)
-            )
-            out[f"{variable}.flat_first_points"] = (
-                IndexedFloat(c, i * len(self.rule.first_points[0]) + j)
-                for i, p in enumerate(self.rule.first_points)
-                for j, c in enumerate(p)
-            )
-            out[f"{variable}.flat_second_points"] = (
-                IndexedFloat(c, i * len(self.rule.second_points[0]) + j)
-                for i, p in enumerate(self.rule.second_points)
-                for j, c in enumerate(p)
+            arrays = ["first_points", "second_points"]
+        for array in arrays:
+            values = self.rule.formatted(array)
+            dim = len(getattr(self.rule, array)[0])
+            out[f"{variable}.{array}"] = (
+                IndexedArray(values[i : i + dim], i // dim) for i in range(0, len(values), dim)
             )
+            out[f"{variable}.flat_{array}"] = (IndexedFloat(c, i) for i, c in enumerate(values))
+            out[f"{variable}.{array[:-1]}_blocks"] = blocks(values, dim)
         return out
 
 
@@ -0,0 +1,103 @@
+"""Rendering images of quadrature rules."""
+
+import functools
+import multiprocessing
+import typing
+from datetime import datetime
+
+from qrtools import profiling, settings
+from qrtools.rules import QRule, QRuleFamily, load_rule
+
+ImageJob = typing.Tuple[str, typing.Optional[str], typing.Optional[int], typing.List[str]]
+ImageResult = typing.Tuple[
+    typing.Dict[str, float], typing.Optional[str], typing.List[profiling.Event]
+]
+
+
+@functools.cache
+def _load_family(code: str) -> QRuleFamily:
+    """Load a rule family once per process."""
+    return load_rule(code)
+
+
+def _get_rule(code: str, domain: str | None, order: int | None) -> QRule:
+    """Get a rule from a family."""
+    for r in _load_family(code).rules:
+        if r.domain == domain and r.order == order:
+            return r
+    raise ValueError(f"Rule not found: {code} {domain} {order}")
+
+
+def _render(job: ImageJob) -> ImageResult:
+    """Render the images of a single rule.
+
+    Args:
+        job: The rule code, domain, order and the image files to make
+
+    Returns:
+        The time taken for each format, an error message if rendering failed, and the events
+        recorded by the profiler
+    """
+    code, domain, order, filenames = job
+    timings: typing.Dict[str, float] = {}
+    try:
+        r = _get_rule(code, domain, order)
+        for filename in filenames:
+            start = datetime.now()
+            r.image(filename)
+            end = datetime.now()
+            timings[filename.split(".")[-1]] = (end - start).total_seconds()
+    except Exception as e:
+        return timings, f"{type(e).__name__}: {e}", profiling.collect()
+    return timings, None, profiling.collect()
+
+
+def render_images(
+    jobs: typing.List[ImageJob], processes: int | None = None
+) -> typing.Dict[str, float]:
+    """Render images of rules.
+
+    Args:
+        jobs: A list of rule codes, domains, orders and the image files to make for each rule
+        processes: The number of processes to use (default: settings.processes)
+
+    Returns:
+        The total time spent making each format
+    """
+    if processes is None:
+        processes = settings.processes
+    start = datetime.now()
+    with profiling.stage("images", rules=len(jobs), processes=processes):
+        if processes > 1 and len(jobs) > 1:
+            with multiprocessing.Pool(
+                processes,
+                initializer=profiling.init_worker,
+                initargs=(settings.root_path, profiling.enabled()),
+            ) as pool:
+                results = pool.map(_render, jobs, chunksize=1)
+        else:
+            results = [_render(job) for job in jobs]
+    # Events recorded while rendering are returned with the results, including in this process
+    for _, _, events in results:
+        profiling.add_events(events)
+    end = datetime.now()
+
+    totals: typing.Dict[str, float] = {}
+    counts: typing.Dict[str, int] = {}
+    errors = []
+    for (code, domain, order, _), (timings, error, _) in zip(jobs, results):
+        for format, time in timings.items():
+            totals[format] = totals.get(format, 0.0) + time
+            counts[format] = counts.get(format, 0) + 1
+        if error is not None:
+            errors.append(f"{code} {domain} {order}: {error}")
+
+    print(
+        f"Rendered images of {len(jobs)} rules using {processes} process"
+        f"{'' if processes == 1 else 'es'} in {(end - start).total_seconds():.2f}s"
+    )
+    for format in sorted(totals):
+        print(f"  {format}: {counts[format]} images in {totals[format]:.2f}s")
+    if len(errors) > 0:
+        raise RuntimeError("Rendering images failed:\n" + "\n".join(errors))
+    return totals
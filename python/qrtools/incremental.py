@@ -0,0 +1,195 @@
+"""Incremental builds."""
+
+import hashlib
+import json
+import os
+import shutil
+import typing
+
+from webtools.tools import join
+
+
+def hash_strings(*values: str) -> str:
+    """Hash a collection of strings."""
+    h = hashlib.sha256()
+    for v in values:
+        h.update(hashlib.sha256(v.encode()).digest())
+    return h.hexdigest()
+
+
+def hash_files(*paths: str) -> str:
+    """Hash the content of a collection of files and folders.
+
+    Hidden files and Python caches inside folders are ignored.
+
+    Args:
+        paths: Files and folders
+
+    Returns:
+        A hash of the names and contents of the files
+    """
+    h = hashlib.sha256()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+                for file in sorted(files):
+                    if not file.startswith("."):
+                        h.update(os.path.relpath(join(root, file), path).encode())
+                        with open(join(root, file), "rb") as f:
+                            h.update(hashlib.sha256(f.read()).digest())
+        else:
+            h.update(os.path.basename(path).encode())
+            with open(path, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+class BuildManifest:
+    """A manifest recording the hash of the inputs used to make each output file."""
+
+    def __init__(self, folder: str, filename: str = ".manifest.json"):
+        """Create.
+
+        Args:
+            folder: The folder that outputs are written to
+            filename: The name of the manifest file inside the folder, or an absolute path to a
+                manifest file outside the folder
+        """
+        self.folder = folder
+        self.filename = join(folder, filename)
+        self._previous: typing.Dict[str, str] = {}
+        self._current: typing.Dict[str, str] = {}
+        if os.path.isfile(self.filename):
+            with open(self.filename) as f:
+                self._previous = json.load(f)
+
+    def _local(self, output: str) -> str:
+        """Get the path of an output relative to the folder."""
+        return os.path.relpath(output, self.folder)
+
+    def up_to_date(self, outputs: typing.List[str], inputs: str) -> bool:
+        """Check if outputs were previously made from the same inputs.
+
+        If they were, the outputs are recorded as part of the current build. If they were not,
+        any existing outputs are removed so that they can be rebuilt.
+
+        Args:
+            outputs: Output files
+            inputs: Hash of the inputs used to make the outputs
+
+        Returns:
+            True if the outputs can be reused
+        """
+        if all(self._previous.get(self._local(o)) == inputs and os.path.isfile(o) for o in outputs):
+            self.record(outputs, inputs)
+            return True
+        for o in outputs:
+            if os.path.isfile(o):
+                os.remove(o)
+        return False
+
+    def record(self, outputs: typing.List[str], inputs: str = ""):
+        """Record outputs as part of the current build.
+
+        Args:
+            outputs: Output files
+            inputs: Hash of the inputs used to make the outputs
+        """
+        for o in outputs:
+            self._current[self._local(o)] = inputs
+
+    def unrecorded(self) -> typing.List[str]:
+        """Get the files in the folder that are not part of the current build.
+
+        Returns:
+            The files, excluding the manifest
+        """
+        files = []
+        for root, dirs, filenames in os.walk(self.folder):
+            for file in filenames:
+                path = join(root, file)
+                if path != self.filename and self._local(path) not in self._current:
+                    files.append(path)
+        return sorted(files)
+
+    def remove_stale(self) -> typing.List[str]:
+        """Remove outputs of the previous build that are not part of the current build.
+
+        Only files listed in the previous manifest are removed. If any other file in the folder
+        was not recorded as part of the current build, an error is raised rather than deleting
+        it: this usually means that the code writing the file does not call record().
+
+        Returns:
+            The removed files
+        """
+        removed = self.remove_outdated()
+        unrecorded = self.unrecorded()
+        if len(unrecorded) > 0:
+            raise RuntimeError(
+                "Files were not recorded as part of the build:\n"
+                + "\n".join(self._local(f) for f in unrecorded)
+            )
+        return removed
+
+    def remove_outdated(self) -> typing.List[str]:
+        """Remove outputs of the previous build that are not part of the current build.
+
+        Unlike remove_stale, files in the folder that were never recorded are kept silently.
+
+        Returns:
+            The removed files
+        """
+        removed = []
+        for output in self._previous:
+            if output in self._current:
+                continue
+            path = join(self.folder, output)
+            if os.path.isfile(path):
+                os.remove(path)
+                removed.append(path)
+            folder = os.path.dirname(path)
+            while folder != self.folder and os.path.isdir(folder) and len(os.listdir(folder)) == 0:
+                os.rmdir(folder)
+                folder = os.path.dirname(folder)
+        return sorted(removed)
+
+    def save(self):
+        """Save the manifest."""
+        with open(self.filename, "w") as f:
+            json.dump(self._current, f, indent=1, sort_keys=True)
+
+
+def update_folder(
+    source: str, target: str, manifest_file: str
+) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """Copy the files in a folder into another folder, only writing files that have changed.
+
+    Files whose content is unchanged are not written, so their modification times are kept.
+    Files that were copied by a previous update but are no longer in the source folder are
+    removed; any other files in the target folder are kept.
+
+    Args:
+        source: The folder to copy from
+        target: The folder to copy to
+        manifest_file: The file used to record the files copied into the target folder
+
+    Returns:
+        The files that were written and the files that were removed
+    """
+    manifest = BuildManifest(target, manifest_file)
+    written = []
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for file in sorted(files):
+            path = join(root, file)
+            output = join(target, os.path.relpath(path, source))
+            content = hash_files(path)
+            if not os.path.isfile(output) or hash_files(output) != content:
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+                shutil.copyfile(path, output)
+                written.append(output)
+            manifest.record([output], content)
+    removed = manifest.remove_outdated()
+    manifest.save()
+    return written, removed
@@ -0,0 +1,323 @@
+"""Generating the quadraturerules libraries."""
+
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import typing
+from datetime import datetime
+
+import generate
+from webtools.tools import join
+
+from qrtools import catalogue, generate_qr, profiling, settings
+from qrtools.incremental import update_folder
+from qrtools.rules import QRuleFamily, dim, load_rule, sort_name
+
+LibraryJob = typing.Tuple[str, str, bool]
+LibraryResult = typing.Tuple[
+    typing.Dict[str, typing.Any], typing.Optional[str], typing.List[profiling.Event]
+]
+
+# Location of the binary data file in each library that supports loading it
+binary_data_files = {
+    "c": "rules.bin",
+    "cpp": join("quadraturerules", "rules.bin"),
+    "fortran77": "rules.bin",
+    "fortran90": "rules.bin",
+    "julia": join("src", "rules.bin"),
+    "python": join("quadraturerules", "rules.bin"),
+    "rust": join("src", "rules", "rules.bin"),
+}
+
+# Commands used to format each library after it is generated
+format_commands = {
+    "python": ["ruff", "format", "--no-cache", "."],
+    "rust": ["cargo", "fmt"],
+}
+
+_timing_line = re.compile(r"^(.+?)(?: \[(.*)\])? \(completed in ([0-9.]+)s\)$")
+
+
+def library_path() -> str:
+    """Get the path of the directory containing the library templates."""
+    return join(settings.root_path, "library")
+
+
+def libraries() -> typing.List[str]:
+    """Get the names of all the libraries that can be built."""
+    return sorted(
+        d
+        for d in os.listdir(library_path())
+        if os.path.isdir(join(library_path(), d))
+        and d != "binary"
+        and not d.endswith(".build")
+        and not d.startswith((".", "_"))
+    )
+
+
+@functools.cache
+def load_rules() -> typing.Tuple[typing.List[QRuleFamily], typing.List[str]]:
+    """Load every rule family and the domains they include once per process.
+
+    Returns:
+        The rule families, sorted by name, and the domains, in the order used by the libraries
+    """
+    families = [
+        load_rule(file[:-3]) for file in os.listdir(settings.rules_path) if file.endswith(".qr")
+    ]
+    families.sort(key=lambda r: r.name())
+    domains = sorted(
+        {r.domain for q in families for r in q.rules if r.domain is not None},
+        key=lambda d: (dim(d), sort_name(d)),
+    )
+    return families, domains
+
+
+@functools.cache
+def _loop_targets() -> typing.Dict[str, typing.List[generate.substitute.Substitutor]]:
+    """Get the loop targets used by the library templates once per process."""
+    families, domains = load_rules()
+    return {
+        "rules": [generate_qr.RuleFamily(q) for q in families],
+        "domains": [generate_qr.Domain(d, i) for i, d in enumerate(domains)],
+    }
+
+
+@functools.cache
+def _metadata() -> typing.Tuple[str, str, str]:
+    """Get the version, license and readme that are included in the libraries."""
+    with open(join(settings.root_path, "VERSION")) as f:
+        version = f.read().strip()
+    with open(join(settings.root_path, "LICENSE")) as f:
+        license = "\n".join(f.read().split("\n")[2:])
+    with open(join(settings.root_path, "README.md")) as f:
+        readme = f.read()
+    readme = re.sub(
+        r"\(website/pages/([^\)]+)\.md\)", r"(https://quadraturerules.org/\1.html)", readme
+    )
+    return version, license, readme
+
+
+def _load_library_file(m) -> str:
+    """Load the content of a files in website/pages/libraries/."""
+    with open(join(settings.pages_path, "libraries", f"{m[1]}.md")) as f:
+        return "#" + f.read()
+
+
+def _extra_subs(content: str) -> str:
+    """Make substitutions in a file."""
+    version, license, readme = _metadata()
+    content = content.replace("{{VERSION}}", version)
+    content = content.replace("{{LICENSE}}", license)
+    content = content.replace("{{README}}", readme)
+    content = re.sub(r"{{website/pages/libraries/([^}]+)}}", _load_library_file, content)
+    return content
+
+
+def build_library(
+    lib: str, data: str = "source", target_dir: str | None = None, clean: bool = False
+) -> typing.Dict[str, typing.Any]:
+    """Generate a library.
+
+    The library is generated and formatted in a temporary folder, then only the files whose
+    content has changed are written to the target folder. Files that are not written keep their
+    modification times, so build tools do not recompile them.
+
+    Args:
+        lib: The name of the library
+        data: Store the points and weights as numbers in the source code ("source") or in a
+            binary data file ("binary")
+        target_dir: The directory to write the library to (default: library/{lib}.build)
+        clean: If True, the target directory is deleted before the library is generated
+
+    Returns:
+        A timing report, containing the time taken to generate each file, the total time spent
+        generating, formatting and building the library, the files that were written and
+        removed, and the printed output
+    """
+    start = datetime.now()
+    if lib not in libraries():
+        raise ValueError(f"Unknown library: {lib}")
+    if data == "binary" and lib not in binary_data_files:
+        raise ValueError(f"Binary data is not supported by the {lib} library")
+
+    source_dir = join(library_path(), lib)
+    if target_dir is None:
+        target_dir = join(library_path(), f"{lib}.build")
+    manifest_file = join(
+        os.path.dirname(os.path.realpath(target_dir)),
+        f".{os.path.basename(os.path.realpath(target_dir))}.json",
+    )
+    if clean:
+        if os.path.isdir(target_dir):
+            shutil.rmtree(target_dir)
+        if os.path.isfile(manifest_file):
+            os.remove(manifest_file)
+    os.makedirs(target_dir, exist_ok=True)
+
+    # Abbreviated names are assigned in the order they are first used, so they are reset to make
+    # the names in each library independent of the libraries generated before it
+    generate_qr.abbrv_names.clear()
+
+    output = io.StringIO()
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = join(tmp, "output")
+        os.mkdir(output_dir)
+        if data == "binary":
+            # Replace the templates that contain the points and weights with loaders
+            merged_dir = join(tmp, "source")
+            shutil.copytree(source_dir, merged_dir)
+            shutil.copytree(join(library_path(), "binary", lib), merged_dir, dirs_exist_ok=True)
+            source_dir = merged_dir
+
+        with contextlib.redirect_stdout(output), profiling.stage("library.generate", library=lib):
+            generate.folder.generate(
+                source_dir,
+                output_dir,
+                loop_targets=_loop_targets(),
+                extra_subs=_extra_subs,
+                print_timing=True,
+            )
+
+            if data == "binary":
+                data_start = datetime.now()
+                print(binary_data_files[lib], end="", flush=True)
+                families, domains = load_rules()
+                catalogue.write_library_data(
+                    families, domains, join(output_dir, binary_data_files[lib])
+                )
+                data_end = datetime.now()
+                print(f" (completed in {(data_end - data_start).total_seconds():.2f}s)")
+        generated = datetime.now()
+
+        if lib in format_commands:
+            with profiling.stage("library.format", library=lib):
+                result = subprocess.run(
+                    format_commands[lib], cwd=output_dir, capture_output=True, text=True
+                )
+            output.write(result.stdout + result.stderr)
+        formatted = datetime.now()
+
+        with profiling.stage("library.update", library=lib) as info:
+            written, removed = update_folder(output_dir, target_dir, manifest_file)
+            info["bytes"] = profiling.file_size(*written)
+    end = datetime.now()
+    print(
+        f"{lib}: wrote {len(written)} file{'' if len(written) == 1 else 's'}, "
+        f"removed {len(removed)} file{'' if len(removed) == 1 else 's'}",
+        file=output,
+    )
+
+    files = []
+    for line in output.getvalue().split("\n"):
+        if m := _timing_line.match(line):
+            files.append({"file": m[1], "item": m[2], "time": float(m[3])})
+
+    return {
+        "library": lib,
+        "data": data,
+        "files": files,
+        "written": [os.path.relpath(f, target_dir) for f in written],
+        "removed": [os.path.relpath(f, target_dir) for f in removed],
+        "generate": (generated - start).total_seconds(),
+        "format": (formatted - generated).total_seconds(),
+        "update": (end - formatted).total_seconds(),
+        "total": (end - start).total_seconds(),
+        "output": output.getvalue(),
+    }
+
+
+def _build(job: LibraryJob) -> LibraryResult:
+    """Generate a single library.
+
+    Args:
+        job: The name of the library, how to store the points and weights, and whether to
+            delete the library before generating it
+
+    Returns:
+        A timing report, an error message if generating the library failed, and the events
+        recorded by the profiler
+    """
+    lib, data, clean = job
+    try:
+        return build_library(lib, data, clean=clean), None, profiling.collect()
+    except Exception as e:
+        return {"library": lib, "data": data}, f"{type(e).__name__}: {e}", profiling.collect()
+
+
+def build_libraries(
+    libs: typing.List[str], data: str = "source", processes: int = 1, clean: bool = False
+) -> typing.Dict[str, typing.Any]:
+    """Generate libraries.
+
+    The rules are loaded once before any library is generated. When more than one process is
+    used, each library is generated in its own process.
+
+    Args:
+        libs: The names of the libraries
+        data: Store the points and weights as numbers in the source code ("source") or in a
+            binary data file ("binary")
+        processes: The number of processes to use
+        clean: If True, each library is deleted before it is generated
+
+    Returns:
+        A timing report for the whole build and for each library
+    """
+    start = datetime.now()
+    load_rules()
+    loaded = datetime.now()
+
+    processes = max(1, min(processes, len(libs)))
+    # Libraries that are formatted after they are generated take longest, so are started first
+    jobs = sorted(
+        [(lib, data, clean) for lib in libs], key=lambda job: job[0] not in format_commands
+    )
+    if processes > 1:
+        with multiprocessing.Pool(
+            processes,
+            initializer=profiling.init_worker,
+            initargs=(settings.root_path, profiling.enabled()),
+        ) as pool:
+            results = pool.map(_build, jobs, chunksize=1)
+    else:
+        results = [_build(job) for job in jobs]
+    for _, _, events in results:
+        profiling.add_events(events)
+    end = datetime.now()
+
+    errors = []
+    reports = {}
+    for (lib, _, _), (report, error, _) in zip(jobs, results):
+        reports[lib] = report
+        if error is not None:
+            errors.append(f"{lib}: {error}")
+    reports = {lib: reports[lib] for lib in libs}
+    for report in reports.values():
+        if "output" in report:
+            print(report.pop("output"), end="")
+
+    print(f"Loaded rules in {(loaded - start).total_seconds():.2f}s")
+    for lib, report in reports.items():
+        if "total" in report:
+            print(
+                f"  {lib}: generated in {report['generate']:.2f}s, "
+                f"formatted in {report['format']:.2f}s"
+            )
+    print(
+        f"Built {len(jobs)} librar{'y' if len(jobs) == 1 else 'ies'} using {processes} process"
+        f"{'' if processes == 1 else 'es'} in {(end - start).total_seconds():.2f}s"
+    )
+    if len(errors) > 0:
+        raise RuntimeError("Building libraries failed:\n" + "\n".join(errors))
+    return {
+        "load": (loaded - start).total_seconds(),
+        "total": (end - start).total_seconds(),
+        "processes": processes,
+        "libraries": reports,
+    }
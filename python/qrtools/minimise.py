@@ -0,0 +1,598 @@
+"""Finding quadrature rules with fewer points.
+
+Rules are found using node elimination followed by Gauss--Newton refinement, as described by
+Xiao and Gimbutas: starting from a rule that integrates every polynomial of a given degree
+exactly, the point that contributes least to the rule is removed, then the remaining points and
+weights are refined using the Gauss--Newton method until the rule is exact again. This is
+repeated until no more points can be removed while keeping every weight positive and every point
+inside the domain.
+
+Symmetric rules on intervals, triangles and tetrahedra can be found in the same way by working
+with the orbits of the rule: whole orbits are removed or replaced by smaller orbits, and the
+weight and distinct coordinates of each orbit are refined, so that the rule remains invariant
+under every symmetry of the domain.
+"""
+
+import json
+import os
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from qrtools import conical, moments, orbits, verification
+from qrtools.rules import QRule, QRuleSingle, barycentric, orbit_rule_file, rule_file, vertices
+
+Rule = typing.Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+
+# The residual below which the Gauss--Newton method is considered to have converged
+tolerance = 1e-14
+
+
+def product_rule(domain: str, order: int) -> Rule:
+    """Get a product rule that integrates polynomials of degree 2*order-1 exactly.
+
+    Tensor products of Gauss--Legendre rules are used on intervals, quadrilaterals and
+    hexahedra, conical product rules are used on simplices and pyramids, and the product of
+    a conical product rule and a Gauss--Legendre rule is used on triangular prisms.
+
+    Args:
+        domain: The domain
+        order: The number of points in each direction
+
+    Returns:
+        The barycentric coordinates of the points, one point per row, and the weights
+    """
+    match domain:
+        case "interval" | "quadrilateral" | "hexahedron":
+            tdim = len(vertices(domain)[0])
+            x, w = conical.gauss_jacobi(order, 0)
+            points = np.array([c.reshape(-1) for c in np.meshgrid(*[x] * tdim, indexing="ij")]).T
+            weights = np.prod([c.reshape(-1) for c in np.meshgrid(*[w] * tdim, indexing="ij")], 0)
+        case "triangular prism":
+            tp, tw = conical.conical_product("triangle", order)
+            x, w = conical.gauss_jacobi(order, 0)
+            triangle = tp @ np.asarray(vertices("triangle"))
+            points = np.hstack([np.repeat(triangle, order, 0), np.tile(x, len(tw))[:, None]])
+            weights = np.outer(tw, w).reshape(-1)
+        case _:
+            return conical.conical_product(domain, order)
+    return barycentric(domain, points), weights
+
+
+def inside(domain: str, points: npt.NDArray[np.float64]) -> bool:
+    """Check if points are in the interior of a reference domain.
+
+    Args:
+        domain: The domain
+        points: The points, one point per row
+
+    Returns:
+        True if every point is inside the domain
+    """
+    x = points.T
+    match domain:
+        case "interval" | "quadrilateral" | "hexahedron":
+            conditions = [x, 1 - x]
+        case "triangle" | "tetrahedron":
+            conditions = [x, 1 - x.sum(axis=0)[np.newaxis]]
+        case "triangular prism":
+            conditions = [x, 1 - x[:2].sum(axis=0)[np.newaxis], 1 - x[2:]]
+        case "square-based pyramid":
+            conditions = [x, 1 - x[:2] - x[2]]
+        case _:
+            raise ValueError(f"Unsupported domain: {domain}")
+    return all(bool(np.all(c > 0)) for c in conditions)
+
+
+def _jacobian(
+    points: npt.NDArray[np.float64], weights: npt.NDArray[np.float64], degree: int
+) -> typing.Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Get the integrals of monomials computed by a rule and their derivatives.
+
+    The monomials and the points are in centred coordinates, as in the moments module.
+
+    Args:
+        points: The points, in centred coordinates
+        weights: The weights
+        degree: The maximum degree of the monomials
+
+    Returns:
+        The approximate integral of each monomial, and the derivative of these with respect to
+        each weight followed by each coordinate of each point (in the order given by flattening
+        the array of points)
+    """
+    npoints, tdim = points.shape
+    e = moments.exponents(tdim, degree)
+    powers = points[:, :, np.newaxis] ** np.arange(degree + 1)
+    dims = np.arange(tdim)
+    factors = powers[:, dims, e]
+    values = np.prod(factors, axis=2)
+
+    # The derivative of c^e with respect to c is e c^(e-1)
+    derivatives = np.empty((npoints, tdim, len(e)))
+    for k in range(tdim):
+        d = factors.copy()
+        d[:, :, k] = e[:, k] * powers[:, k, np.maximum(e[:, k] - 1, 0)]
+        derivatives[:, k] = np.prod(d, axis=2)
+
+    jacobian = np.hstack(
+        [values.T, (derivatives * weights[:, np.newaxis, np.newaxis]).reshape(npoints * tdim, -1).T]
+    )
+    return weights @ values, jacobian
+
+
+def _gauss_newton(
+    domain: str,
+    x: npt.NDArray[np.float64],
+    rule: typing.Callable[[npt.NDArray[np.float64]], Rule],
+    derivative: npt.NDArray[np.float64] | None,
+    degree: int,
+    max_iterations: int,
+) -> npt.NDArray[np.float64] | None:
+    """Use the Gauss--Newton method to find the parameters of a rule that integrates exactly.
+
+    As there are usually fewer equations than unknowns, the minimum norm solution is used at
+    each step. Steps are halved if they would increase the residual or move a point outside the
+    domain.
+
+    Args:
+        domain: The domain
+        x: The initial parameters
+        rule: A function that gets the points, in centred coordinates, and weights of the rule
+            given by some parameters
+        derivative: The derivative of the weights followed by the centred coordinates of each
+            point with respect to the parameters, or None if the parameters are the weights
+            followed by the centred coordinates of each point. The rule must be an affine
+            function of the parameters
+        degree: The degree of polynomials that should be integrated exactly
+        max_iterations: The maximum number of steps
+
+    Returns:
+        The parameters, or None if the method does not converge
+    """
+    exact = moments.moments(domain, degree)
+
+    def residual(x: npt.NDArray[np.float64]) -> float:
+        integrals, _ = _jacobian(*rule(x), degree)
+        return float(np.linalg.norm(integrals - exact))
+
+    r = residual(x)
+    for _ in range(max_iterations):
+        if r < tolerance:
+            return x
+        integrals, jacobian = _jacobian(*rule(x), degree)
+        if derivative is not None:
+            jacobian = jacobian @ derivative
+        step = np.linalg.lstsq(jacobian, exact - integrals, rcond=None)[0]
+        for _ in range(30):
+            new_x = x + step
+            if inside(domain, (rule(new_x)[0] + 1) / 2):
+                new_r = residual(new_x)
+                if new_r < r:
+                    x, r = new_x, new_r
+                    break
+            step /= 2
+        else:
+            return None
+    return None
+
+
+def refine(
+    domain: str,
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    degree: int,
+    max_iterations: int = 100,
+) -> Rule | None:
+    """Refine a rule using the Gauss--Newton method so that it integrates polynomials exactly.
+
+    Args:
+        domain: The domain
+        points: The points, in reference coordinates, one point per row
+        weights: The weights
+        degree: The degree of polynomials that should be integrated exactly
+        max_iterations: The maximum number of steps
+
+    Returns:
+        The refined points and weights, or None if the method does not converge
+    """
+    npoints, tdim = points.shape
+
+    def rule(x: npt.NDArray[np.float64]) -> Rule:
+        return x[npoints:].reshape(npoints, tdim), x[:npoints]
+
+    x = _gauss_newton(
+        domain,
+        np.concatenate([weights, (2 * points - 1).reshape(-1)]),
+        rule,
+        None,
+        degree,
+        max_iterations,
+    )
+    if x is None:
+        return None
+    return (x[npoints:].reshape(npoints, tdim) + 1) / 2, x[:npoints]
+
+
+def eliminate(
+    domain: str,
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    degree: int,
+    attempts: int = 10,
+) -> Rule:
+    """Remove points from a rule while it remains exact, with positive weights and interior points.
+
+    At each stage, the points are tried in order of increasing significance: the significance of
+    a point is its weight multiplied by the sum of the squares of the monomials at the point.
+
+    Args:
+        domain: The domain
+        points: The barycentric coordinates of the points, one point per row
+        weights: The weights
+        degree: The degree of polynomials that should be integrated exactly
+        attempts: The number of points to try to remove at each stage before stopping
+
+    Returns:
+        The barycentric coordinates of the points and the weights of the smallest rule found
+    """
+    x = points @ np.asarray(vertices(domain))
+    w = np.asarray(weights, dtype=np.float64)
+    while len(w) > 1:
+        significance = w * np.sum(moments.vandermonde(2 * x - 1, degree) ** 2, axis=1)
+        for i in np.argsort(significance)[:attempts]:
+            keep = np.arange(len(w)) != i
+            # The weight of the removed point is shared between the others
+            refined = refine(domain, x[keep], w[keep] * w.sum() / w[keep].sum(), degree)
+            if refined is not None and np.all(refined[1] > 0):
+                x, w = refined
+                break
+        else:
+            break
+    return barycentric(domain, x), w
+
+
+def _orbit_parameters(rule_orbits: orbits.Orbits) -> npt.NDArray[np.float64]:
+    """Get the parameters of some orbits.
+
+    The parameters are the weight of each orbit followed by every distinct coordinate of each
+    generator except the first: the first is given by the fact that the coordinates sum to 1.
+    """
+    values = []
+    for t, g in zip(rule_orbits.types, rule_orbits.generators):
+        first = np.cumsum(orbits.multiplicities(t))[:-1]
+        values.append(g[first])
+    return np.concatenate([rule_orbits.weights] + values)
+
+
+def _parameters_to_orbits(types: typing.List[str], x: npt.NDArray[np.float64]) -> orbits.Orbits:
+    """Get the orbits of some types given by some parameters."""
+    generators = []
+    start = len(types)
+    for t in types:
+        m = np.array(orbits.multiplicities(t))
+        v = x[start : start + len(m) - 1]
+        start += len(m) - 1
+        generators.append(np.repeat(np.concatenate([[(1 - m[1:] @ v) / m[0]], v]), m))
+    return orbits.Orbits(types, np.array(generators), x[: len(types)])
+
+
+def refine_orbits(
+    domain: str, rule_orbits: orbits.Orbits, degree: int, max_iterations: int = 100
+) -> orbits.Orbits | None:
+    """Refine a symmetric rule using the Gauss--Newton method so that it integrates exactly.
+
+    The weight and distinct coordinates of each orbit are refined, so the rule remains symmetric.
+
+    Args:
+        domain: The domain
+        rule_orbits: The orbits of the rule
+        degree: The degree of polynomials that should be integrated exactly
+        max_iterations: The maximum number of steps
+
+    Returns:
+        The refined orbits, or None if the method does not converge
+    """
+    v = np.asarray(vertices(domain))
+
+    def rule(x: npt.NDArray[np.float64]) -> Rule:
+        points, weights = orbits.expand(_parameters_to_orbits(rule_orbits.types, x))
+        return 2 * points @ v - 1, weights
+
+    def flat(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        points, weights = rule(x)
+        return np.concatenate([weights, points.reshape(-1)])
+
+    # The rule is an affine function of the parameters, so its derivative is constant
+    initial = _orbit_parameters(rule_orbits)
+    origin = flat(np.zeros_like(initial))
+    derivative = np.array([flat(e) - origin for e in np.eye(len(initial))]).T
+    x = _gauss_newton(domain, initial, rule, derivative, degree, max_iterations)
+    if x is None:
+        return None
+    return _parameters_to_orbits(rule_orbits.types, x)
+
+
+def _merge(rule_orbits: orbits.Orbits, i: int) -> orbits.Orbits | None:
+    """Replace an orbit by a smaller orbit by merging the two closest coordinates of its generator.
+
+    Returns:
+        The new orbits, or None if every coordinate of the generator of the orbit is the same
+    """
+    t = rule_orbits.types[i]
+    m = orbits.multiplicities(t)
+    if len(m) == 1:
+        return None
+    values = rule_orbits.generators[i][np.cumsum(m) - 1]
+    pairs = [(a, b) for a in range(len(m)) for b in range(a + 1, len(m))]
+    a, b = min(pairs, key=lambda p: abs(values[p[0]] - values[p[1]]))
+    point = np.concatenate(
+        [
+            np.full(m[a] + m[b], (m[a] * values[a] + m[b] * values[b]) / (m[a] + m[b])),
+            np.repeat(np.delete(values, [a, b]), np.delete(m, [a, b])),
+        ]
+    )
+    otype, generator = orbits.orbit_of(point, 0.0)
+    weights = rule_orbits.weights.copy()
+    weights[i] *= orbits.orbit_size(t) / orbits.orbit_size(otype)
+    return orbits.Orbits(
+        [otype if j == i else u for j, u in enumerate(rule_orbits.types)],
+        np.vstack([rule_orbits.generators[:i], [generator], rule_orbits.generators[i + 1 :]]),
+        weights,
+    )
+
+
+def eliminate_orbits(
+    domain: str, rule_orbits: orbits.Orbits, degree: int, attempts: int = 10
+) -> orbits.Orbits:
+    """Remove or shrink orbits of a symmetric rule while it remains exact, with positive weights.
+
+    At each stage, orbits are first replaced by smaller orbits by merging the two closest
+    coordinates of their generators, in order of increasing distance between these coordinates.
+    Then whole orbits are removed, in order of increasing significance: the significance of an
+    orbit is the sum of the significance of its points, as in eliminate().
+
+    Args:
+        domain: The domain
+        rule_orbits: The orbits of the rule
+        degree: The degree of polynomials that should be integrated exactly
+        attempts: The number of orbits to try to remove and to shrink at each stage before
+            stopping
+
+    Returns:
+        The orbits of the smallest rule found
+    """
+    current = orbits.Orbits(rule_orbits.types, rule_orbits.generators, rule_orbits.weights)
+    while True:
+        points, weights = orbits.expand(current)
+        x = 2 * points @ np.asarray(vertices(domain)) - 1
+        sizes = np.array([orbits.orbit_size(t) for t in current.types])
+        significance = np.add.reduceat(
+            weights * np.sum(moments.vandermonde(x, degree) ** 2, axis=1),
+            np.concatenate([[0], np.cumsum(sizes)[:-1]]),
+        )
+        gaps = [np.diff(np.unique(g)).min(initial=np.inf) for g in current.generators]
+        candidates = [
+            merged
+            for i in np.argsort(gaps, kind="stable")[:attempts]
+            if (merged := _merge(current, int(i))) is not None
+        ]
+        if len(current.types) > 1:
+            for i in np.argsort(significance)[:attempts]:
+                keep = np.arange(len(current.types)) != i
+                # The weight of the removed orbit is shared between the others
+                candidates.append(
+                    orbits.Orbits(
+                        [t for t, k in zip(current.types, keep) if k],
+                        current.generators[keep],
+                        current.weights[keep]
+                        * (sizes @ current.weights)
+                        / (sizes[keep] @ current.weights[keep]),
+                    )
+                )
+        for c in candidates:
+            refined = refine_orbits(domain, c, degree)
+            if refined is not None and np.all(refined.weights > 0):
+                current = refined
+                break
+        else:
+            return current
+
+
+def minimise(
+    rule: QRule, degree: int | None = None, attempts: int = 10, symmetric: bool = False
+) -> QRuleSingle:
+    """Find a rule with fewer points that integrates polynomials of the same degree exactly.
+
+    Args:
+        rule: The rule to start from
+        degree: The degree of polynomials that should be integrated exactly (default: the
+            maximum exact degree of the starting rule)
+        attempts: The number of points to try to remove at each stage before stopping
+        symmetric: If True, the rule found is invariant under every symmetry of the domain and
+            is stored as orbits. The starting rule is first averaged over every symmetry, so it
+            does not need to be symmetric
+
+    Returns:
+        The rule found, with the degree as its order
+    """
+    if not isinstance(rule, QRuleSingle):
+        raise ValueError("Only rules for single integrals can be minimised")
+    assert rule.domain is not None
+    if degree is None:
+        degree = verification.max_exact_degree(rule)
+    if symmetric:
+        if rule.domain not in orbits.domains:
+            raise ValueError(f"Symmetric rules cannot be found on a {rule.domain}")
+        rule_orbits = eliminate_orbits(
+            rule.domain,
+            orbits.symmetrise(rule.arrays["points"], rule.arrays["weights"]),
+            degree,
+            attempts,
+        )
+        points, weights = orbits.expand(rule_orbits)
+        return QRuleSingle(
+            rule.domain,
+            degree,
+            points.tolist(),
+            weights.tolist(),
+            orbit_rule_file(rule.domain, degree, rule_orbits),
+            rule_orbits,
+        )
+    points, weights = eliminate(
+        rule.domain, rule.arrays["points"], rule.arrays["weights"], degree, attempts
+    )
+    return QRuleSingle(
+        rule.domain,
+        degree,
+        points.tolist(),
+        weights.tolist(),
+        rule_file(rule.domain, degree, points, weights),
+    )
+
+
+def report(rule: QRuleSingle, start: QRule) -> typing.Dict[str, typing.Any]:
+    """Get a verification report for a rule found by minimise().
+
+    Args:
+        rule: The rule found
+        start: The rule that was started from
+
+    Returns:
+        The domain, degree, number of points of each rule, maximum exact degree, smallest weight
+        and smallest barycentric coordinate of the rule found, and whether it is invariant under
+        every symmetry of the domain
+    """
+    return {
+        "domain": rule.domain,
+        "degree": rule.order,
+        "npoints": rule.npoints,
+        "start-npoints": start.npoints,
+        "max-exact-degree": verification.max_exact_degree(rule, (rule.order or 0) + 1),
+        "min-weight": float(rule.arrays["weights"].min()),
+        "min-barycentric": float(rule.arrays["points"].min()),
+        "symmetric": rule.symmetry_orbits is not None,
+    }
+
+
+def write_candidates(
+    folder: str,
+    rules: typing.List[QRule],
+    degree: int | None = None,
+    attempts: int = 10,
+    symmetric: bool = False,
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Minimise rules and write the results to .rule files with a verification report.
+
+    Each rule found is written to the file {domain}-{degree}.rule, and the report is written to
+    report.json. Rules that are not exact to the required degree or that do not have fewer points
+    than the starting rule are not written. Symmetric rules are written as orbits.
+
+    Args:
+        folder: The folder to write the files to
+        rules: The rules to start from
+        degree: The degree of polynomials that should be integrated exactly (default: the
+            maximum exact degree of each starting rule)
+        attempts: The number of points to try to remove at each stage before stopping
+        symmetric: If True, only rules that are invariant under every symmetry of the domain
+            are found
+
+    Returns:
+        The verification report of each rule, including whether it was written
+    """
+    os.makedirs(folder, exist_ok=True)
+    reports = []
+    for start in rules:
+        candidate = minimise(start, degree, attempts, symmetric)
+        r = report(candidate, start)
+        assert candidate.order is not None and candidate.domain is not None
+        r["written"] = (
+            r["max-exact-degree"] >= candidate.order
+            and r["min-weight"] > 0
+            and r["min-barycentric"] > 0
+            and candidate.npoints < start.npoints
+        )
+        if r["written"]:
+            with open(
+                os.path.join(
+                    folder, f"{candidate.domain.replace(' ', '-')}-{candidate.order}.rule"
+                ),
+                "w",
+            ) as f:
+                if candidate.orbits is not None:
+                    f.write(orbit_rule_file(candidate.domain, candidate.order, candidate.orbits))
+                else:
+                    f.write(
+                        rule_file(
+                            candidate.domain,
+                            candidate.order,
+                            candidate.arrays["points"],
+                            candidate.arrays["weights"],
+                        )
+                    )
+        reports.append(r)
+    with open(os.path.join(folder, "report.json"), "w") as f:
+        json.dump(reports, f, indent=2)
+    return reports
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from qrtools.rules import load_rule
+
+    parser = argparse.ArgumentParser(description="Find quadrature rules with fewer points")
+    parser.add_argument("output", help="The folder to write the rules found and the report to")
+    parser.add_argument(
+        "--family", default=None, help="The code of the family of rules to start from"
+    )
+    parser.add_argument(
+        "--product",
+        default=None,
+        help="Start from the product rule with this number of points in each direction",
+        type=int,
+    )
+    parser.add_argument("--domain", nargs="+", default=None, help="The domains to use")
+    parser.add_argument("--order", nargs="+", default=None, type=int, help="The orders to use")
+    parser.add_argument(
+        "--degree",
+        default=None,
+        type=int,
+        help="The degree to make the rules exact to (default: the degree of the starting rule)",
+    )
+    parser.add_argument(
+        "--attempts",
+        default=10,
+        type=int,
+        help="The number of points to try to remove at each stage before stopping",
+    )
+    parser.add_argument(
+        "--symmetric",
+        action="store_true",
+        help="Only find rules that are invariant under every symmetry of the domain",
+    )
+    args = parser.parse_args()
+
+    if (args.family is None) == (args.product is None):
+        raise ValueError("Exactly one of --family and --product must be used")
+    if args.family is not None:
+        start_rules = [
+            r
+            for r in load_rule(args.family).rules
+            if (args.domain is None or r.domain in args.domain)
+            and (args.order is None or r.order in args.order)
+        ]
+    else:
+        start_rules = []
+        for domain in args.domain or (orbits.domains if args.symmetric else moments.domains):
+            points, weights = product_rule(domain, args.product)
+            start_rules.append(
+                QRuleSingle(domain, args.product, points.tolist(), weights.tolist(), "")
+            )
+
+    for r in write_candidates(args.output, start_rules, args.degree, args.attempts, args.symmetric):
+        print(
+            f"{r['domain']} degree {r['degree']}: {r['start-npoints']} -> {r['npoints']} points"
+            f"{'' if r['written'] else ' (not written)'}"
+        )
@@ -0,0 +1,197 @@
+"""Exact moments of monomials over reference domains.
+
+The moments are the averages over a reference domain of the monomials in the centred coordinates
+2x-1, 2y-1 and 2z-1: monomials in these coordinates are much better conditioned than monomials
+in x, y and z. The moments of every monomial up to a high degree are computed as fractions the
+first time a domain is used, and stored in a table in the order given by exponents(). The table
+for a lower degree is the start of this table, so the moments can be compared to the integrals
+computed by a rule using a single matrix product with the output of vandermonde().
+"""
+
+import functools
+import math
+import typing
+from fractions import Fraction
+
+import numpy as np
+import numpy.typing as npt
+
+from qrtools.rules import vertices
+
+# Domains that the moments of monomials can be computed on
+domains = [
+    "interval",
+    "triangle",
+    "quadrilateral",
+    "tetrahedron",
+    "hexahedron",
+    "triangular prism",
+    "square-based pyramid",
+]
+
+# The degree up to which moments are computed the first time a domain of each dimension is used
+table_degree = {1: 100, 2: 50, 3: 30}
+
+
+def _compositions(total: int, parts: int) -> typing.List[typing.Tuple[int, ...]]:
+    """Get every tuple of non-negative integers of a given length with a given sum."""
+    if parts == 1:
+        return [(total,)]
+    return [(i,) + c for i in range(total, -1, -1) for c in _compositions(total - i, parts - 1)]
+
+
+@functools.cache
+def exponents(tdim: int, degree: int) -> npt.NDArray[np.int64]:
+    """Get the exponents of every monomial of at most a given degree.
+
+    Args:
+        tdim: The number of variables
+        degree: The maximum degree
+
+    Returns:
+        The exponents, one monomial per row, ordered by degree
+    """
+    return np.array(
+        [c for d in range(degree + 1) for c in _compositions(d, tdim)], dtype=np.int64
+    ).reshape(-1, tdim)
+
+
+@functools.cache
+def _expansion(k: int, kind: str) -> npt.NDArray[np.object_]:
+    """Get the integer coefficients of a polynomial used to integrate (2x-1)^k.
+
+    The coefficient of t^b is comb(k, b) 2^b (-1)^(k-b), which is the coefficient of x^b in
+    (2x-1)^k, multiplied by b! if kind is "factorial", or divided by b+1 and multiplied by k+1 if
+    kind is "integral".
+    """
+    match kind:
+        case "factorial":
+            c = [math.comb(k, b) * math.factorial(b) for b in range(k + 1)]
+        case "integral":
+            c = [math.comb(k + 1, b + 1) for b in range(k + 1)]
+        case _:
+            raise ValueError(f"Unsupported kind: {kind}")
+    return np.array([i * 2**b * (-1) ** (k - b) for b, i in enumerate(c)], dtype=object)
+
+
+def _interval_moment(k: int) -> Fraction:
+    """Get the average of (2x-1)^k over the interval [0, 1]."""
+    return Fraction(1, k + 1) if k % 2 == 0 else Fraction(0)
+
+
+def _simplex_moment(e: typing.Tuple[int, ...]) -> Fraction:
+    """Get the average of a monomial in centred coordinates over a reference simplex.
+
+    The average of x^b over an n-dimensional simplex is n! b_1! ... b_n! / (|b| + n)!, so after
+    expanding the monomial in x, only the sum |b| of the exponents of each term is needed.
+    """
+    n = len(e)
+    c = functools.reduce(np.convolve, [_expansion(i, "factorial") for i in e])
+    f = math.factorial(sum(e) + n)
+    return Fraction(
+        sum(int(i) * (f // math.factorial(s + n)) for s, i in enumerate(c)),
+        f // math.factorial(n),
+    )
+
+
+def _pyramid_moment(e: typing.Tuple[int, ...]) -> Fraction:
+    """Get the average of a monomial in centred coordinates over the reference pyramid.
+
+    The integral of x^a y^b z^c over the pyramid is c! (a+b+2)! / ((a+b+c+3)! (a+1) (b+1)).
+    """
+    xy = np.convolve(_expansion(e[0], "integral"), _expansion(e[1], "integral"))
+    xy = xy * np.array([math.factorial(s + 2) for s in range(len(xy))], dtype=object)
+    c = np.convolve(xy, _expansion(e[2], "factorial"))
+    f = math.factorial(sum(e) + 3)
+    return Fraction(
+        3 * sum(int(i) * (f // math.factorial(s + 3)) for s, i in enumerate(c)),
+        f * (e[0] + 1) * (e[1] + 1),
+    )
+
+
+def moment(domain: str, e: typing.Tuple[int, ...]) -> Fraction:
+    """Get the exact average of a monomial in centred coordinates over a reference domain.
+
+    Args:
+        domain: The reference domain
+        e: The exponent of each centred coordinate
+
+    Returns:
+        The integral of the monomial divided by the volume of the domain
+    """
+    match domain:
+        case "interval" | "quadrilateral" | "hexahedron":
+            return math.prod((_interval_moment(i) for i in e), start=Fraction(1))
+        case "triangle" | "tetrahedron":
+            return _simplex_moment(e)
+        case "triangular prism":
+            return _simplex_moment(e[:2]) * _interval_moment(e[2])
+        case "square-based pyramid":
+            return _pyramid_moment(e)
+        case _:
+            raise ValueError(f"Unsupported domain: {domain}")
+
+
+@functools.cache
+def _table(
+    domain: str, degree: int
+) -> typing.Tuple[typing.Tuple[Fraction, ...], npt.NDArray[np.float64]]:
+    """Compute the moments of every monomial of at most a given degree over a domain."""
+    tdim = len(vertices(domain)[0])
+    exact = tuple(moment(domain, tuple(e)) for e in exponents(tdim, degree).tolist())
+    values = np.array([float(m) for m in exact])
+    values.flags.writeable = False
+    return exact, values
+
+
+def _lookup(
+    domain: str, degree: int
+) -> typing.Tuple[typing.Tuple[typing.Tuple[Fraction, ...], npt.NDArray[np.float64]], int]:
+    """Get the table that contains the moments up to a given degree and the number of moments."""
+    if domain not in domains:
+        raise ValueError(f"Unsupported domain: {domain}")
+    tdim = len(vertices(domain)[0])
+    return _table(domain, max(degree, table_degree[tdim])), math.comb(degree + tdim, tdim)
+
+
+def exact_moments(domain: str, degree: int) -> typing.List[Fraction]:
+    """Get the exact averages of every monomial of at most a given degree over a domain.
+
+    Args:
+        domain: The reference domain
+        degree: The maximum degree
+
+    Returns:
+        The average of each monomial, in the order given by exponents()
+    """
+    (exact, _), n = _lookup(domain, degree)
+    return list(exact[:n])
+
+
+def moments(domain: str, degree: int) -> npt.NDArray[np.float64]:
+    """Get the averages of every monomial of at most a given degree over a domain.
+
+    Args:
+        domain: The reference domain
+        degree: The maximum degree
+
+    Returns:
+        The average of each monomial, in the order given by exponents(), as a read-only array
+    """
+    (_, values), n = _lookup(domain, degree)
+    return values[:n]
+
+
+def vandermonde(points: npt.NDArray[np.float64], degree: int) -> npt.NDArray[np.float64]:
+    """Evaluate every monomial of at most a given degree at some points.
+
+    Args:
+        points: The points, one point per row
+        degree: The maximum degree
+
+    Returns:
+        The value of each monomial (column) at each point (row)
+    """
+    e = exponents(points.shape[1], degree)
+    powers = points[:, :, np.newaxis] ** np.arange(degree + 1)
+    return np.prod(powers[:, np.arange(points.shape[1]), e], axis=2)
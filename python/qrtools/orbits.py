@@ -0,0 +1,251 @@
+"""Symmetry orbits of quadrature rules.
+
+The symmetries of an interval, triangle or tetrahedron are the permutations of the barycentric
+coordinates of a point. A rule that is invariant under every symmetry can be stored as a set of
+orbits: each orbit is given by one generator point, its type and the weight shared by every point
+in the orbit.
+
+The type of an orbit is written as S followed by the number of times each distinct coordinate of
+the generator is repeated, in decreasing order: for example, on a triangle an S3 orbit is the
+midpoint, an S21 orbit contains the three points (a, a, b), (a, b, a) and (b, a, a), and an S111
+orbit contains six points. The coordinates of a generator are written in the same order as in the
+type, with equal coordinates next to each other.
+"""
+
+import functools
+import itertools
+import math
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+# Domains on which rules can be stored as orbits
+domains = ["interval", "triangle", "tetrahedron"]
+
+# The largest difference between two numbers that are considered to be equal
+tolerance = 1e-13
+
+
+class Orbits(typing.NamedTuple):
+    """The orbits of a rule."""
+
+    types: typing.List[str]
+    generators: npt.NDArray[np.float64]
+    weights: npt.NDArray[np.float64]
+    # The position in the expanded orbits of each point of the rule, or None if the points of
+    # the rule are in the order of the orbits
+    order: npt.NDArray[np.int64] | None = None
+
+    @property
+    def npoints(self) -> int:
+        """Get the number of points in the rule."""
+        return sum(orbit_size(t) for t in self.types)
+
+
+def multiplicities(otype: str) -> typing.List[int]:
+    """Get the number of times each distinct coordinate of a generator is repeated."""
+    if not otype.startswith("S") or not otype[1:].isdigit():
+        raise ValueError(f"Invalid orbit type: {otype}")
+    return [int(i) for i in otype[1:]]
+
+
+@functools.cache
+def permutations(otype: str) -> npt.NDArray[np.int64]:
+    """Get the permutations that map a generator to each point in its orbit.
+
+    Args:
+        otype: The type of the orbit
+
+    Returns:
+        For each point in the orbit (row), the index of the coordinate of the generator that
+        gives each of its coordinates
+    """
+    m = multiplicities(otype)
+    first = np.cumsum([0] + m[:-1])
+    labels = [i for i, j in enumerate(m) for _ in range(j)]
+    out = np.array(
+        [[first[i] for i in p] for p in sorted(set(itertools.permutations(labels)))],
+        dtype=np.int64,
+    )
+    out.flags.writeable = False
+    return out
+
+
+def orbit_size(otype: str) -> int:
+    """Get the number of points in an orbit of a given type."""
+    m = multiplicities(otype)
+    return math.factorial(sum(m)) // math.prod(math.factorial(i) for i in m)
+
+
+def expand(orbits: Orbits) -> typing.Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Get the points and weights of a rule from its orbits.
+
+    The points of each orbit are computed together for every orbit of the same type.
+
+    Args:
+        orbits: The orbits
+
+    Returns:
+        The points, one point per row, and the weights. If the order of the points is not given
+        in the orbits, the points are in the order of the orbits
+    """
+    types = np.array(orbits.types)
+    sizes = np.array([orbit_size(t) for t in orbits.types], dtype=np.int64)
+    start = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    tdim = orbits.generators.shape[1] if len(orbits.types) > 0 else 0
+    points = np.empty((sizes.sum(), tdim))
+    weights = np.repeat(orbits.weights, sizes)
+    for otype in set(orbits.types):
+        i = np.where(types == otype)[0]
+        p = permutations(otype)
+        rows = start[i, np.newaxis] + np.arange(len(p))
+        points[rows.reshape(-1)] = orbits.generators[i][:, p].reshape(-1, tdim)
+    if orbits.order is not None:
+        return points[orbits.order], weights[orbits.order]
+    return points, weights
+
+
+def orbit_rows(orbits: Orbits) -> typing.List[npt.NDArray[np.int64]]:
+    """Get the position in the rule of each point in each orbit.
+
+    Args:
+        orbits: The orbits
+
+    Returns:
+        For each orbit, the position in the rule of each point in the orbit, in the order given
+        by permutations()
+    """
+    sizes = [orbit_size(t) for t in orbits.types]
+    start = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    source = np.arange(start[-1]) if orbits.order is None else np.argsort(orbits.order)
+    return [source[a:b] for a, b in zip(start[:-1], start[1:])]
+
+
+def point_order(rows: typing.List[npt.NDArray[np.int64]]) -> npt.NDArray[np.int64] | None:
+    """Get the position in the expanded orbits of each point of a rule.
+
+    Args:
+        rows: For each orbit, the position in the rule of each point in the orbit, in the order
+            given by permutations()
+
+    Returns:
+        The position in the expanded orbits of each point of the rule, or None if the points
+        of the rule are in the order of the orbits
+    """
+    source = np.concatenate(rows).astype(np.int64) if len(rows) > 0 else np.zeros(0, np.int64)
+    if sorted(source.tolist()) != list(range(len(source))):
+        raise ValueError("The positions of the points do not include every point once")
+    if np.array_equal(source, np.arange(len(source))):
+        return None
+    order = np.empty(len(source), dtype=np.int64)
+    order[source] = np.arange(len(source))
+    return order
+
+
+def orbit_of(
+    point: npt.NDArray[np.float64], tolerance: float = tolerance
+) -> typing.Tuple[str, npt.NDArray[np.float64]]:
+    """Get the type and generator of the orbit that contains a point.
+
+    Args:
+        point: The barycentric coordinates of the point
+        tolerance: The largest difference between two numbers that are considered to be equal
+
+    Returns:
+        The type of the orbit, and its generator, which is made from the coordinates of the point
+    """
+    # Group the coordinates of the point that are equal
+    values = np.sort(point)[::-1]
+    group = np.concatenate([[0], np.cumsum(np.diff(values) < -tolerance)])
+    m = np.bincount(group)
+    first = np.concatenate([[0], np.cumsum(m)[:-1]])
+    order = sorted(range(len(m)), key=lambda g: (-m[g], -values[first[g]]))
+    otype = "S" + "".join(f"{m[g]}" for g in order)
+    return otype, np.repeat(values[first[order]], m[order])
+
+
+def symmetrise(
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    tolerance: float = tolerance,
+) -> Orbits:
+    """Get the orbits of a rule averaged over every permutation of the barycentric coordinates.
+
+    The result integrates every polynomial that the rule integrates exactly. Each point of the
+    rule is replaced by its orbit, with its weight shared between the points of the orbit, and
+    orbits that are the same are combined.
+
+    Args:
+        points: The barycentric coordinates of the points, one point per row
+        weights: The weights
+        tolerance: The largest difference between two numbers that are considered to be equal
+
+    Returns:
+        The orbits, in the order of the first point of the rule in each orbit
+    """
+    types: typing.List[str] = []
+    generators: typing.List[npt.NDArray[np.float64]] = []
+    orbit_weights: typing.List[float] = []
+    for p, w in zip(np.asarray(points, dtype=np.float64), np.asarray(weights, dtype=np.float64)):
+        otype, generator = orbit_of(p, tolerance)
+        for i, (t, g) in enumerate(zip(types, generators)):
+            if t == otype and np.abs(g - generator).max() <= tolerance:
+                orbit_weights[i] += w / orbit_size(otype)
+                break
+        else:
+            types.append(otype)
+            generators.append(generator)
+            orbit_weights.append(w / orbit_size(otype))
+    return Orbits(types, np.array(generators), np.array(orbit_weights))
+
+
+def find_orbits(
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    tolerance: float = tolerance,
+) -> Orbits | None:
+    """Split the points of a rule into orbits.
+
+    The generator and weight of each orbit are taken from the first point of the orbit in the
+    rule, so no values are changed, and the position of each point in the rule is recorded so
+    that expand() gives the points and weights in their original order. If the tolerance is 0,
+    the points and weights given by expand() are identical to the input.
+
+    Args:
+        points: The barycentric coordinates of the points, one point per row
+        weights: The weights
+        tolerance: The largest difference between two numbers that are considered to be equal
+
+    Returns:
+        The orbits, or None if the rule is not invariant under every permutation of the
+        barycentric coordinates
+    """
+    points = np.asarray(points, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    unused = np.ones(len(points), dtype=bool)
+    types = []
+    generators = []
+    orbit_weights = []
+    rows = []
+    for i in range(len(points)):
+        if not unused[i]:
+            continue
+        otype, generator = orbit_of(points[i], tolerance)
+
+        # Find the point that matches each point in the orbit
+        images = generator[permutations(otype)]
+        matches = (np.abs(points[:, np.newaxis] - images).max(axis=2) <= tolerance) & unused[
+            :, np.newaxis
+        ]
+        if not np.all(matches.sum(axis=0) == 1):
+            return None
+        j = matches.argmax(axis=0)
+        if len(set(j)) != len(j) or np.abs(weights[j] - weights[i]).max() > tolerance:
+            return None
+        unused[j] = False
+        types.append(otype)
+        generators.append(generator)
+        orbit_weights.append(weights[i])
+        rows.append(j)
+    return Orbits(types, np.array(generators), np.array(orbit_weights), point_order(rows))
@@ -0,0 +1,213 @@
+"""Opt-in profiling of the stages of a build."""
+
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import typing
+
+from qrtools import settings
+
+Event = typing.Dict[str, typing.Any]
+
+# The events recorded in this process, or None if profiling is disabled
+_events: typing.List[Event] | None = None
+
+
+def enable():
+    """Start recording the time taken by each stage of the build."""
+    global _events
+    if _events is None:
+        _events = []
+
+
+def disable():
+    """Stop recording and discard the recorded events."""
+    global _events
+    _events = None
+
+
+def enabled() -> bool:
+    """Check if profiling is enabled."""
+    return _events is not None
+
+
+def events() -> typing.List[Event]:
+    """Get the events recorded in this process."""
+    return [] if _events is None else list(_events)
+
+
+def collect() -> typing.List[Event]:
+    """Get and remove the events recorded in this process, so they can be sent to the parent."""
+    if _events is None:
+        return []
+    out = list(_events)
+    _events.clear()
+    return out
+
+
+def add_events(new_events: typing.List[Event]):
+    """Add events that were recorded in another process."""
+    if _events is not None:
+        _events.extend(new_events)
+
+
+def init_worker(root_path: str, profile: bool):
+    """Initialise a worker process.
+
+    Args:
+        root_path: The root path of the repository
+        profile: If True, profiling is enabled in the worker
+    """
+    settings.set_root_path(root_path)
+    if profile:
+        enable()
+
+
+@contextlib.contextmanager
+def stage(name: str, **info: typing.Any) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Record the time taken by a stage of the build.
+
+    Args:
+        name: The name of the stage
+        info: Information about the stage, such as the rule family being processed
+
+    Returns:
+        A dictionary that more information, such as the number of bytes written, can be added to
+    """
+    if _events is None:
+        yield info
+        return
+    start = time.time()
+    start_counter = time.perf_counter()
+    try:
+        yield info
+    finally:
+        _events.append(
+            {
+                "name": name,
+                "start": start,
+                "time": time.perf_counter() - start_counter,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "info": info,
+            }
+        )
+
+
+def profiled(
+    name: str, info: typing.Callable[..., typing.Dict[str, typing.Any]] | None = None
+) -> typing.Callable[[typing.Callable], typing.Callable]:
+    """Record the time taken by every call to a function.
+
+    When profiling is disabled, the only cost is checking if it is enabled.
+
+    Args:
+        name: The name of the stage
+        info: A function that is called with the function's output followed by its inputs and
+            returns information about the call
+
+    Returns:
+        A decorator
+    """
+
+    def decorator(f: typing.Callable) -> typing.Callable:
+        @functools.wraps(f)
+        def wrapped(*args, **kwargs):
+            if _events is None:
+                return f(*args, **kwargs)
+            with stage(name) as s:
+                out = f(*args, **kwargs)
+                if info is not None:
+                    s.update(info(out, *args, **kwargs))
+            return out
+
+        return wrapped
+
+    return decorator
+
+
+def file_size(*filenames: str) -> int:
+    """Get the total size of some files, ignoring files that do not exist."""
+    return sum(os.path.getsize(f) for f in filenames if os.path.isfile(f))
+
+
+def summary(events: typing.List[Event]) -> typing.Dict[str, typing.Any]:
+    """Summarise the time taken by each stage and each rule family.
+
+    Args:
+        events: The recorded events
+
+    Returns:
+        The number of calls, total time and bytes written for each stage, and for each stage of
+        each rule family
+    """
+    stages: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    families: typing.Dict[str, typing.Dict[str, typing.Dict[str, typing.Any]]] = {}
+    for e in events:
+        totals = [stages.setdefault(e["name"], {"count": 0, "time": 0.0, "bytes": 0})]
+        if "family" in e["info"]:
+            totals.append(
+                families.setdefault(e["info"]["family"], {}).setdefault(
+                    e["name"], {"count": 0, "time": 0.0, "bytes": 0}
+                )
+            )
+        for t in totals:
+            t["count"] += 1
+            t["time"] += e["time"]
+            t["bytes"] += e["info"].get("bytes", 0)
+    return {
+        "stages": dict(sorted(stages.items(), key=lambda s: -s[1]["time"])),
+        "families": dict(sorted(families.items())),
+    }
+
+
+def chrome_trace(events: typing.List[Event]) -> typing.Dict[str, typing.Any]:
+    """Convert events to the Chrome trace event format.
+
+    The trace can be viewed using chrome://tracing or https://ui.perfetto.dev.
+
+    Args:
+        events: The recorded events
+
+    Returns:
+        The trace
+    """
+    start = min((e["start"] for e in events), default=0.0)
+    return {
+        "traceEvents": [
+            {
+                "name": e["name"],
+                "cat": e["name"].split(".")[0],
+                "ph": "X",
+                "ts": (e["start"] - start) * 1e6,
+                "dur": e["time"] * 1e6,
+                "pid": e["pid"],
+                "tid": e["tid"],
+                "args": e["info"],
+            }
+            for e in sorted(events, key=lambda e: e["start"])
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def write_profile(filename: str, format: str = "json"):
+    """Write the recorded events to a file.
+
+    Args:
+        filename: The file to write to
+        format: The format of the file: "json" for a summary of each stage followed by every
+            event, or "chrome" for a Chrome trace
+    """
+    match format:
+        case "json":
+            content = {**summary(events()), "events": events()}
+        case "chrome":
+            content = chrome_trace(events())
+        case _:
+            raise ValueError(f"Unsupported format: {format}")
+    with open(filename, "w") as f:
+        json.dump(content, f)
@@ -1,11 +1,14 @@
 """Quadrature rules."""
 
+import functools
 import os
 import re
 import typing
 
+import numpy as np
+import numpy.typing as npt
 import yaml
-from qrtools import settings
+from qrtools import orbits, profiling, settings
 from webtools.citations import make_bibtex, markup_citation
 from webtools.tools import html_local
 
@@ -46,29 +49,280 @@ def dim(domain: str | None) -> int:
     return 10
 
 
+def vertices(domain: str | None) -> typing.List[PointND]:
+    """Get the vertices of a reference domain, in the order used by barycentric coordinates."""
+    match domain:
+        case "interval":
+            return [(0.0,), (1.0,)]
+        case "triangle":
+            return [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+        case "quadrilateral":
+            return [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+        case "tetrahedron":
+            return [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]
+        case "hexahedron":
+            return [
+                (0.0, 0.0, 0.0),
+                (1.0, 0.0, 0.0),
+                (0.0, 1.0, 0.0),
+                (1.0, 1.0, 0.0),
+                (0.0, 0.0, 1.0),
+                (1.0, 0.0, 1.0),
+                (0.0, 1.0, 1.0),
+                (1.0, 1.0, 1.0),
+            ]
+        case "triangular prism":
+            return [
+                (0.0, 0.0, 0.0),
+                (1.0, 0.0, 0.0),
+                (0.0, 1.0, 0.0),
+                (0.0, 0.0, 1.0),
+                (1.0, 0.0, 1.0),
+                (0.0, 1.0, 1.0),
+            ]
+        case "square-based pyramid":
+            return [
+                (0.0, 0.0, 0.0),
+                (1.0, 0.0, 0.0),
+                (0.0, 1.0, 0.0),
+                (1.0, 1.0, 0.0),
+                (0.0, 0.0, 1.0),
+            ]
+        case _:
+            raise ValueError(f"Unsupported domain: {domain}")
+
+
+def barycentric(domain: str | None, points: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Get the barycentric coordinates of points in a reference domain.
+
+    On domains that are not simplices, the barycentric coordinates are not unique: the
+    coordinates used are the values of the lowest degree Lagrange basis functions of the domain.
+
+    Args:
+        domain: The reference domain
+        points: The points, one point per row
+
+    Returns:
+        The barycentric coordinates, one point per row, in the order given by vertices()
+    """
+    x = np.asarray(points, dtype=np.float64).T
+    match domain:
+        case "interval" | "triangle" | "tetrahedron":
+            return np.array([1 - x.sum(axis=0), *x]).T
+        case "quadrilateral":
+            return np.array(
+                [(1 - x[0]) * (1 - x[1]), x[0] * (1 - x[1]), (1 - x[0]) * x[1], x[0] * x[1]]
+            ).T
+        case "hexahedron":
+            return np.array(
+                [
+                    a * b * c
+                    for c in [1 - x[2], x[2]]
+                    for b in [1 - x[1], x[1]]
+                    for a in [1 - x[0], x[0]]
+                ]
+            ).T
+        case "triangular prism":
+            return np.array(
+                [t * c for c in [1 - x[2], x[2]] for t in [1 - x[0] - x[1], x[0], x[1]]]
+            ).T
+        case "square-based pyramid":
+            # Collapsed coordinates of the base, which are arbitrary at the apex
+            height = 1 - x[2]
+            scale = np.where(height > 0, height, 1)
+            xi = x[0] / scale
+            eta = x[1] / scale
+            return np.array(
+                [
+                    (1 - xi) * (1 - eta) * height,
+                    xi * (1 - eta) * height,
+                    (1 - xi) * eta * height,
+                    xi * eta * height,
+                    x[2],
+                ]
+            ).T
+        case _:
+            raise ValueError(f"Unsupported domain: {domain}")
+
+
+def _positional(n: float) -> str:
+    """Write a number using the fewest digits that identify it, without scientific notation."""
+    return np.format_float_positional(n, unique=True, trim="0")
+
+
+def rule_file(
+    domain: str,
+    order: int,
+    points: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+) -> str:
+    """Get the content of a .rule file for a rule for a single integral.
+
+    Args:
+        domain: The domain of the rule
+        order: The order of the rule
+        points: The barycentric coordinates of the points, one point per row
+        weights: The weights
+
+    Returns:
+        The content of the file, with every number written to full precision without using
+        scientific notation
+    """
+    points = np.vectorize(_positional, otypes=[str])(points)
+    weights = np.vectorize(_positional, otypes=[str])(weights)
+    lines = [" ".join(p) + f" | {w}" for p, w in zip(points.tolist(), weights.tolist())]
+    return f"--\ndomain: {domain}\norder: {order}\n--\n" + "\n".join(lines) + "\n"
+
+
+def orbit_rule_file(domain: str, order: int, rule_orbits: orbits.Orbits) -> str:
+    """Get the content of a .rule file for a rule for a single integral stored as orbits.
+
+    Args:
+        domain: The domain of the rule
+        order: The order of the rule
+        rule_orbits: The orbits of the rule
+
+    Returns:
+        The content of the file, with every number written to full precision without using
+        scientific notation. If the points of the rule are not in the order of the orbits, the
+        position in the rule of each point in each orbit is included at the end of each line
+    """
+    generators = np.vectorize(_positional, otypes=[str])(rule_orbits.generators)
+    weights = np.vectorize(_positional, otypes=[str])(rule_orbits.weights)
+    lines = [
+        f"{t} | " + " ".join(g) + f" | {w}"
+        for t, g, w in zip(rule_orbits.types, generators.tolist(), weights.tolist())
+    ]
+    if rule_orbits.order is not None:
+        lines = [
+            f"{line} | " + " ".join(f"{i}" for i in rows)
+            for line, rows in zip(lines, orbits.orbit_rows(rule_orbits))
+        ]
+    return f"--\ndomain: {domain}\norder: {order}\nstorage: orbits\n--\n" + "\n".join(lines) + "\n"
+
+
 def rounded(n: float, dp: int = 5) -> str:
     """Round to a number of decimal places."""
     i, j = str(n).split(".")
     return f"{i}.{j[:dp]}"
 
 
+def format_array(values: npt.NDArray[np.float64]) -> typing.List[typing.List[str]]:
+    """Format every number in a table as the shortest string that represents it exactly.
+
+    The whole table is converted to text by a single call to repr, which formats every number in
+    the same way as str, and this text is then split into rows and numbers.
+
+    Args:
+        values: The table, one row per point
+
+    Returns:
+        The formatted numbers in each row
+    """
+    if values.size == 0:
+        return [[] for _ in range(values.shape[0])]
+    return [row.split(", ") for row in repr(values.tolist())[2:-2].split("], [")]
+
+
 def to_html(content: str) -> str:
     """Convert to HTML."""
     content = content.replace("--", "&ndash;")
     return content
 
 
-def to_2d(point: PointND, origin: Point2D, axes: typing.List[Point2D]) -> Point2D:
-    """Map a point on a domain to a 2D point in an SVG."""
-    return (
-        origin[0] + sum(a[0] * p for a, p in zip(axes, point)),
-        origin[1] + sum(a[1] * p for a, p in zip(axes, point)),
+def to_2d(
+    points: npt.ArrayLike,
+    domain: typing.List[PointND],
+    origin: Point2D,
+    axes: typing.List[Point2D],
+) -> npt.NDArray[np.float64]:
+    """Map points in barycentric coordinates on a domain to 2D points in an image.
+
+    Args:
+        points: The barycentric coordinates of the points, one point per row
+        domain: The vertices of the domain
+        origin: The position of the origin in the image
+        axes: The directions of the coordinate axes in the image
+
+    Returns:
+        The 2D points, one point per row
+    """
+    return np.asarray(origin) + np.asarray(points, dtype=np.float64) @ (
+        np.asarray(domain) @ np.asarray(axes)
     )
 
 
-def from_barycentric(point: PointND, domain: typing.List[PointND]) -> PointND:
-    """Map from barycentric coordinates to a point on a domain."""
-    return tuple(sum(p * d[i] for p, d in zip(point, domain)) for i in range(len(domain[0])))
+def domain_edges(
+    domain: typing.List[PointND],
+    domain_lines: typing.List[typing.List[int]],
+    origin: Point2D,
+    axes: typing.List[Point2D],
+) -> typing.Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Get the start and end points of the edges of a domain in an image."""
+    vertices = to_2d(np.eye(len(domain)), domain, origin, axes)
+    starts = [a for lines in domain_lines for a in lines[:-1]]
+    ends = [b for lines in domain_lines for b in lines[1:]]
+    return vertices[starts], vertices[ends]
+
+
+def svg_lines(
+    starts: npt.NDArray[np.float64], ends: npt.NDArray[np.float64], colour: str, width: float
+) -> typing.List[str]:
+    """Get SVG lines."""
+    return [
+        f"<line x1='{a[0]}' y1='{a[1]}' x2='{b[0]}' y2='{b[1]}' "
+        f"stroke='{colour}' stroke-width='{width}' stroke-linecap='round' />\n"
+        for a, b in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def svg_circles(
+    centres: npt.NDArray[np.float64], weights: npt.NDArray[np.float64]
+) -> typing.List[str]:
+    """Get SVG circles showing the weights at some points."""
+    return [
+        f"<circle cx='{c[0]}' cy='{c[1]}' r='{r}' fill='{colour}' />\n"
+        for c, r, colour in zip(
+            centres.tolist(),
+            (9 * np.sqrt(np.abs(weights))).tolist(),
+            np.where(weights > 0, "red", "blue").tolist(),
+        )
+    ]
+
+
+def tikz_lines(
+    starts: npt.NDArray[np.float64], ends: npt.NDArray[np.float64], style: str
+) -> typing.List[str]:
+    """Get TikZ lines."""
+    return [
+        f"\\draw[{style}] ({a[0]},{a[1]}) -- ({b[0]},{b[1]});\n"
+        for a, b in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def tikz_circles(
+    centres: npt.NDArray[np.float64], weights: npt.NDArray[np.float64]
+) -> typing.List[str]:
+    """Get TikZ circles showing the weights at some points."""
+    return [
+        f"\\fill[{colour}] ({c[0]},{c[1]}) circle ({r});\n"
+        for c, r, colour in zip(
+            centres.tolist(),
+            (9 * np.sqrt(np.abs(weights))).tolist(),
+            np.where(weights > 0, "red", "blue").tolist(),
+        )
+    ]
+
+
+def _table_profile_info(_, rule: "QRule", filename: str) -> typing.Dict[str, typing.Any]:
+    """Get information about a call to save_html_table for the profiler."""
+    root = filename[:-5]
+    return {
+        **rule.profile_info(),
+        "bytes": profiling.file_size(
+            *[f"{root}.{ext}" for ext in ["html", "rule", "csv", "json", "npy", "npz"]]
+        ),
+    }
 
 
 class QRule:
@@ -87,6 +341,7 @@ class QRule:
         self._rule = rule
         self.family: QRuleFamily | None = None
         self.npoints = npoints
+        self._formatted: typing.Dict[str, typing.List[str]] = {}
 
     def title(self, format: str = "default") -> str:
         """Get title."""
@@ -118,26 +373,40 @@ class QRule:
             case _:
                 raise ValueError(f"Unsupported format: {format}")
 
+    def profile_info(self) -> typing.Dict[str, typing.Any]:
+        """Get information about the rule to include in the profile of a build."""
+        return {
+            "family": None if self.family is None else self.family.code,
+            "domain": self.domain,
+            "order": self.order,
+            "npoints": self.npoints,
+        }
+
     def image(self, filename: str):
         """Make image of rule."""
         if os.path.isfile(filename):
             return
-        match filename.split(".")[-1]:
-            case "png":
-                try:
-                    from cairosvg import svg2png
-                except ImportError:
-                    raise ImportError("CairoSVG is needed for plotting PNGs (pip install CairoSVG)")
-                svg = filename[:-4] + ".svg"
-                self.image(svg)
-                with open(svg) as f:
-                    svg2png(bytestring=f.read(), write_to=filename, scale=4)
-            case "svg":
-                self.svg_image(filename)
-            case "tex":
-                self.tikz_image(filename)
-            case _:
-                raise ValueError(f"Unsupported format: {filename.split('.')[-1]}")
+        format = filename.split(".")[-1]
+        with profiling.stage(f"image.{format}", **self.profile_info()) as info:
+            match format:
+                case "png":
+                    try:
+                        from cairosvg import svg2png
+                    except ImportError:
+                        raise ImportError(
+                            "CairoSVG is needed for plotting PNGs (pip install CairoSVG)"
+                        )
+                    svg = filename[:-4] + ".svg"
+                    self.image(svg)
+                    with open(svg) as f:
+                        svg2png(bytestring=f.read(), write_to=filename, scale=4)
+                case "svg":
+                    self.svg_image(filename)
+                case "tex":
+                    self.tikz_image(filename)
+                case _:
+                    raise ValueError(f"Unsupported format: {format}")
+            info["bytes"] = profiling.file_size(filename)
 
     def svg_image(self, filename: str):
         """Make SVG image of rule."""
@@ -147,10 +416,73 @@ class QRule:
         """Make TikZ image of rule."""
         raise NotImplementedError()
 
+    @property
+    def arrays(self) -> typing.Dict[str, npt.NDArray[np.float64]]:
+        """Get the points and weights as arrays."""
+        raise NotImplementedError()
+
     def save_html_table(self, filename: str):
         """Save HTML table of points and weights to a file."""
         raise NotImplementedError()
 
+    def formatted(self, array: str) -> typing.List[str]:
+        """Get the numbers in one of the rule's arrays formatted as strings.
+
+        The strings are computed the first time they are needed and reused for every later
+        call, so each number is only formatted once per rule.
+
+        Args:
+            array: The name of the array (points, first_points, second_points, weights,
+                orbit_generators or orbit_weights)
+
+        Returns:
+            The numbers in the array, flattened
+        """
+        if array not in self._formatted:
+            values = getattr(self, array)
+            if not array.endswith("weights"):
+                values = [c for p in values for c in p]
+            self._formatted[array] = [f"{c}" for c in values]
+        return self._formatted[array]
+
+    def formatted_list(
+        self,
+        array: str,
+        open: str = "[",
+        close: str = "]",
+        outer_joiner: str = ", ",
+        inner_joiner: str = ", ",
+        flat: bool = False,
+    ) -> str:
+        """Get one of the rule's arrays as a string.
+
+        Args:
+            array: The name of the array (points, first_points, second_points, weights,
+                orbit_generators or orbit_weights)
+            open: The string that opens a list
+            close: The string that closes a list
+            outer_joiner: The string between points
+            inner_joiner: The string between the coordinates of a point
+            flat: If True, the points are flattened into a single list
+
+        Returns:
+            The formatted array
+        """
+        values = self.formatted(array)
+        if flat or array.endswith("weights"):
+            return open + outer_joiner.join(values) + close
+        dim = len(getattr(self, array)[0])
+        return (
+            open
+            + outer_joiner.join(
+                [
+                    open + inner_joiner.join(values[i : i + dim]) + close
+                    for i in range(0, len(values), dim)
+                ]
+            )
+            + close
+        )
+
     def barycentric_info(self) -> str:
         """Get info about points being barycentric and truncated."""
         return (
@@ -160,6 +492,20 @@ class QRule:
             "be found in the downloads below.</div>\n"
         )
 
+    def download_links(self, filename_root: str) -> str:
+        """Get links to download the rule in each format."""
+        return "".join(
+            "<div class='small-note'>"
+            f"<a href='{filename_root}.{ext}'>&darr; Download as {name}</a></div>"
+            for ext, name in [
+                ("rule", ".rule"),
+                ("csv", "CSV"),
+                ("json", "JSON"),
+                ("npy", "NumPy array (.npy)"),
+                ("npz", "NumPy archive (.npz)"),
+            ]
+        )
+
     def first200(self, colspan: int) -> str:
         """Get row saying only first 200 points are shown."""
         return (
@@ -226,14 +572,48 @@ class QRuleSingle(QRule):
         self,
         domain: str | None,
         order: int | None,
-        points: typing.List[typing.List[float]],
-        weights: typing.List[float],
+        points: typing.List[typing.List[float]] | None,
+        weights: typing.List[float] | None,
         rule: str,
+        rule_orbits: orbits.Orbits | None = None,
     ):
-        """Create."""
-        self.points = points
-        self.weights = weights
-        super().__init__(domain, order, rule, len(points))
+        """Create.
+
+        If the rule is stored as orbits, the points and weights can be None: they are then
+        computed from the orbits the first time they are used.
+        """
+        self._points = points
+        self._weights = weights
+        self.orbits = rule_orbits
+        if points is None:
+            assert rule_orbits is not None
+            npoints = rule_orbits.npoints
+        else:
+            npoints = len(points)
+        super().__init__(domain, order, rule, npoints)
+
+    def _expand(self):
+        """Compute the points and weights from the orbits."""
+        assert self.orbits is not None
+        points, weights = orbits.expand(self.orbits)
+        self._points = points.tolist()
+        self._weights = weights.tolist()
+
+    @property
+    def points(self) -> typing.List[typing.List[float]]:
+        """Get the points."""
+        if self._points is None:
+            self._expand()
+        assert self._points is not None
+        return self._points
+
+    @property
+    def weights(self) -> typing.List[float]:
+        """Get the weights."""
+        if self._weights is None:
+            self._expand()
+        assert self._weights is not None
+        return self._weights
 
     def _get_image_config(
         self,
@@ -245,48 +625,30 @@ class QRuleSingle(QRule):
         typing.List[Point2D],
     ]:
         """Get image size, domain, domain lines, origin and axes."""
+        domain = vertices(self.domain)
         match self.domain:
             case "interval":
                 size = (220, 20)
-                domain: typing.List[PointND] = [(0.0,), (1.0,)]
                 domain_lines = [[0, 1]]
                 origin = (10.0, 10.0)
                 axes = [(200.0, 0.0)]
             case "triangle":
                 size = (220, 194)
-                domain = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
                 domain_lines = [[0, 1, 2, 0]]
                 origin = (10.0, 184.0)
                 axes = [(200.0, 0.0), (100.0, -173.2)]
             case "quadrilateral":
                 size = (220, 220)
-                domain = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
                 domain_lines = [[0, 1, 3, 2, 0]]
                 origin = (10.0, 210.0)
                 axes = [(200.0, 0.0), (0.0, -200.0)]
             case "tetrahedron":
                 size = (205, 209)
-                domain = [
-                    (0.0, 0.0, 0.0),
-                    (1.0, 0.0, 0.0),
-                    (0.0, 1.0, 0.0),
-                    (0.0, 0.0, 1.0),
-                ]
                 domain_lines = [[0, 1, 2, 0], [0, 3, 1], [3, 2]]
                 origin = (10.0, 168.5)
                 axes = [(180.0, 30.0), (185.0, -45.5), (122.0, -158.5)]
             case "hexahedron":
                 size = (223, 223)
-                domain = [
-                    (0.0, 0.0, 0.0),
-                    (1.0, 0.0, 0.0),
-                    (0.0, 1.0, 0.0),
-                    (1.0, 1.0, 0.0),
-                    (0.0, 0.0, 1.0),
-                    (1.0, 0.0, 1.0),
-                    (0.0, 1.0, 1.0),
-                    (1.0, 1.0, 1.0),
-                ]
                 domain_lines = [
                     [0, 1, 3, 2, 0],
                     [4, 5, 7, 6, 4],
@@ -299,26 +661,11 @@ class QRuleSingle(QRule):
                 axes = [(126.0, 21.0), (77.0, -49.0), (0.0, -133.0)]
             case "triangular prism":
                 size = (167, 213)
-                domain = [
-                    (0.0, 0.0, 0.0),
-                    (1.0, 0.0, 0.0),
-                    (0.0, 1.0, 0.0),
-                    (0.0, 0.0, 1.0),
-                    (1.0, 0.0, 1.0),
-                    (0.0, 1.0, 1.0),
-                ]
                 domain_lines = [[0, 1, 2, 0], [3, 4, 5, 3], [0, 3], [1, 4], [2, 5]]
                 origin = (10.0, 182.0)
                 axes = [(126.0, 21.0), (129.5, -32.0), (0.0, -140.0)]
             case "square-based pyramid":
                 size = (223, 164)
-                domain = [
-                    (0.0, 0.0, 0.0),
-                    (1.0, 0.0, 0.0),
-                    (0.0, 1.0, 0.0),
-                    (1.0, 1.0, 0.0),
-                    (0.0, 0.0, 1.0),
-                ]
                 domain_lines = [[0, 1, 3, 2, 0], [0, 4, 1], [2, 4, 3]]
                 origin = (10.0, 133.0)
                 axes = [(126.0, 21.0), (77.0, -49.0), (101.5, -123.0)]
@@ -333,32 +680,19 @@ class QRuleSingle(QRule):
         assert self.family is not None
 
         size, domain, domain_lines, origin, axes = self._get_image_config()
-
+        points = to_2d(self.points, domain, origin, axes)
+
+        svg = [
+            f"<svg width='{size[0]}' height='{size[1]}' "
+            "xmlns='http://www.w3.org/2000/svg' "
+            "xmlns:xlink='http://www.w3.org/1999/xlink'>\n",
+            svg_license(f"{self.family.name()} order {self.order}"),
+        ]
+        svg += svg_lines(*domain_edges(domain, domain_lines, origin, axes), "#000000", 1.5)
+        svg += svg_circles(points, np.asarray(self.weights))
+        svg.append("</svg>\n")
         with open(filename, "w") as f:
-            f.write(
-                f"<svg width='{size[0]}' height='{size[1]}' "
-                "xmlns='http://www.w3.org/2000/svg' "
-                "xmlns:xlink='http://www.w3.org/1999/xlink'>\n"
-            )
-            f.write(svg_license(f"{self.family.name()} order {self.order}"))
-            for lines in domain_lines:
-                for a_, b_ in zip(lines[:-1], lines[1:]):
-                    a = to_2d(domain[a_], origin, axes)
-                    b = to_2d(domain[b_], origin, axes)
-                    f.write(
-                        f"<line x1='{a[0]}' y1='{a[1]}' x2='{b[0]}' y2='{b[1]}' "
-                        "stroke='#000000' stroke-width='1.5' "
-                        "stroke-linecap='round' />\n"
-                    )
-            for p_, w in zip(self.points, self.weights):
-                p = to_2d(from_barycentric(tuple(p_), domain), origin, axes)
-                if w > 0:
-                    f.write(f"<circle cx='{p[0]}' cy='{p[1]}' r='{9 * w**0.5}' fill='red' />\n")
-                else:
-                    f.write(
-                        f"<circle cx='{p[0]}' cy='{p[1]}' r='{9 * (-w) ** 0.5}' fill='blue' />\n"
-                    )
-            f.write("</svg>\n")
+            f.write("".join(svg))
 
     def tikz_image(self, filename: str):
         """Make TikZ image of rule."""
@@ -366,23 +700,26 @@ class QRuleSingle(QRule):
         assert not os.path.isfile(filename)
 
         size, domain, domain_lines, origin, axes = self._get_image_config()
+        points = to_2d(self.points, domain, origin, axes)
 
+        tikz = [tikz_license(), "\\begin{tikzpicture}[line cap=round,line join=round]\n"]
+        tikz += tikz_lines(
+            *domain_edges(domain, domain_lines, origin, axes), "black,line width=1pt"
+        )
+        tikz += tikz_circles(points, np.asarray(self.weights))
+        tikz.append("\\end{tikzpicture}\n")
         with open(filename, "w") as f:
-            f.write(tikz_license())
-            f.write("\\begin{tikzpicture}[line cap=round,line join=round]\n")
-            for lines in domain_lines:
-                for a_, b_ in zip(lines[:-1], lines[1:]):
-                    a = to_2d(domain[a_], origin, axes)
-                    b = to_2d(domain[b_], origin, axes)
-                    f.write(f"\\draw[black,line width=1pt] ({a[0]},{a[1]}) -- ({b[0]},{b[1]});\n")
-            for p_, w in zip(self.points, self.weights):
-                p = to_2d(from_barycentric(tuple(p_), domain), origin, axes)
-                if w > 0:
-                    f.write(f"\\fill[red] ({p[0]},{p[1]}) circle ({9 * w**0.5});\n")
-                else:
-                    f.write(f"\\fill[blue] ({p[0]},{p[1]}) circle ({9 * (-w) ** 0.5});\n")
-            f.write("\\end{tikzpicture}\n")
+            f.write("".join(tikz))
 
+    @property
+    def arrays(self) -> typing.Dict[str, npt.NDArray[np.float64]]:
+        """Get the points and weights as arrays."""
+        return {
+            "points": np.asarray(self.points, dtype=np.float64),
+            "weights": np.asarray(self.weights, dtype=np.float64),
+        }
+
+    @profiling.profiled("save_html_table", _table_profile_info)
     def save_html_table(self, filename: str):
         """Save HTML table of points and weights to a file."""
         assert filename.endswith(".html")
@@ -395,31 +732,31 @@ class QRuleSingle(QRule):
         with open(f"{filename_root}.rule", "w") as f:
             f.write(f"--\n{self.family._qr}{self._rule[3:]}")
 
-        with open(filename, "w") as f:
-            f.write(self.barycentric_info())
-            f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.rule'>&darr; Download as .rule</a></div>"
-            )
-            with open(f"{filename_root}.csv", "w") as f2:
-                f2.write(",".join([f"point[{i}]" for i, _ in enumerate(self.points[0])]))
-                f2.write(",weight\n")
-                for p, w in zip(self.points, self.weights):
-                    f2.write(",".join(f"{i}" for i in p) + f",{w}\n")
+        arrays = self.arrays
+        table = np.column_stack([arrays["points"], arrays["weights"]])
+        np.save(f"{filename_root}.npy", table)
+        np.savez(f"{filename_root}.npz", points=arrays["points"], weights=arrays["weights"])
+
+        dim = arrays["points"].shape[1]
+        rows = format_array(table)
+        with open(f"{filename_root}.csv", "w") as f:
             f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.csv'>&darr; Download as CSV</a></div>"
+                ",".join([f"point[{i}]" for i in range(dim)])
+                + ",weight\n"
+                + "".join(",".join(row) + "\n" for row in rows)
             )
-            with open(f"{filename_root}.json", "w") as f2:
-                f2.write('{"points": [')
-                f2.write(", ".join("[" + ", ".join(f"{i}" for i in p) + "]" for p in self.points))
-                f2.write('], "weights": [')
-                f2.write(", ".join(f"{w}" for w in self.weights))
-                f2.write("]}")
+        with open(f"{filename_root}.json", "w") as f:
             f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.json'>&darr; Download as JSON</a></div>"
+                '{"points": ['
+                + ", ".join("[" + ", ".join(row[:dim]) + "]" for row in rows)
+                + '], "weights": ['
+                + ", ".join(row[dim] for row in rows)
+                + "]}"
             )
+
+        with open(filename, "w") as f:
+            f.write(self.barycentric_info())
+            f.write(self.download_links(filename_root_local))
             f.write("<br />\n")
             f.write("<table class='points'>\n")
             f.write("<thead>")
@@ -443,21 +780,72 @@ class QRuleSingle(QRule):
         inner_joiner: str = ", ",
     ) -> str:
         """Get a list of points as a string."""
-        return (
-            open
-            + outer_joiner.join(
-                [open + inner_joiner.join([f"{c}" for c in p]) + close for p in self.points]
-            )
-            + close
-        )
+        return self.formatted_list("points", open, close, outer_joiner, inner_joiner)
 
     def points_as_flat_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
         """Get a list of flat points as a string."""
-        return open + joiner.join([f"{c}" for p in self.points for c in p]) + close
+        return self.formatted_list("points", open, close, joiner, flat=True)
 
     def weights_as_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
         """Get a list of flat points as a string."""
-        return open + joiner.join([f"{w}" for w in self.weights]) + close
+        return self.formatted_list("weights", open, close, joiner)
+
+    @functools.cached_property
+    def symmetry_orbits(self) -> orbits.Orbits | None:
+        """Get the symmetry orbits of the rule.
+
+        If the rule is not stored as orbits, the orbits are found from its points the first time
+        they are used.
+
+        Returns:
+            The orbits, or None if the points of the rule do not come in full symmetry orbits
+        """
+        if self.orbits is not None:
+            return self.orbits
+        if self.domain not in orbits.domains:
+            return None
+        return orbits.find_orbits(self.arrays["points"], self.arrays["weights"])
+
+    @property
+    def orbit_generators(self) -> typing.List[typing.List[float]]:
+        """Get the generator of each symmetry orbit."""
+        assert self.symmetry_orbits is not None
+        return self.symmetry_orbits.generators.tolist()
+
+    @property
+    def orbit_weights(self) -> typing.List[float]:
+        """Get the weight of each symmetry orbit."""
+        assert self.symmetry_orbits is not None
+        return self.symmetry_orbits.weights.tolist()
+
+    def orbit_types_as_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
+        """Get a list of the types of the symmetry orbits as a string."""
+        assert self.symmetry_orbits is not None
+        return open + joiner.join(f'"{t}"' for t in self.symmetry_orbits.types) + close
+
+    def orbit_generators_as_list(
+        self,
+        open: str = "[",
+        close: str = "]",
+        outer_joiner: str = ", ",
+        inner_joiner: str = ", ",
+    ) -> str:
+        """Get a list of the generators of the orbits as a string."""
+        return self.formatted_list("orbit_generators", open, close, outer_joiner, inner_joiner)
+
+    def orbit_weights_as_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
+        """Get a list of the weights of the orbits as a string."""
+        return self.formatted_list("orbit_weights", open, close, joiner)
+
+    def orbit_order_as_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
+        """Get the position in the expanded orbits of each point of the rule as a string.
+
+        If the points of the rule are in the order of the orbits, "None" is returned.
+        """
+        assert self.symmetry_orbits is not None
+        if self.symmetry_orbits.order is None:
+            return "None"
+        return open + joiner.join(f"{i}" for i in self.symmetry_orbits.order) + close
 
 
 class QRuleDouble(QRule):
@@ -580,49 +968,25 @@ class QRuleDouble(QRule):
         (size, domain1, origin1, axes1, domain2, origin2, axes2, domain_lines) = (
             self._get_image_config()
         )
-
+        points1 = to_2d(self.first_points, domain1, origin1, axes1)
+        points2 = to_2d(self.second_points, domain2, origin2, axes2)
+        weights = np.asarray(self.weights)
+
+        svg = [
+            f"<svg width='{size[0]}' height='{size[1]}' "
+            "xmlns='http://www.w3.org/2000/svg' "
+            "xmlns:xlink='http://www.w3.org/1999/xlink'>\n",
+            svg_license(f"{self.family.name()} order {self.order}"),
+        ]
+        svg += svg_lines(*domain_edges(domain1, domain_lines[0], origin1, axes1), "#000000", 1.5)
+        svg += svg_lines(*domain_edges(domain2, domain_lines[1], origin2, axes2), "#000000", 1.5)
+        svg += svg_lines(points1, points2, "#ACACAC", 0.5)
+        svg += svg_circles(
+            np.stack([points1, points2], axis=1).reshape(-1, 2), np.repeat(weights, 2)
+        )
+        svg.append("</svg>\n")
         with open(filename, "w") as f:
-            f.write(
-                f"<svg width='{size[0]}' height='{size[1]}' "
-                "xmlns='http://www.w3.org/2000/svg' "
-                "xmlns:xlink='http://www.w3.org/1999/xlink'>\n"
-            )
-            f.write(svg_license(f"{self.family.name()} order {self.order}"))
-            for domain, origin, axes, dlines in [
-                (domain1, origin1, axes1, domain_lines[0]),
-                (domain2, origin2, axes2, domain_lines[1]),
-            ]:
-                for lines in dlines:
-                    for a_, b_ in zip(lines[:-1], lines[1:]):
-                        a = to_2d(domain[a_], origin, axes)
-                        b = to_2d(domain[b_], origin, axes)
-                        f.write(
-                            f"<line x1='{a[0]}' y1='{a[1]}' x2='{b[0]}' y2='{b[1]}' "
-                            "stroke='#000000' stroke-width='1.5' "
-                            "stroke-linecap='round' />\n"
-                        )
-            for p1_, p2_ in zip(self.first_points, self.second_points):
-                p1 = to_2d(from_barycentric(tuple(p1_), domain1), origin1, axes1)
-                p2 = to_2d(from_barycentric(tuple(p2_), domain2), origin2, axes2)
-                f.write(
-                    f"<line x1='{p1[0]}' y1='{p1[1]}' x2='{p2[0]}' y2='{p2[1]}' "
-                    "stroke='#ACACAC' stroke-width='0.5' "
-                    "stroke-linecap='round' />\n"
-                )
-            for p1_, p2_, w in zip(self.first_points, self.second_points, self.weights):
-                p1 = to_2d(from_barycentric(tuple(p1_), domain1), origin1, axes1)
-                p2 = to_2d(from_barycentric(tuple(p2_), domain2), origin2, axes2)
-                if w > 0:
-                    f.write(f"<circle cx='{p1[0]}' cy='{p1[1]}' r='{9 * w**0.5}' fill='red' />")
-                    f.write(f"<circle cx='{p2[0]}' cy='{p2[1]}' r='{9 * w**0.5}' fill='red' />")
-                else:
-                    f.write(
-                        f"<circle cx='{p1[0]}' cy='{p1[1]}' r='{9 * (-w) ** 0.5}' fill='blue' />"
-                    )
-                    f.write(
-                        f"<circle cx='{p2[0]}' cy='{p2[1]}' r='{9 * (-w) ** 0.5}' fill='blue' />"
-                    )
-            f.write("</svg>")
+            f.write("".join(svg))
 
     def tikz_image(self, filename: str):
         """Make TikZ image of rule."""
@@ -632,39 +996,35 @@ class QRuleDouble(QRule):
         (size, domain1, origin1, axes1, domain2, origin2, axes2, domain_lines) = (
             self._get_image_config()
         )
+        points1 = to_2d(self.first_points, domain1, origin1, axes1)
+        points2 = to_2d(self.second_points, domain2, origin2, axes2)
+        weights = np.asarray(self.weights)
 
+        tikz = [tikz_license(), "\\begin{tikzpicture}[line cap=round,line join=round]\n"]
+        tikz += tikz_lines(
+            *domain_edges(domain1, domain_lines[0], origin1, axes1), "black,line width=1pt"
+        )
+        tikz += tikz_lines(
+            *domain_edges(domain2, domain_lines[1], origin2, axes2), "black,line width=1pt"
+        )
+        tikz += tikz_lines(points1, points2, "dashed,gray,line width=0.5pt")
+        tikz += tikz_circles(
+            np.stack([points1, points2], axis=1).reshape(-1, 2), np.repeat(weights, 2)
+        )
+        tikz.append("\\end{tikzpicture}\n")
         with open(filename, "w") as f:
-            f.write(tikz_license())
-            f.write("\\begin{tikzpicture}[line cap=round,line join=round]\n")
-            for domain, origin, axes, dlines in [
-                (domain1, origin1, axes1, domain_lines[0]),
-                (domain2, origin2, axes2, domain_lines[1]),
-            ]:
-                for lines in dlines:
-                    for a_, b_ in zip(lines[:-1], lines[1:]):
-                        a = to_2d(domain[a_], origin, axes)
-                        b = to_2d(domain[b_], origin, axes)
-                        f.write(
-                            f"\\draw[black,line width=1pt] ({a[0]},{a[1]}) -- ({b[0]},{b[1]});\n"
-                        )
-            for p1_, p2_ in zip(self.first_points, self.second_points):
-                p1 = to_2d(from_barycentric(tuple(p1_), domain1), origin1, axes1)
-                p2 = to_2d(from_barycentric(tuple(p2_), domain2), origin2, axes2)
-                f.write(
-                    f"\\draw[dashed,gray,line width=0.5pt] ({p1[0]},{p1[1]}) "
-                    f"-- ({p2[0]},{p2[1]});\n"
-                )
-            for p1_, p2_, w in zip(self.first_points, self.second_points, self.weights):
-                p1 = to_2d(from_barycentric(tuple(p1_), domain1), origin1, axes1)
-                p2 = to_2d(from_barycentric(tuple(p2_), domain2), origin2, axes2)
-                if w > 0:
-                    f.write(f"\\fill[red] ({p1[0]},{p1[1]}) circle ({9 * w**0.5});\n")
-                    f.write(f"\\fill[red] ({p2[0]},{p2[1]}) circle ({9 * w**0.5});\n")
-                else:
-                    f.write(f"\\fill[blue] ({p1[0]},{p1[1]}) circle ({9 * (-w) ** 0.5});\n")
-                    f.write(f"\\fill[blue] ({p2[0]},{p2[1]}) circle ({9 * (-w) ** 0.5});\n")
-            f.write("\\end{tikzpicture}\n")
+            f.write("".join(tikz))
 
+    @property
+    def arrays(self) -> typing.Dict[str, npt.NDArray[np.float64]]:
+        """Get the points and weights as arrays."""
+        return {
+            "first_points": np.asarray(self.first_points, dtype=np.float64),
+            "second_points": np.asarray(self.second_points, dtype=np.float64),
+            "weights": np.asarray(self.weights, dtype=np.float64),
+        }
+
+    @profiling.profiled("save_html_table", _table_profile_info)
     def save_html_table(self, filename: str):
         """Save HTML table of points and weights to a file."""
         assert filename.endswith(".html")
@@ -677,47 +1037,44 @@ class QRuleDouble(QRule):
         with open(f"{filename_root}.rule", "w") as f:
             f.write(f"--\n{self.family._qr}{self._rule[3:]}")
 
-        with open(filename, "w") as f:
-            f.write(self.barycentric_info())
+        arrays = self.arrays
+        table = np.column_stack(
+            [arrays["first_points"], arrays["second_points"], arrays["weights"]]
+        )
+        np.save(f"{filename_root}.npy", table)
+        np.savez(
+            f"{filename_root}.npz",
+            first_points=arrays["first_points"],
+            second_points=arrays["second_points"],
+            weights=arrays["weights"],
+        )
+
+        dim1 = arrays["first_points"].shape[1]
+        dim2 = dim1 + arrays["second_points"].shape[1]
+        rows = format_array(table)
+        with open(f"{filename_root}.csv", "w") as f:
             f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.rule'>&darr; Download as .rule</a></div>"
+                ",".join([f"point0[{i}]" for i in range(dim1)])
+                + ","
+                + ",".join([f"point1[{i}]" for i in range(dim2 - dim1)])
+                + ",weight\n"
+                + "".join(",".join(row) + "\n" for row in rows)
             )
-            with open(f"{filename_root}.csv", "w") as f2:
-                f2.write(",".join([f"point0[{i}]" for i, _ in enumerate(self.first_points[0])]))
-                f2.write(",")
-                f2.write(",".join([f"point1[{i}]" for i, _ in enumerate(self.second_points[0])]))
-                f2.write(",weight\n")
-                for p1, p2, w in zip(self.first_points, self.second_points, self.weights):
-                    f2.write(
-                        ",".join(f"{i}" for i in p1)
-                        + ","
-                        + ",".join(f"{i}" for i in p2)
-                        + f",{w}\n"
-                    )
+        with open(f"{filename_root}.json", "w") as f:
             f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.csv'>&darr; Download as CSV</a></div>"
-            )
-            with open(f"{filename_root}.json", "w") as f2:
-                f2.write('{"points": [')
-                f2.write(
-                    ", ".join(
-                        "[["
-                        + ", ".join(f"{i}" for i in p1)
-                        + "], ["
-                        + ", ".join(f"{i}" for i in p2)
-                        + "]]"
-                        for p1, p2 in zip(self.first_points, self.second_points)
-                    )
+                '{"points": ['
+                + ", ".join(
+                    "[[" + ", ".join(row[:dim1]) + "], [" + ", ".join(row[dim1:dim2]) + "]]"
+                    for row in rows
                 )
-                f2.write('], "weights": [')
-                f2.write(", ".join(f"{w}" for w in self.weights))
-                f2.write("]}")
-            f.write(
-                "<div class='small-note'>"
-                f"<a href='{filename_root_local}.json'>&darr; Download as JSON</a></div>"
+                + '], "weights": ['
+                + ", ".join(row[dim2] for row in rows)
+                + "]}"
             )
+
+        with open(filename, "w") as f:
+            f.write(self.barycentric_info())
+            f.write(self.download_links(filename_root_local))
             f.write("<br />\n")
             f.write("<table class='points'>\n")
             f.write("<thead>")
@@ -752,19 +1109,13 @@ class QRuleDouble(QRule):
         inner_joiner: str = ", ",
     ) -> str:
         """Get a list of first points as a string."""
-        return (
-            open
-            + outer_joiner.join(
-                [open + inner_joiner.join([f"{c}" for c in p]) + close for p in self.first_points]
-            )
-            + close
-        )
+        return self.formatted_list("first_points", open, close, outer_joiner, inner_joiner)
 
     def first_points_as_flat_list(
         self, open: str = "[", close: str = "]", joiner: str = ", "
     ) -> str:
         """Get a list of flat first points as a string."""
-        return open + joiner.join([f"{c}" for p in self.first_points for c in p]) + close
+        return self.formatted_list("first_points", open, close, joiner, flat=True)
 
     def second_points_as_list(
         self,
@@ -774,23 +1125,17 @@ class QRuleDouble(QRule):
         inner_joiner: str = ", ",
     ) -> str:
         """Get a list of second points as a string."""
-        return (
-            open
-            + outer_joiner.join(
-                [open + inner_joiner.join([f"{c}" for c in p]) + close for p in self.second_points]
-            )
-            + close
-        )
+        return self.formatted_list("second_points", open, close, outer_joiner, inner_joiner)
 
     def second_points_as_flat_list(
         self, open: str = "[", close: str = "]", joiner: str = ", "
     ) -> str:
         """Get a list of flat second points as a string."""
-        return open + joiner.join([f"{c}" for p in self.second_points for c in p]) + close
+        return self.formatted_list("second_points", open, close, joiner, flat=True)
 
     def weights_as_list(self, open: str = "[", close: str = "]", joiner: str = ", ") -> str:
         """Get a list of flat points as a string."""
-        return open + joiner.join([f"{w}" for w in self.weights]) + close
+        return self.formatted_list("weights", open, close, joiner)
 
 
 class QRuleFamily:
@@ -836,6 +1181,10 @@ class QRuleFamily:
             rules[r.domain].append(r)
         return rules
 
+    def has_orbits(self) -> bool:
+        """Check if any of the rules in the family are stored as orbits."""
+        return any(isinstance(r, QRuleSingle) and r.orbits is not None for r in self.rules)
+
     def name(self, format: str = "default") -> str:
         """Get name."""
         parts = re.split(r"--|\s|-", self._name)
@@ -907,6 +1256,21 @@ class QRuleFamily:
                     raise ValueError(f"Unsupported function type: {e['type']}")
         return out
 
+    def exact_degree(self, order: int | None) -> int | None:
+        """Get the degree of polynomials that the rule of a given order integrates exactly."""
+        for e in self._exact:
+            if e["type"] == "polynomial":
+                degree = f"{e['degree']}".replace(" ", "")
+                if re.match(r"^[0-9]+$", degree):
+                    return int(degree)
+                m = re.match(r"^([0-9]*)n([+-][0-9]+)?$", degree)
+                if m is None:
+                    raise ValueError(f"Unsupported degree: {degree}")
+                if order is None:
+                    return None
+                return int(m[1] or 1) * order + int(m[2] or 0)
+        return None
+
     def notes(self, format: str = "HTML") -> str:
         """Get notes."""
         notes = self._notes + self.exact_notes(format)
@@ -938,6 +1302,98 @@ class QRuleFamily:
         return self.name("HTML")
 
 
+def load_rule_file(filename: str, itype: str = "single") -> QRule:
+    """Load a rule from a .rule file.
+
+    Args:
+        filename: The file
+        itype: The type of the integral
+
+    Returns:
+        The rule
+    """
+    with open(filename) as f:
+        content = f.read()
+    if content.startswith("--\n"):
+        _, metadata_, rule_content = content.split("--", 3)
+        metadata = yaml.safe_load(metadata_)
+    else:
+        metadata = {}
+        rule_content = content
+
+    match itype:
+        case "single":
+            if metadata.get("storage") == "orbits":
+                types = []
+                generators = []
+                weights = []
+                rows = []
+                for line in rule_content.strip().split("\n"):
+                    t, g, w, *r = line.split("|")
+                    types.append(t.strip())
+                    generators.append([float(i) for i in g.strip().split()])
+                    weights.append(float(w))
+                    if len(r) > 0:
+                        rows.append(np.array([int(i) for i in r[0].split()], dtype=np.int64))
+                if 0 < len(rows) < len(types):
+                    raise ValueError(f"Positions of points missing from some orbits: {filename}")
+                return QRuleSingle(
+                    metadata.get("domain"),
+                    metadata.get("order"),
+                    None,
+                    None,
+                    content,
+                    orbits.Orbits(
+                        types,
+                        np.array(generators),
+                        np.array(weights),
+                        orbits.point_order(rows) if len(rows) > 0 else None,
+                    ),
+                )
+
+            points = []
+            weights = []
+            for line in rule_content.strip().split("\n"):
+                p, w = line.split("|")
+                points.append([float(i) for i in p.strip().split()])
+                weights.append(float(w))
+            return QRuleSingle(
+                metadata.get("domain"),
+                metadata.get("order"),
+                points,
+                weights,
+                content,
+            )
+        case "double":
+            points1 = []
+            points2 = []
+            weights = []
+            for line in rule_content.strip().split("\n"):
+                p1, p2, w = line.split("|")
+                points1.append([float(i) for i in p1.strip().split()])
+                points2.append([float(i) for i in p2.strip().split()])
+                weights.append(float(w))
+            return QRuleDouble(
+                metadata.get("domain"),
+                metadata.get("order"),
+                points1,
+                points2,
+                weights,
+                content,
+            )
+        case _:
+            raise ValueError(f"Unsupported integral type: {itype}")
+
+
+@profiling.profiled(
+    "load_rule",
+    lambda q, code: {
+        "family": code,
+        "rules": len(q.rules),
+        "npoints": sum(r.npoints for r in q.rules),
+        "bytes": len(q._qr) + sum(len(r._rule) for r in q.rules),
+    },
+)
 def load_rule(code: str) -> QRuleFamily:
     """Load a rule from a file and folder."""
     with open(os.path.join(settings.rules_path, f"{code}.qr")) as f:
@@ -946,58 +1402,12 @@ def load_rule(code: str) -> QRuleFamily:
 
     itype = data["integral-type"] if "integral-type" in data else "single"
 
-    rules: typing.List[QRule] = []
     pt_dir = os.path.join(settings.rules_path, f"{code}")
-    for pt_file in os.listdir(pt_dir):
-        if pt_file.endswith(".rule"):
-            with open(os.path.join(pt_dir, pt_file)) as f:
-                content = f.read()
-                if content.startswith("--\n"):
-                    _, metadata_, rule_content = content.split("--", 3)
-                    metadata = yaml.safe_load(metadata_)
-                else:
-                    metadata = {}
-
-                match itype:
-                    case "single":
-                        points = []
-                        weights = []
-                        for line in rule_content.strip().split("\n"):
-                            p, w = line.split("|")
-                            points.append([float(i) for i in p.strip().split()])
-                            weights.append(float(w))
-
-                        rules.append(
-                            QRuleSingle(
-                                metadata.get("domain"),
-                                metadata.get("order"),
-                                points,
-                                weights,
-                                content,
-                            )
-                        )
-                    case "double":
-                        points1 = []
-                        points2 = []
-                        weights = []
-                        for line in rule_content.strip().split("\n"):
-                            p1, p2, w = line.split("|")
-                            points1.append([float(i) for i in p1.strip().split()])
-                            points2.append([float(i) for i in p2.strip().split()])
-                            weights.append(float(w))
-
-                        rules.append(
-                            QRuleDouble(
-                                metadata.get("domain"),
-                                metadata.get("order"),
-                                points1,
-                                points2,
-                                weights,
-                                content,
-                            )
-                        )
-                    case _:
-                        raise ValueError(f"Unsupported integral type: {itype}")
+    rules = [
+        load_rule_file(os.path.join(pt_dir, pt_file), itype)
+        for pt_file in os.listdir(pt_dir)
+        if pt_file.endswith(".rule")
+    ]
     rules.sort(key=lambda r: (dim(r.domain), sort_name(r.domain), r.order))
 
     r = QRuleFamily(
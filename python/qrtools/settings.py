@@ -16,7 +16,8 @@ html_path = ""
 
 github_token: str | None = None
 
-processes = 1
+# The number of processes used to render images
+processes: int = 1
 
 site_data = {}
 
@@ -78,6 +79,14 @@ def set_html_path(path: str):
     settings.html_path = path
 
 
+def set_processes(n: int):
+    """Set the number of processes used to render images."""
+    global processes
+    if n < 1:
+        raise ValueError(f"Invalid number of processes: {n}")
+    processes = n
+
+
 def set_github_token(token: str):
     """Set GitHub token."""
     global github_token
@@ -0,0 +1,122 @@
+"""Verification of the polynomial exactness of quadrature rules."""
+
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from qrtools.moments import domains, exponents, moments, vandermonde
+from qrtools.rules import QRule, QRuleFamily, QRuleSingle, vertices
+
+# The relative error below which a monomial is considered to be integrated exactly
+tolerance = 1e-12
+
+
+def centred_points(rule: QRule) -> npt.NDArray[np.float64]:
+    """Get the points of a rule in centred coordinates."""
+    if not isinstance(rule, QRuleSingle):
+        raise ValueError("Only rules for single integrals can be verified")
+    if rule.domain not in domains:
+        raise ValueError(f"Unsupported domain: {rule.domain}")
+    return 2 * rule.arrays["points"] @ np.asarray(vertices(rule.domain)) - 1
+
+
+def exactness_errors(rule: QRule, degree: int) -> npt.NDArray[np.float64]:
+    """Get the relative error when a rule is used to integrate monomials.
+
+    Args:
+        rule: The rule
+        degree: The maximum degree of the monomials
+
+    Returns:
+        The relative error for each monomial, in the order given by exponents()
+    """
+    assert rule.domain is not None
+    values = vandermonde(centred_points(rule), degree)
+    weights = rule.arrays["weights"]
+    exact = moments(rule.domain, degree)
+    error = np.abs(weights @ values - exact)
+    scale = np.abs(weights) @ np.abs(values) + np.abs(exact)
+    return np.divide(error, scale, out=np.zeros_like(error), where=scale > 0)
+
+
+def max_exact_degree(rule: QRule, start: int = 8) -> int:
+    """Get the highest degree such that a rule integrates every polynomial of that degree exactly.
+
+    Degrees are checked in batches whose size doubles until a monomial that is not integrated
+    exactly is found. A rule with n points cannot integrate every polynomial of degree 2n
+    exactly, so at most 2n-1 is returned.
+
+    Args:
+        rule: The rule
+        start: The maximum degree of the first batch. If this is one more than the expected
+            degree, a single batch is usually enough
+
+    Returns:
+        The maximum exact degree, or -1 if the rule does not integrate constants exactly
+    """
+    assert rule.domain is not None
+    tdim = len(vertices(rule.domain)[0])
+    limit = 2 * rule.npoints - 1
+    degree = max(0, min(start, limit))
+    while True:
+        errors = exactness_errors(rule, degree)
+        degrees = exponents(tdim, degree).sum(axis=1)
+        inexact = degrees[errors > tolerance]
+        if len(inexact) > 0:
+            return int(inexact.min()) - 1
+        if degree == limit:
+            return limit
+        degree = min(2 * degree, limit)
+
+
+def exactness_report(
+    families: typing.List[QRuleFamily],
+) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Get the maximum exact degree of every rule for a single integral on a supported domain.
+
+    Args:
+        families: The families of rules
+
+    Returns:
+        The family code, domain, order, number of points, the degree that the rule should
+        integrate exactly (or None if this is not known) and the maximum exact degree of each rule
+    """
+    report = []
+    for q in sorted(families, key=lambda q: q.index):
+        for r in q.rules:
+            if isinstance(r, QRuleSingle) and r.domain in domains:
+                expected = q.exact_degree(r.order)
+                start = 8 if expected is None else expected + 1
+                report.append(
+                    {
+                        "code": q.code,
+                        "domain": r.domain,
+                        "order": r.order,
+                        "npoints": r.npoints,
+                        "exact-degree": expected,
+                        "max-exact-degree": max_exact_degree(r, start),
+                    }
+                )
+    return report
+
+
+def verify(families: typing.List[QRuleFamily]) -> typing.List[typing.Dict[str, typing.Any]]:
+    """Check that every rule integrates polynomials of the degree given by its family exactly.
+
+    Args:
+        families: The families of rules
+
+    Returns:
+        The exactness report of every rule
+    """
+    report = exactness_report(families)
+    errors = [
+        f"{r['code']} {r['domain']} order {r['order']}: exact to degree "
+        f"{r['max-exact-degree']}, expected {r['exact-degree']}"
+        for r in report
+        if r["exact-degree"] is not None and r["max-exact-degree"] < r["exact-degree"]
+    ]
+    if len(errors) > 0:
+        raise ValueError("Rules are not exact:\n" + "\n".join(errors))
+    return report
@@ -1,7 +1,7 @@
 import numpy as np
 import os
 import pytest
-import yaml
+from qrtools.rules import QRuleSingle, load_rule_file
 from webtools.tools import join
 
 import quadpy
@@ -26,6 +26,7 @@ qpy_map = {
     "Q000007": None,
     "Q000008": None,
     "Q000009": None,
+    "Q000010": None,
 }
 
 
@@ -42,20 +43,15 @@ qpy_map = {
 def test_against_quadpy(qfolder, qfile):
     qpy_function = qpy_map[qfolder]
 
-    with open(join(folder, qfolder, qfile)) as f:
-        _, yaml_data, rule = f.read().split("--\n")
-    info = yaml.load(yaml_data, yaml.FullLoader)
+    rule = load_rule_file(join(folder, qfolder, qfile))
+    assert isinstance(rule, QRuleSingle)
 
-    qpy_scheme = qpy_function[info["domain"]](info["order"])
+    qpy_scheme = qpy_function[rule.domain](rule.order)
 
-    pts = []
-    wts = []
-    for line in rule.strip().split("\n"):
-        p, w = line.split(" | ")
-        pts.append([float(i) for i in p.split(" ")])
-        wts.append(float(w))
+    pts = rule.points
+    wts = rule.weights
 
-    match info["domain"]:
+    match rule.domain:
         case "interval":
             mapped_pts = [p[0] - p[1] for p in pts]
             volume = 2
@@ -0,0 +1,82 @@
+import json
+
+import numpy as np
+import pytest
+from qrtools.catalogue import (
+    library_data_fields,
+    library_data_magic,
+    load_arrays,
+    write_catalogue,
+    write_library_data,
+)
+from qrtools.rules import load_rule
+from webtools.tools import join
+
+
+@pytest.mark.parametrize("code", ["Q000001", "Q000007"])
+def test_catalogue(tmp_path, code):
+    q = load_rule(code)
+    json_file = join(str(tmp_path), "catalogue.json")
+    data_file = join(str(tmp_path), "rules.bin")
+    write_catalogue([q], json_file, data_file)
+
+    with open(json_file) as f:
+        catalogue = json.load(f)
+    assert catalogue["data"] == "rules.bin"
+    assert [f["code"] for f in catalogue["families"]] == [code]
+
+    entries = catalogue["families"][0]["rules"]
+    assert len(entries) == len(q.rules)
+    for entry in entries:
+        r = [r for r in q.rules if r.domain == entry["domain"] and r.order == entry["order"]][0]
+        assert entry["npoints"] == r.npoints
+        assert entry["exact-degree"] == q.exact_degree(r.order)
+        arrays = load_arrays(data_file, entry)
+        assert set(arrays) == set(r.arrays)
+        for name, a in r.arrays.items():
+            assert np.array_equal(arrays[name], a)
+        assert entry["positive-weights"] == bool(np.all(arrays["weights"] > 0))
+
+
+@pytest.mark.parametrize(
+    ("code", "order", "degree"), [("Q000001", 3, 5), ("Q000002", 3, 3), ("Q000003", 3, 7)]
+)
+def test_exact_degree(code, order, degree):
+    assert load_rule(code).exact_degree(order) == degree
+
+
+def test_library_data(tmp_path):
+    families = [load_rule("Q000001"), load_rule("Q000007")]
+    domains = sorted(set(r.domain for q in families for r in q.rules))
+    data_file = join(str(tmp_path), "rules.bin")
+    write_library_data(families, domains, data_file)
+
+    with open(data_file, "rb") as f:
+        data = f.read()
+    assert data[: len(library_data_magic)] == library_data_magic
+    count = int(np.frombuffer(data, dtype="<i8", count=1, offset=len(library_data_magic))[0])
+    assert count == sum(len(q.rules) for q in families)
+    index = np.frombuffer(
+        data,
+        dtype="<i8",
+        count=count * len(library_data_fields),
+        offset=len(library_data_magic) + 8,
+    ).reshape(count, len(library_data_fields))
+
+    for family, domain, order, npoints, point_dim, second_point_dim, offset in index:
+        q = [q for q in families if q.index == family][0]
+        r = [r for r in q.rules if r.domain == domains[domain] and r.order == order][0]
+        assert npoints == r.npoints
+        for name, a in r.arrays.items():
+            assert (
+                a.shape[1:]
+                == {
+                    "points": (point_dim,),
+                    "first_points": (point_dim,),
+                    "second_points": (second_point_dim,),
+                    "weights": (),
+                }[name]
+            )
+            b = np.frombuffer(data, dtype="<f8", count=a.size, offset=offset).reshape(a.shape)
+            assert np.array_equal(a, b)
+            offset += a.nbytes
@@ -0,0 +1,39 @@
+import math
+
+import numpy as np
+import pytest
+from qrtools import conical, verification
+from qrtools.rules import load_rule, vertices
+
+
+@pytest.mark.parametrize("alpha", [0, 1, 2])
+@pytest.mark.parametrize("npoints", [1, 2, 5, 20])
+def test_gauss_jacobi(alpha, npoints):
+    points, weights = conical.gauss_jacobi(npoints, alpha)
+    assert np.all(weights > 0)
+    assert np.all((points > 0) & (points < 1))
+    for k in range(2 * npoints):
+        # Integral of x^k (1-x)^alpha over [0, 1], divided by the integral of (1-x)^alpha
+        exact = math.factorial(k) * math.factorial(alpha + 1) / math.factorial(k + alpha + 1)
+        assert np.isclose(weights @ points**k, exact, rtol=1e-13)
+
+
+@pytest.mark.parametrize("domain", conical.domains)
+@pytest.mark.parametrize("order", [1, 2, 3, 5, 8])
+def test_conical_product(domain, order):
+    r = conical.rule(domain, order)
+    points, weights = conical.conical_product(domain, order)
+    assert r.npoints == order ** len(vertices(domain)[0])
+    assert np.allclose(points.sum(axis=1), 1)
+    assert np.all(points > 0)
+    assert np.all(weights > 0)
+    assert verification.max_exact_degree(r, 2 * order) == 2 * order - 1
+
+
+def test_rule_files():
+    q = load_rule("Q000010")
+    assert len(q.rules) > 0
+    for r in q.rules:
+        points, weights = conical.conical_product(r.domain, r.order)
+        assert np.array_equal(r.arrays["points"], points)
+        assert np.array_equal(r.arrays["weights"], weights)
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+from qrtools import settings
+from qrtools.images import render_images
+from webtools.tools import join
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_render_images(tmp_path, processes):
+    jobs = [
+        (
+            "Q000001",
+            "interval",
+            order,
+            [join(str(tmp_path), f"{order}.svg"), join(str(tmp_path), f"{order}.tex")],
+        )
+        for order in range(1, 4)
+    ]
+    timings = render_images(jobs, processes)
+    assert set(timings) == {"svg", "tex"}
+    for _, _, _, filenames in jobs:
+        for filename in filenames:
+            assert os.path.isfile(filename)
+
+
+def test_render_images_error(tmp_path):
+    with pytest.raises(RuntimeError, match="Q000001 interval 100"):
+        render_images([("Q000001", "interval", 100, [join(str(tmp_path), "100.svg")])])
+
+
+def test_processes_setting():
+    assert isinstance(settings.processes, int)
+    default = settings.processes
+    with pytest.raises(ValueError):
+        settings.set_processes(0)
+    settings.set_processes(3)
+    assert settings.processes == 3
+    settings.set_processes(default)
@@ -0,0 +1,86 @@
+import os
+
+import pytest
+from qrtools.incremental import BuildManifest, hash_strings, update_folder
+from webtools.tools import join
+
+
+def test_manifest(tmp_path):
+    folder = str(tmp_path)
+    a = join(folder, "a.html")
+    b = join(folder, "sub", "b.html")
+    os.mkdir(join(folder, "sub"))
+
+    manifest = BuildManifest(folder)
+    for file in [a, b]:
+        assert not manifest.up_to_date([file], hash_strings("1"))
+        with open(file, "w") as f:
+            f.write("content")
+        manifest.record([file], hash_strings("1"))
+    assert manifest.remove_stale() == []
+    manifest.save()
+
+    manifest = BuildManifest(folder)
+    assert manifest.up_to_date([a], hash_strings("1"))
+    assert not manifest.up_to_date([b], hash_strings("2"))
+    assert not os.path.isfile(b)
+
+    assert manifest.remove_stale() == []
+    assert not os.path.isdir(join(folder, "sub"))
+
+
+def test_remove_stale(tmp_path):
+    folder = str(tmp_path)
+    for file in ["old.html", "new.html"]:
+        with open(join(folder, file), "w") as f:
+            f.write("content")
+    manifest = BuildManifest(folder)
+    manifest.record([join(folder, "old.html"), join(folder, "new.html")])
+    manifest.save()
+
+    manifest = BuildManifest(folder)
+    manifest.record([join(folder, "new.html")])
+    assert manifest.remove_stale() == [join(folder, "old.html")]
+    assert not os.path.isfile(join(folder, "old.html"))
+    assert os.path.isfile(join(folder, "new.html"))
+
+
+def test_remove_stale_unrecorded(tmp_path):
+    folder = str(tmp_path)
+    with open(join(folder, "unrecorded.html"), "w") as f:
+        f.write("content")
+
+    manifest = BuildManifest(folder)
+    with pytest.raises(RuntimeError, match="unrecorded.html"):
+        manifest.remove_stale()
+    assert os.path.isfile(join(folder, "unrecorded.html"))
+
+
+def test_update_folder(tmp_path):
+    source = join(str(tmp_path), "source")
+    target = join(str(tmp_path), "target")
+    manifest = join(str(tmp_path), "manifest.json")
+    os.makedirs(join(source, "sub"))
+    for file, content in [("a.txt", "a"), ("b.txt", "b"), ("sub/c.txt", "c")]:
+        with open(join(source, file), "w") as f:
+            f.write(content)
+
+    written, removed = update_folder(source, target, manifest)
+    assert [os.path.relpath(f, target) for f in written] == ["a.txt", "b.txt", "sub/c.txt"]
+    assert removed == []
+
+    with open(join(target, "compiled.o"), "w") as f:
+        f.write("not generated")
+    os.utime(join(target, "a.txt"), (0, 0))
+    with open(join(source, "b.txt"), "w") as f:
+        f.write("new b")
+    os.remove(join(source, "sub", "c.txt"))
+
+    written, removed = update_folder(source, target, manifest)
+    assert written == [join(target, "b.txt")]
+    assert removed == [join(target, "sub", "c.txt")]
+    assert os.path.getmtime(join(target, "a.txt")) == 0
+    assert os.path.isfile(join(target, "compiled.o"))
+    assert not os.path.isdir(join(target, "sub"))
+    with open(join(target, "b.txt")) as f:
+        assert f.read() == "new b"
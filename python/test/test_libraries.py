@@ -0,0 +1,213 @@
+import filecmp
+import glob
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+from qrtools import generate_qr
+from qrtools.libraries import binary_data_files, build_library, libraries, load_rules
+from webtools.tools import join
+
+
+def test_libraries():
+    assert libraries() == ["c", "cpp", "fortran77", "fortran90", "julia", "python", "rust"]
+
+
+@pytest.mark.parametrize("lib", ["c", "julia"])
+def test_timing_report(tmp_path, lib):
+    report = build_library(lib, target_dir=join(str(tmp_path), lib))
+    json.dumps(report)
+    assert report["library"] == lib
+    assert report["total"] >= report["generate"]
+    templates = [f for f in report["files"] if f["item"] is not None]
+    assert "Gauss--Legendre" in [f["item"] for f in templates]
+    assert all(f["time"] >= 0 for f in report["files"])
+
+
+def test_incremental(tmp_path):
+    target = join(str(tmp_path), "c")
+    report = build_library("c", target_dir=target)
+    assert "quadraturerules.h" in report["written"]
+    assert report["removed"] == []
+
+    with open(join(target, "test", "test.c"), "w") as f:
+        f.write("edited")
+    report = build_library("c", target_dir=target)
+    assert report["written"] == ["test/test.c"]
+    assert report["removed"] == []
+
+
+def test_independent_of_build_order(tmp_path):
+    generate_qr.abbrv_names.clear()
+    build_library("fortran77", target_dir=join(str(tmp_path), "fortran77"))
+    build_library("fortran90", target_dir=join(str(tmp_path), "after"))
+    generate_qr.abbrv_names.clear()
+    build_library("fortran90", target_dir=join(str(tmp_path), "alone"))
+    comparison = filecmp.dircmp(join(str(tmp_path), "after"), join(str(tmp_path), "alone"))
+    assert comparison.diff_files == []
+    assert comparison.left_only == comparison.right_only == []
+
+
+def all_rules():
+    """Get the family index, integral type, domain index, order, size and arrays of every rule."""
+    families, domains = load_rules()
+    return [
+        (q.index, q.itype, domains.index(r.domain), r.order, r.npoints, r.arrays)
+        for q in families
+        for r in q.rules
+    ]
+
+
+def c_dumper():
+    calls = "".join(
+        f"  dump({itype}_integral_quadrature_data({f}, {d}, {o}));\n"
+        for f, itype, d, o, _, _ in all_rules()
+    )
+    return (
+        "#include <stdio.h>\n"
+        '#include "quadraturerules.h"\n\n'
+        "static void dump(const QuadratureRuleData* r)\n{\n"
+        "  for (int i = 0; i < r->npoints * r->point_dim; ++i)\n"
+        '    printf("%.17g\\n", r->points[i]);\n'
+        "  for (int i = 0; i < r->npoints * r->second_point_dim; ++i)\n"
+        '    printf("%.17g\\n", r->second_points[i]);\n'
+        "  for (int i = 0; i < r->npoints; ++i)\n"
+        '    printf("%.17g\\n", r->weights[i]);\n'
+        "}\n\n"
+        f"int main()\n{{\n{calls}  return 0;\n}}\n"
+    )
+
+
+def cpp_dumper():
+    calls = "".join(
+        f"  std::apply(dump, {itype}_integral_quadrature_span("
+        f"QuadratureRule({f}), Domain({d}), {o}));\n"
+        for f, itype, d, o, _, _ in all_rules()
+    )
+    return (
+        "#include <cstdio>\n"
+        "#include <tuple>\n"
+        "#include <quadraturerules/quadraturerules.h>\n\n"
+        "using namespace quadraturerules;\n\n"
+        "const auto dump = [](auto... arrays)\n{\n"
+        "  for (auto a : {arrays...})\n"
+        "    for (double x : a)\n"
+        '      std::printf("%.17g\\n", x);\n'
+        "};\n\n"
+        f"int main()\n{{\n{calls}}}\n"
+    )
+
+
+def fortran90_dumper():
+    calls = ""
+    for f, itype, d, o, _, _ in all_rules():
+        if itype == "single":
+            calls += f"  call single_integral_quadrature_pointer({f}, {d}, {o}, p, w)\n"
+            calls += '  write(*, "(ES25.17E3)") p, w\n'
+        else:
+            calls += f"  call double_integral_quadrature_pointer({f}, {d}, {o}, p, q, w)\n"
+            calls += '  write(*, "(ES25.17E3)") p, q, w\n'
+    return (
+        'include "quadraturerules.f90"\n\n'
+        "program dump\n"
+        "  use quadraturerules\n"
+        "  implicit none\n"
+        "  real(kind=8), pointer :: p(:,:), q(:,:), w(:)\n\n"
+        f"{calls}"
+        "end program\n"
+    )
+
+
+def fortran77_dumper():
+    calls = ""
+    for f, itype, d, o, n, arrays in all_rules():
+        dims = [a.shape[1] for name, a in arrays.items() if name != "weights"]
+        if itype == "single":
+            calls += f"      CALL siquad({f}, {d}, {o}, p, w, 9999, 3)\n"
+        else:
+            calls += f"      CALL diquad({f}, {d}, {o}, p, q, w, 9999, 3, 3)\n"
+        for a, dim in zip("pq", dims):
+            calls += f"      WRITE (*, 1) (({a}(i, j), i = 0, {dim - 1}), j = 0, {n - 1})\n"
+        calls += f"      WRITE (*, 1) (w(j), j = 0, {n - 1})\n"
+    return (
+        '      INCLUDE "quadraturerules.f"\n\n'
+        "      PROGRAM dump\n"
+        "      DOUBLE PRECISION p, q, w\n"
+        "      DIMENSION p(0:3, 0:9999)\n"
+        "      DIMENSION q(0:3, 0:9999)\n"
+        "      DIMENSION w(0:9999)\n"
+        "      INTEGER i\n"
+        "      INTEGER j\n"
+        " 1    FORMAT (ES25.17E3)\n\n"
+        f"{calls}"
+        "      END\n"
+    )
+
+
+def julia_dumper():
+    calls = "".join(
+        f"dump(Q.{itype}_integral_quadrature_view(Q.QuadratureRule({f}), Q.Domain({d}), {o}))\n"
+        for f, itype, d, o, _, _ in all_rules()
+    )
+    return (
+        "import TabulatedQuadratureRules as Q\n\n"
+        "dump(arrays) = foreach(a -> foreach(println, a), arrays)\n\n"
+        f"{calls}"
+    )
+
+
+# Programs that write every number in a library, and the commands to compile and run them
+dumpers = {
+    "c": (c_dumper, "dump.c", ["gcc", "-o", "dump", "dump.c", "quadraturerules.c"], ["./dump"]),
+    "cpp": (
+        cpp_dumper,
+        "dump.cpp",
+        ["g++", "-std=c++20", "-I.", "-o", "dump", "dump.cpp", join("quadraturerules", "*.cpp")],
+        ["./dump"],
+    ),
+    "fortran77": (
+        fortran77_dumper,
+        "dump.f",
+        ["gfortran", "-std=legacy", "-o", "dump", "dump.f"],
+        ["./dump"],
+    ),
+    "fortran90": (fortran90_dumper, "dump.f90", ["gfortran", "-o", "dump", "dump.f90"], ["./dump"]),
+    "julia": (
+        julia_dumper,
+        "dump.jl",
+        None,
+        ["julia", "--project=.", "-e", 'import Pkg; Pkg.instantiate(); include("dump.jl")'],
+    ),
+}
+
+
+@pytest.mark.parametrize("lib", ["c", "cpp", "fortran77", "fortran90", "julia"])
+def test_binary_data(tmp_path, lib):
+    dumper, filename, compile_command, run_command = dumpers[lib]
+    tool = run_command[0] if compile_command is None else compile_command[0]
+    if shutil.which(tool) is None:
+        pytest.skip(f"{tool} is not installed")
+
+    output = {}
+    for data in ["source", "binary"]:
+        target = join(str(tmp_path), data)
+        build_library(lib, data, target_dir=target)
+        with open(join(target, filename), "w") as f:
+            f.write(dumper())
+        env = dict(os.environ)
+        if data == "binary":
+            env["QUADRATURERULES_DATA"] = join(target, binary_data_files[lib])
+        if compile_command is not None:
+            files = [
+                sorted(glob.glob(c, root_dir=target)) if "*" in c else [c] for c in compile_command
+            ]
+            subprocess.run([f for c in files for f in c], cwd=target, check=True)
+        output[data] = subprocess.run(
+            run_command, cwd=target, env=env, check=True, capture_output=True, text=True
+        ).stdout
+
+    expected = sum(a.size for *_, arrays in all_rules() for a in arrays.values())
+    assert len(output["binary"].split()) == expected
+    assert output["binary"] == output["source"]
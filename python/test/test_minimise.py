@@ -0,0 +1,96 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from qrtools import minimise, verification
+from qrtools.rules import QRuleSingle, barycentric, load_rule_file, vertices
+
+
+@pytest.mark.parametrize("domain", verification.domains)
+def test_product_rule(domain):
+    points, weights = minimise.product_rule(domain, 3)
+    rule = QRuleSingle(domain, 3, points.tolist(), weights.tolist(), "")
+    assert verification.max_exact_degree(rule, 6) == 5
+    assert minimise.inside(domain, points @ np.asarray(vertices(domain)))
+
+
+@pytest.mark.parametrize("domain", verification.domains)
+def test_barycentric(domain):
+    v = np.asarray(vertices(domain))
+    points = np.random.default_rng(0).random((10, v.shape[1])) / v.shape[1]
+    b = barycentric(domain, points)
+    assert np.allclose(b.sum(axis=1), 1)
+    assert np.allclose(b @ v, points)
+    assert np.allclose(barycentric(domain, v), np.eye(len(v)))
+
+
+def test_inside():
+    assert minimise.inside("triangle", np.array([[0.2, 0.3], [0.1, 0.1]]))
+    assert not minimise.inside("triangle", np.array([[0.2, 0.3], [0.6, 0.5]]))
+    assert not minimise.inside("square-based pyramid", np.array([[0.6, 0.1, 0.5]]))
+
+
+@pytest.mark.parametrize(
+    ("domain", "order", "npoints"), [("triangle", 3, 7), ("quadrilateral", 3, 7)]
+)
+def test_minimise(domain, order, npoints):
+    points, weights = minimise.product_rule(domain, order)
+    start = QRuleSingle(domain, order, points.tolist(), weights.tolist(), "")
+    rule = minimise.minimise(start)
+    assert rule.order == 2 * order - 1
+    assert rule.npoints == npoints
+    assert verification.max_exact_degree(rule, 2 * order) == 2 * order - 1
+    assert np.all(rule.arrays["weights"] > 0)
+    assert np.all(rule.arrays["points"] > 0)
+
+
+def test_write_candidates(tmp_path):
+    points, weights = minimise.product_rule("triangle", 3)
+    start = QRuleSingle("triangle", 3, points.tolist(), weights.tolist(), "")
+    reports = minimise.write_candidates(str(tmp_path), [start])
+    assert reports[0]["written"]
+    with open(os.path.join(tmp_path, "report.json")) as f:
+        assert json.load(f) == reports
+    with open(os.path.join(tmp_path, "triangle-5.rule")) as f:
+        _, metadata, content = f.read().split("--\n")
+    assert metadata == "domain: triangle\norder: 5\n"
+    assert len(content.strip().split("\n")) == 7
+
+
+@pytest.mark.parametrize(
+    ("domain", "order", "npoints"), [("interval", 4, 4), ("triangle", 3, 7), ("triangle", 4, 15)]
+)
+def test_minimise_symmetric(domain, order, npoints):
+    points, weights = minimise.product_rule(domain, order)
+    start = QRuleSingle(domain, order, points.tolist(), weights.tolist(), "")
+    rule = minimise.minimise(start, symmetric=True)
+    assert rule.orbits is not None
+    assert rule.npoints == npoints
+    assert verification.max_exact_degree(rule, 2 * order) == 2 * order - 1
+    assert np.all(rule.arrays["weights"] > 0)
+    assert np.all(rule.arrays["points"] > 0)
+    assert minimise.report(rule, start)["symmetric"]
+
+
+def test_minimise_not_symmetric():
+    points, weights = minimise.product_rule("triangle", 4)
+    start = QRuleSingle("triangle", 4, points.tolist(), weights.tolist(), "")
+    assert not minimise.report(minimise.minimise(start), start)["symmetric"]
+
+    points, weights = minimise.product_rule("quadrilateral", 2)
+    start = QRuleSingle("quadrilateral", 2, points.tolist(), weights.tolist(), "")
+    with pytest.raises(ValueError):
+        minimise.minimise(start, symmetric=True)
+
+
+def test_write_candidates_symmetric(tmp_path):
+    points, weights = minimise.product_rule("triangle", 3)
+    start = QRuleSingle("triangle", 3, points.tolist(), weights.tolist(), "")
+    reports = minimise.write_candidates(str(tmp_path), [start], symmetric=True)
+    assert reports[0]["written"]
+    assert reports[0]["symmetric"]
+    rule = load_rule_file(os.path.join(tmp_path, "triangle-5.rule"))
+    assert rule.orbits is not None
+    assert rule.npoints == 7
+    assert verification.max_exact_degree(rule, 6) == 5
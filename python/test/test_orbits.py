@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+from qrtools import orbits
+from qrtools.libraries import load_rules
+from qrtools.rules import QRuleSingle, orbit_rule_file
+
+
+@pytest.mark.parametrize(
+    ("otype", "size"),
+    [("S2", 1), ("S11", 2), ("S3", 1), ("S21", 3), ("S111", 6), ("S22", 6), ("S211", 12)],
+)
+def test_orbit_size(otype, size):
+    assert orbits.orbit_size(otype) == size
+    p = orbits.permutations(otype)
+    assert p.shape == (size, sum(orbits.multiplicities(otype)))
+    assert len({tuple(i) for i in p}) == size
+
+
+def test_expand():
+    o = orbits.Orbits(
+        ["S21", "S3"], np.array([[0.1, 0.1, 0.8], [1 / 3, 1 / 3, 1 / 3]]), np.array([0.2, 0.4])
+    )
+    points, weights = orbits.expand(o)
+    assert o.npoints == 4
+    assert {tuple(p) for p in points} == {
+        (0.1, 0.1, 0.8),
+        (0.1, 0.8, 0.1),
+        (0.8, 0.1, 0.1),
+        (1 / 3, 1 / 3, 1 / 3),
+    }
+    assert np.allclose(weights, [0.2, 0.2, 0.2, 0.4])
+
+
+def test_find_orbits():
+    o = orbits.Orbits(
+        ["S211", "S1111"],
+        np.array([[0.1, 0.1, 0.5, 0.3], [0.4, 0.3, 0.2, 0.1]]),
+        np.array([0.01, 0.02]),
+    )
+    points, weights = orbits.expand(o)
+    perm = np.random.default_rng(0).permutation(len(weights))
+    found = orbits.find_orbits(points[perm], weights[perm])
+    assert found is not None
+    assert found.types == o.types
+    assert np.allclose(found.generators, o.generators)
+    assert np.allclose(found.weights, o.weights)
+    assert found.order is not None
+    expanded_points, expanded_weights = orbits.expand(found)
+    assert np.array_equal(expanded_points, points[perm])
+    assert np.array_equal(expanded_weights, weights[perm])
+
+    assert orbits.find_orbits(points[1:], weights[1:]) is None
+    weights[0] *= 2
+    assert orbits.find_orbits(points, weights) is None
+
+
+def test_symmetrise():
+    # A conical product rule on a triangle is not symmetric
+    points = np.array([[0.6, 0.3, 0.1], [0.2, 0.2, 0.6], [0.3, 0.1, 0.6]])
+    weights = np.array([0.5, 0.25, 0.25])
+    o = orbits.symmetrise(points, weights)
+    assert o.types == ["S111", "S21"]
+    assert o.npoints == 9
+    assert np.isclose(o.weights @ [6, 3], 1)
+    expanded_points, expanded_weights = orbits.expand(o)
+    assert orbits.find_orbits(expanded_points, expanded_weights) is not None
+    # Symmetric polynomials are integrated in the same way
+    assert np.isclose(
+        expanded_weights @ np.prod(expanded_points, axis=1), weights @ np.prod(points, axis=1)
+    )
+
+
+def test_stored_orbits():
+    families, _ = load_rules()
+    stored = [r for q in families for r in q.rules if getattr(r, "orbits", None) is not None]
+    assert len(stored) > 0
+    for r in stored:
+        assert isinstance(r, QRuleSingle)
+        assert r.npoints == len(r.points) == len(r.weights)
+        found = orbits.find_orbits(r.arrays["points"], r.arrays["weights"])
+        assert found is not None
+        assert sorted(found.types) == sorted(r.orbits.types)
+
+
+def test_symmetry_orbits():
+    families, _ = load_rules()
+    rules = {(q.name(), r.domain, r.order): r for q in families for r in q.rules}
+    # Stored as points, but symmetric
+    centroid = rules[("centroid quadrature", "triangle", 1)]
+    assert centroid.orbits is None
+    assert centroid.symmetry_orbits is not None
+    assert centroid.symmetry_orbits.types == ["S3"]
+    # Not symmetric
+    assert rules[("Xiao--Gimbutas", "tetrahedron", 8)].symmetry_orbits is None
+    assert rules[("centroid quadrature", "quadrilateral", 1)].symmetry_orbits is None
+
+
+def test_no_averaging():
+    points = np.array([[0.25, 0.75], [0.7500000000000001, 0.25]])
+    weights = np.array([0.5, 0.5000000000000001])
+    found = orbits.find_orbits(points, weights)
+    assert found is not None
+    assert found.generators.tolist() == [[0.75, 0.25]]
+    assert found.weights.tolist() == [0.5]
+    assert orbits.find_orbits(points, weights, 0) is None
+
+
+def test_exact_orbits():
+    # Expanding the exact orbits of a rule gives its points and weights bit for bit and in the
+    # same order, and the files stored as orbits are exactly what converting the points gives
+    families, _ = load_rules()
+    for q in families:
+        for r in q.rules:
+            if isinstance(r, QRuleSingle) and r.domain in orbits.domains:
+                points, weights = r.arrays["points"], r.arrays["weights"]
+                found = orbits.find_orbits(points, weights, 0)
+                if found is not None:
+                    expanded_points, expanded_weights = orbits.expand(found)
+                    assert np.array_equal(expanded_points, points)
+                    assert np.array_equal(expanded_weights, weights)
+                if r.orbits is not None:
+                    assert found is not None
+                    assert r._rule == orbit_rule_file(r.domain, r.order, found)
+
+
+def test_point_order():
+    families, _ = load_rules()
+    for q in families:
+        if q.name() == "closed Newton--Cotes":
+            r = [r for r in q.rules if r.domain == "interval" and r.order == 5][0]
+    assert r.orbits is not None
+    assert np.all(np.diff(r.arrays["points"][:, 0]) < 0)
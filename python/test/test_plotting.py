@@ -0,0 +1,189 @@
+import os
+import re
+import time
+
+import numpy as np
+import pytest
+from qrtools.rules import load_rule, svg_license, tikz_license
+from webtools.tools import join
+
+number = re.compile(r"-?\d+(?:\.\d+)?(?:e[+-]?\d+)?")
+
+
+def old_to_2d(point, origin, axes):
+    return (
+        origin[0] + sum(a[0] * p for a, p in zip(axes, point)),
+        origin[1] + sum(a[1] * p for a, p in zip(axes, point)),
+    )
+
+
+def from_barycentric(point, domain):
+    return tuple(sum(p * d[i] for p, d in zip(point, domain)) for i in range(len(domain[0])))
+
+
+def old_lines(domain, domain_lines, origin, axes):
+    for lines in domain_lines:
+        for a_, b_ in zip(lines[:-1], lines[1:]):
+            yield old_to_2d(domain[a_], origin, axes), old_to_2d(domain[b_], origin, axes)
+
+
+def old_svg_line(a, b, colour, width):
+    return (
+        f"<line x1='{a[0]}' y1='{a[1]}' x2='{b[0]}' y2='{b[1]}' "
+        f"stroke='{colour}' stroke-width='{width}' stroke-linecap='round' />\n"
+    )
+
+
+def old_svg_circle(p, w):
+    return (
+        f"<circle cx='{p[0]}' cy='{p[1]}' r='{9 * abs(w) ** 0.5}' "
+        f"fill='{'red' if w > 0 else 'blue'}' />\n"
+    )
+
+
+def old_tikz_circle(p, w):
+    return f"\\fill[{'red' if w > 0 else 'blue'}] ({p[0]},{p[1]}) circle ({9 * abs(w) ** 0.5});\n"
+
+
+def old_svg_image(rule):
+    """Make an SVG image of a rule by mapping one point at a time."""
+    svg = []
+    if hasattr(rule, "first_points"):
+        size, domain1, origin1, axes1, domain2, origin2, axes2, domain_lines = (
+            rule._get_image_config()
+        )
+        for domain, origin, axes, dlines in [
+            (domain1, origin1, axes1, domain_lines[0]),
+            (domain2, origin2, axes2, domain_lines[1]),
+        ]:
+            svg += [
+                old_svg_line(a, b, "#000000", 1.5)
+                for a, b in old_lines(domain, dlines, origin, axes)
+            ]
+        points = [
+            (
+                old_to_2d(from_barycentric(tuple(p1), domain1), origin1, axes1),
+                old_to_2d(from_barycentric(tuple(p2), domain2), origin2, axes2),
+            )
+            for p1, p2 in zip(rule.first_points, rule.second_points)
+        ]
+        svg += [old_svg_line(p1, p2, "#ACACAC", 0.5) for p1, p2 in points]
+        for (p1, p2), w in zip(points, rule.weights):
+            svg += [old_svg_circle(p1, w), old_svg_circle(p2, w)]
+    else:
+        size, domain, domain_lines, origin, axes = rule._get_image_config()
+        svg += [
+            old_svg_line(a, b, "#000000", 1.5)
+            for a, b in old_lines(domain, domain_lines, origin, axes)
+        ]
+        for p, w in zip(rule.points, rule.weights):
+            svg.append(
+                old_svg_circle(old_to_2d(from_barycentric(tuple(p), domain), origin, axes), w)
+            )
+    return (
+        f"<svg width='{size[0]}' height='{size[1]}' "
+        "xmlns='http://www.w3.org/2000/svg' "
+        "xmlns:xlink='http://www.w3.org/1999/xlink'>\n"
+        + svg_license(f"{rule.family.name()} order {rule.order}")
+        + "".join(svg)
+        + "</svg>\n"
+    )
+
+
+def old_tikz_image(rule):
+    """Make a TikZ image of a rule by mapping one point at a time."""
+    tikz = []
+    if hasattr(rule, "first_points"):
+        _, domain1, origin1, axes1, domain2, origin2, axes2, domain_lines = rule._get_image_config()
+        for domain, origin, axes, dlines in [
+            (domain1, origin1, axes1, domain_lines[0]),
+            (domain2, origin2, axes2, domain_lines[1]),
+        ]:
+            tikz += [
+                f"\\draw[black,line width=1pt] ({a[0]},{a[1]}) -- ({b[0]},{b[1]});\n"
+                for a, b in old_lines(domain, dlines, origin, axes)
+            ]
+        points = [
+            (
+                old_to_2d(from_barycentric(tuple(p1), domain1), origin1, axes1),
+                old_to_2d(from_barycentric(tuple(p2), domain2), origin2, axes2),
+            )
+            for p1, p2 in zip(rule.first_points, rule.second_points)
+        ]
+        tikz += [
+            f"\\draw[dashed,gray,line width=0.5pt] ({p1[0]},{p1[1]}) -- ({p2[0]},{p2[1]});\n"
+            for p1, p2 in points
+        ]
+        for (p1, p2), w in zip(points, rule.weights):
+            tikz += [old_tikz_circle(p1, w), old_tikz_circle(p2, w)]
+    else:
+        _, domain, domain_lines, origin, axes = rule._get_image_config()
+        tikz += [
+            f"\\draw[black,line width=1pt] ({a[0]},{a[1]}) -- ({b[0]},{b[1]});\n"
+            for a, b in old_lines(domain, domain_lines, origin, axes)
+        ]
+        for p, w in zip(rule.points, rule.weights):
+            tikz.append(
+                old_tikz_circle(old_to_2d(from_barycentric(tuple(p), domain), origin, axes), w)
+            )
+    return (
+        tikz_license()
+        + "\\begin{tikzpicture}[line cap=round,line join=round]\n"
+        + "".join(tikz)
+        + "\\end{tikzpicture}\n"
+    )
+
+
+def get_rule(family, domain, order):
+    return next(r for r in load_rule(family).rules if r.domain == domain and r.order == order)
+
+
+def assert_same_image(new, old):
+    """Check that two images contain the same elements, with the same numbers up to rounding."""
+    assert number.sub("#", new) == number.sub("#", old)
+    assert np.allclose(
+        [float(i) for i in number.findall(new)], [float(i) for i in number.findall(old)]
+    )
+
+
+@pytest.mark.parametrize(
+    ("family", "domain", "order"),
+    [
+        ("Q000001", "interval", 4),
+        ("Q000009", "interval", 4),
+        ("Q000002", "triangle", 4),
+        ("Q000002", "tetrahedron", 4),
+        ("Q000004", "quadrilateral", 1),
+        ("Q000004", "hexahedron", 1),
+        ("Q000004", "triangular prism", 1),
+        ("Q000010", "square-based pyramid", 3),
+        ("Q000007", "edge-adjacent quadrilaterals", 2),
+        ("Q000007", "vertex-adjacent quadrilaterals", 2),
+        ("Q000007", "edge-adjacent triangle and quadrilateral", 2),
+        ("Q000007", "vertex-adjacent triangle and quadrilateral", 2),
+        ("Q000007", "edge-adjacent triangles", 2),
+        ("Q000007", "vertex-adjacent triangles", 2),
+        ("Q000007", "triangle", 2),
+        ("Q000007", "quadrilateral", 2),
+    ],
+)
+def test_against_per_point_images(tmp_path, family, domain, order):
+    rule = get_rule(family, domain, order)
+    rule.svg_image(join(str(tmp_path), "rule.svg"))
+    rule.tikz_image(join(str(tmp_path), "rule.tex"))
+    with open(join(str(tmp_path), "rule.svg")) as f:
+        assert_same_image(f.read(), old_svg_image(rule))
+    with open(join(str(tmp_path), "rule.tex")) as f:
+        assert_same_image(f.read(), old_tikz_image(rule))
+
+
+def test_large_rule(tmp_path):
+    # Images of the largest rules are drawn quickly enough that they do not need to be skipped
+    rule = get_rule("Q000007", "quadrilateral", 5)
+    assert rule.npoints > 1000
+    start = time.perf_counter()
+    rule.svg_image(join(str(tmp_path), "rule.svg"))
+    rule.tikz_image(join(str(tmp_path), "rule.tex"))
+    assert time.perf_counter() - start < 5
+    assert os.path.getsize(join(str(tmp_path), "rule.svg")) < 5 * 10**6
+    assert os.path.getsize(join(str(tmp_path), "rule.tex")) < 5 * 10**6
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from qrtools import generate_qr, profiling
+from qrtools.images import render_images
+from qrtools.rules import load_rule
+from webtools.tools import join
+
+
+@pytest.fixture
+def profile():
+    profiling.enable()
+    yield
+    profiling.disable()
+
+
+def test_disabled():
+    profiling.disable()
+    load_rule("Q000001")
+    assert profiling.events() == []
+
+
+def test_stages(tmp_path, profile):
+    q = load_rule("Q000001")
+    q.rules[0].image(join(str(tmp_path), "rule.svg"))
+    generate_qr.Rule(q.rules[0]).substitute("{{R.points_as_list}}", "R")
+
+    events = profiling.events()
+    assert [e["name"] for e in events] == ["load_rule", "image.svg", "generate_qr.rule"]
+    assert events[0]["info"]["rules"] == len(q.rules)
+    assert events[1]["info"]["family"] == "Q000001"
+    assert events[1]["info"]["bytes"] > 0
+    assert all(e["time"] >= 0 for e in events)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_images(tmp_path, profile, processes):
+    load_rule("Q000001")
+    jobs = [
+        ("Q000001", "interval", order, [join(str(tmp_path), f"{order}.svg")])
+        for order in range(1, 4)
+    ]
+    render_images(jobs, processes)
+
+    names = [e["name"] for e in profiling.events()]
+    assert names.count("load_rule") >= 1
+    assert names.count("image.svg") == 3
+    assert names.count("images") == 1
+
+
+@pytest.mark.parametrize("format", ["json", "chrome"])
+def test_write_profile(tmp_path, profile, format):
+    load_rule("Q000001")
+    load_rule("Q000002")
+    filename = join(str(tmp_path), "profile.json")
+    profiling.write_profile(filename, format)
+    with open(filename) as f:
+        content = json.load(f)
+    if format == "json":
+        assert content["stages"]["load_rule"]["count"] == 2
+        assert set(content["families"]) == {"Q000001", "Q000002"}
+    else:
+        assert len(content["traceEvents"]) == 2
+        assert all(e["ph"] == "X" for e in content["traceEvents"])
@@ -1,19 +1,12 @@
-import re
 import os
 
 import numpy as np
 import pytest
-import sympy
 import yaml
+from qrtools import settings, verification
+from qrtools.rules import format_array, load_rule, load_rule_file
 from webtools.tools import join
 
-x = [
-    sympy.Symbol("x"),
-    sympy.Symbol("y"),
-    sympy.Symbol("z"),
-]
-
-
 folder = join(
     os.path.dirname(os.path.realpath(__file__)),
     "..",
@@ -37,8 +30,7 @@ def test_cell_has_unit_volume(family, rule):
     if info["integrand"] != "f(x)":
         pytest.xfail()
 
-    with open(join(folder, family, rule)) as f:
-        volume = sum(float(p.split(" | ")[1]) for p in f.read().split("--")[2].strip().split("\n"))
+    volume = sum(load_rule_file(join(folder, family, rule)).weights)
     assert np.isclose(volume, 1.0)
 
 
@@ -49,10 +41,8 @@ def test_barycentric_coordinates(family, rule):
     if info["integrand"] != "f(x)":
         pytest.xfail()
 
-    with open(join(folder, family, rule)) as f:
-        for line in f.read().split("--\n")[2].strip().split("\n"):
-            p = [float(i) for i in line.split(" | ")[0].split(" ")]
-            assert np.isclose(sum(p), 1.0)
+    for p in load_rule_file(join(folder, family, rule)).points:
+        assert np.isclose(sum(p), 1.0)
 
 
 @pytest.mark.parametrize(("family", "rule"), rules)
@@ -62,93 +52,77 @@ def test_no_standard_form(family, rule):
             assert "e" not in p
 
 
-def sympy_parse(f):
-    f = re.sub(r"([0-9])n", r"\1*n", f)
-    return sympy.S(f)
-
-
-def functions(e, degree, domain):
-    match e["type"]:
-        case "polynomial":
-            d = int(sympy_parse(e["degree"]).subs(sympy.Symbol("n"), degree))
-            if domain in ["interval"]:
-                return [x[0] ** d]
-            elif domain in ["triangle", "quadrilateral"]:
-                return [x[0] ** (d - i) * x[1] ** i for i in range(d + 1)]
-            elif domain in ["tetrahedron", "hexahedron"]:
-                return [
-                    x[0] ** (d - i - j) * x[1] ** i * x[2] ** j
-                    for i in range(d + 1)
-                    for j in range(d + 1 - i)
-                ]
-            else:
-                raise ValueError(f"Unsupported domain: {domain}")
-        case _:
-            raise ValueError(f"Unsupported function type: {e['type']}")
-
-
-def integral(f, domain):
-    match domain:
-        case "interval":
-            return float(f.integrate((x[0], 0, 1)))
-        case "triangle":
-            return float(f.integrate((x[0], 0, 1 - x[1]), (x[1], 0, 1)))
-        case "quadrilateral":
-            return float(f.integrate((x[0], 0, 1), (x[1], 0, 1)))
-        case "tetrahedron":
-            return float(f.integrate((x[0], 0, 1 - x[1] - x[2]), (x[1], 0, 1 - x[2]), (x[2], 0, 1)))
-        case "hexahedron":
-            return float(f.integrate((x[0], 0, 1), (x[1], 0, 1), (x[2], 0, 1)))
-        case _:
-            raise ValueError(f"Unsupported domain: {domain}")
-
-
-def subs(f, values):
-    out = 1 * f
-    for i, j in zip(x, values):
-        out = out.subs(i, j)
-    return float(out)
-
-
-@pytest.mark.parametrize(("family", "rule"), rules)
-def test_exact(family, rule):
-    with open(join(folder, f"{family}.qr")) as f:
-        family_info = yaml.load(f, yaml.FullLoader)
-    if "exact" not in family_info:
+@pytest.mark.parametrize("family", sorted(set(f for f, _ in rules)))
+def test_exact(family):
+    q = load_rule(family)
+    if all(q.exact_degree(r.order) is None for r in q.rules):
         pytest.skip()
 
-    with open(join(folder, family, rule)) as f:
-        _, yaml_data, rule = f.read().split("--\n")
-    info = yaml.load(yaml_data, yaml.FullLoader)
-    pts = []
-    wts = []
-    for line in rule.strip().split("\n"):
-        p, w = line.split(" | ")
-        pts.append([float(i) for i in p.split(" ")])
-        wts.append(float(w))
-
-    match info["domain"]:
-        case "interval":
-            mapped_pts = [i[1:] for i in pts]
-            volume = 1
-        case "triangle":
-            mapped_pts = [i[1:] for i in pts]
-            volume = 0.5
-        case "quadrilateral":
-            mapped_pts = [[i[1], i[2]] for i in pts]
-            volume = 1
-        case "tetrahedron":
-            mapped_pts = [i[1:] for i in pts]
-            volume = 1 / 6
-        case "hexahedron":
-            mapped_pts = [[i[1], i[2], i[4]] for i in pts]
-            volume = 1
-        case _:
-            raise ValueError(f"Unsupported domain: {info['domain']}")
-
-    for e in family_info["exact"]:
-        for f in functions(e, int(info["order"]), info["domain"]):
-            assert np.isclose(
-                integral(f, info["domain"]),
-                volume * sum(w * subs(f, p) for p, w in zip(mapped_pts, wts)),
+    report = verification.verify([q])
+    assert len(report) == len(q.rules)
+
+
+def old_csv_and_json(rule):
+    """Write a rule as CSV and JSON using the original formatting of each number with str."""
+    if hasattr(rule, "first_points"):
+        csv = (
+            ",".join([f"point0[{i}]" for i, _ in enumerate(rule.first_points[0])])
+            + ","
+            + ",".join([f"point1[{i}]" for i, _ in enumerate(rule.second_points[0])])
+            + ",weight\n"
+            + "".join(
+                ",".join(f"{i}" for i in p1) + "," + ",".join(f"{i}" for i in p2) + f",{w}\n"
+                for p1, p2, w in zip(rule.first_points, rule.second_points, rule.weights)
+            )
+        )
+        points = ", ".join(
+            "[[" + ", ".join(f"{i}" for i in p1) + "], [" + ", ".join(f"{i}" for i in p2) + "]]"
+            for p1, p2 in zip(rule.first_points, rule.second_points)
+        )
+    else:
+        csv = (
+            ",".join([f"point[{i}]" for i, _ in enumerate(rule.points[0])])
+            + ",weight\n"
+            + "".join(
+                ",".join(f"{i}" for i in p) + f",{w}\n" for p, w in zip(rule.points, rule.weights)
             )
+        )
+        points = ", ".join("[" + ", ".join(f"{i}" for i in p) + "]" for p in rule.points)
+    json = (
+        '{"points": [' + points + '], "weights": [' + ", ".join(f"{w}" for w in rule.weights) + "]}"
+    )
+    return csv, json
+
+
+def test_format_array():
+    values = np.array([[0.1, 1e-05, -0.0], [1e16, 1 / 3, 2.0]])
+    assert format_array(values) == [[str(i) for i in row] for row in values.tolist()]
+    assert format_array(np.zeros((2, 0))) == [[], []]
+
+
+@pytest.mark.parametrize(("family", "index"), [("Q000002", 5), ("Q000007", 0)])
+def test_downloads(tmp_path, family, index):
+    rule = load_rule(family).rules[index]
+    html_path = settings.html_path
+    settings.set_html_path(str(tmp_path))
+    try:
+        rule.save_html_table(join(str(tmp_path), "rule.html"))
+    finally:
+        settings.set_html_path(html_path)
+
+    csv, json = old_csv_and_json(rule)
+    with open(join(str(tmp_path), "rule.csv")) as f:
+        assert f.read() == csv
+    with open(join(str(tmp_path), "rule.json")) as f:
+        assert f.read() == json
+
+    arrays = rule.arrays
+    table = np.load(join(str(tmp_path), "rule.npy"))
+    assert table.dtype == np.float64
+    expected = np.column_stack(list(arrays.values()))
+    assert np.array_equal(table.view(np.uint64), expected.view(np.uint64))
+    with np.load(join(str(tmp_path), "rule.npz")) as data:
+        assert sorted(data.files) == sorted(arrays)
+        for name, value in arrays.items():
+            assert data[name].dtype == np.float64
+            assert np.array_equal(data[name].view(np.uint64), value.view(np.uint64))
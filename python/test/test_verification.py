@@ -0,0 +1,11 @@
+from qrtools import verification
+from qrtools.rules import QRuleSingle
+
+
+def test_max_exact_degree():
+    rule = QRuleSingle("triangle", None, [[1 / 3, 1 / 3, 1 / 3]], [1.0], "")
+    assert verification.max_exact_degree(rule) == 1
+    rule = QRuleSingle("triangle", None, [[1.0, 0.0, 0.0]], [1.0], "")
+    assert verification.max_exact_degree(rule) == 0
+    rule = QRuleSingle("interval", None, [[1.0, 0.0]], [0.5], "")
+    assert verification.max_exact_degree(rule) == -1
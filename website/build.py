@@ -3,9 +3,13 @@
 import argparse
 import os
 import re
+import shutil
 from datetime import datetime
 
-from qrtools import settings
+from qrtools import profiling, settings
+from qrtools.catalogue import write_catalogue
+from qrtools.images import render_images
+from qrtools.incremental import BuildManifest, hash_files, hash_strings
 from qrtools.rules import dim, load_rule, to_html
 from webtools.html import make_html_page
 from webtools.markup import heading, heading_with_self_ref, markup
@@ -29,6 +33,30 @@ parser.add_argument(
     default=None,
     help="Provide a GitHub token to get update timestamps.",
 )
+parser.add_argument(
+    "--incremental",
+    action="store_true",
+    help="Only rebuild files whose inputs have changed since the last build.",
+)
+parser.add_argument(
+    "--processes",
+    metavar="processes",
+    default=None,
+    type=int,
+    help="The number of processes to use when rendering images (default: number of CPUs).",
+)
+parser.add_argument(
+    "--profile",
+    metavar="profile",
+    default=None,
+    help="Record the time taken by each stage of the build and write it to this file.",
+)
+parser.add_argument(
+    "--profile-format",
+    default="json",
+    choices=["json", "chrome"],
+    help="The format of the profile: a JSON summary of each stage, or a Chrome trace.",
+)
 
 sitemap = {}
 
@@ -45,8 +73,13 @@ def write_html_page(path: str, title: str, content: str, include_in_sitemap: boo
     assert html_local(path) not in sitemap
     if include_in_sitemap:
         sitemap[html_local(path)] = title
-    with open(path, "w") as f:
-        f.write(make_html_page(content, title))
+    inputs = hash_strings(site_hash, f"{title}", content)
+    if not manifest.up_to_date([path], inputs):
+        with profiling.stage("website.page", page=html_local(path)) as info:
+            with open(path, "w") as f:
+                f.write(make_html_page(content, title))
+            info["bytes"] = profiling.file_size(path)
+        manifest.record([path], inputs)
 
 
 def load_md_file(matches):
@@ -60,16 +93,33 @@ if args.destination is not None:
     settings.set_html_path(args.destination)
 if args.github_token is not None:
     settings.set_github_token(args.github_token)
+settings.set_processes(args.processes if args.processes is not None else (os.cpu_count() or 1))
+if args.profile is not None:
+    profiling.enable()
 
 # Prepare paths
-if os.path.isdir(settings.html_path):
+if os.path.isdir(settings.html_path) and not args.incremental:
     os.system(f"rm -rf {settings.html_path}")
-os.mkdir(settings.html_path)
+os.makedirs(settings.html_path, exist_ok=True)
 
-os.system(f"cp -r {settings.files_path}/* {settings.html_path}")
+manifest = BuildManifest(settings.html_path)
+code_hash = hash_files(join(settings.root_path, "python", "qrtools"), os.path.realpath(__file__))
+site_hash = hash_strings(
+    code_hash, hash_files(settings.template_path, join(settings.website_path, "data"))
+)
+
+for root, _, files in os.walk(settings.files_path):
+    for file in files:
+        target = join(settings.html_path, os.path.relpath(join(root, file), settings.files_path))
+        file_hash = hash_files(join(root, file))
+        if not manifest.up_to_date([target], file_hash):
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(join(root, file), target)
+            manifest.record([target], file_hash)
 
 with open(join(settings.html_path, "CNAME"), "w") as f:
     f.write("quadraturerules.org")
+manifest.record([join(settings.html_path, "CNAME")])
 
 
 def row(name, content):
@@ -82,6 +132,8 @@ def row(name, content):
 
 rules = []
 rules_for_index = []
+image_jobs = []
+rule_hashes = []
 
 # Make rule pages
 for file in os.listdir(settings.rules_path):
@@ -91,7 +143,8 @@ for file in os.listdir(settings.rules_path):
         print(f"{rule}.html", end="", flush=True)
         q = load_rule(rule)
         rpath = join(settings.html_path, rule)
-        os.mkdir(rpath)
+        os.makedirs(rpath, exist_ok=True)
+        family_hash = hash_strings(code_hash, q._qr)
 
         rules_for_index.append((q.code, q.html_name, f"/{rule}"))
         rules.append(q)
@@ -109,8 +162,12 @@ for file in os.listdir(settings.rules_path):
                 f"{q.references('HTML')}<br /><div class='citation'>"
                 f"<a href='/{q.code}/references.bib'>Download references as BibTe&Chi;</a></div>",
             )
-            with open(join(settings.html_path, q.code, "references.bib"), "w") as f:
-                f.write(bib)
+            bib_file = join(settings.html_path, q.code, "references.bib")
+            bib_hash = hash_strings(family_hash, bib)
+            if not manifest.up_to_date([bib_file], bib_hash):
+                with open(bib_file, "w") as f:
+                    f.write(bib)
+                manifest.record([bib_file], bib_hash)
         content += "</table>"
 
         for domain, rulelist in q.rules_by_domain.items():
@@ -121,57 +178,64 @@ for file in os.listdir(settings.rules_path):
             )
             domain_content += f"<a class='more' href='/{q.code}'>&larr; Back to {q.html_name}</a>"
             for i, r in enumerate(rulelist):
-                r.save_html_table(join(rpath, f"{r.title('filename')}.html"))
+                rule_hash = hash_strings(family_hash, r._rule)
+                table_files = [
+                    join(rpath, f"{r.title('filename')}.{ext}")
+                    for ext in ["html", "rule", "csv", "json", "npy", "npz"]
+                ]
+                rule_hashes.append(rule_hash)
+                if not manifest.up_to_date(table_files, rule_hash):
+                    r.save_html_table(table_files[0])
+                    manifest.record(table_files, rule_hash)
                 rule_content = ""
                 if r.order is not None:
                     rule_content += heading_with_self_ref("h3", f"Order {r.order}")
-                if r.npoints <= 1000:
-                    assert r.domain is not None
-                    img_title = (
-                        f"{q.name('HTML')} order {r.order} on "
-                        f"{'an' if r.domain[0] in 'aeiou' else 'a'} {r.domain}"
-                    )
-                    img_page = heading("h1", img_title)
-                    svg_filename = join(rpath, f"{r.title('filename')}.svg")
-                    png_filename = join(rpath, f"{r.title('filename')}.png")
-                    tikz_filename = join(rpath, f"{r.title('filename')}.tex")
-                    r.image(svg_filename)
-                    r.image(png_filename)
-                    r.image(tikz_filename)
-                    svg_image = html_local(svg_filename)
-                    png_image = html_local(png_filename)
-                    tikz_image = html_local(tikz_filename)
-                    img_page += (
-                        f"<center><img src='{svg_image}'></center>"
-                        "<p>This image can be used under a "
-                        "<a href='https://creativecommons.org/licenses/by/4.0/'>"
-                        "Creative Commons Attribution 4.0 International (CC BY 4.0) license</a>: "
-                        "if you use it anywhere, you must attribute the online encyclopedia of "
-                        "quadrature rules. If you use this image anywhere online, please include a "
-                        "link to the online encyclopedia of quadrature rules; if you use this "
-                        "image in a paper, please <a href='/citing.html'>cite the online "
-                        "encyclopedia of quadrature rules</a>.</p>\n"
-                        "<ul>\n"
-                        f"<li><a href='{svg_image}'>Download SVG</a></li>"
-                        f"<li><a href='{png_image}'>Download PNG</a></li>"
-                        f"<li><a href='{tikz_image}'>Download TikZ</a></li>"
-                        "</ul>\n"
-                    )
-                    write_html_page(
-                        join(rpath, f"img-{r.title('filename')}.html"),
-                        img_title,
-                        img_page,
-                        False,
-                    )
-                    rule_content += (
-                        f"<a href='{html_local(rpath)}/img-{r.title('filename')}.html'>"
-                        f"<img src='{svg_image}'></a>"
-                    )
-                else:
-                    rule_content += (
-                        "<div style='color:#ACACAC;margin:5px'>"
-                        "(plot not shown for rule with &gt;1000 points)</div>"
-                    )
+                assert r.domain is not None
+                img_title = (
+                    f"{q.name('HTML')} order {r.order} on "
+                    f"{'an' if r.domain[0] in 'aeiou' else 'a'} {r.domain}"
+                )
+                img_page = heading("h1", img_title)
+                svg_filename = join(rpath, f"{r.title('filename')}.svg")
+                png_filename = join(rpath, f"{r.title('filename')}.png")
+                tikz_filename = join(rpath, f"{r.title('filename')}.tex")
+                img_files = [
+                    f
+                    for f in [svg_filename, png_filename, tikz_filename]
+                    if not manifest.up_to_date([f], rule_hash)
+                ]
+                if len(img_files) > 0:
+                    image_jobs.append((q.code, r.domain, r.order, img_files))
+                    manifest.record(img_files, rule_hash)
+                svg_image = html_local(svg_filename)
+                png_image = html_local(png_filename)
+                tikz_image = html_local(tikz_filename)
+                img_page += (
+                    f"<center><img src='{svg_image}'></center>"
+                    "<p>This image can be used under a "
+                    "<a href='https://creativecommons.org/licenses/by/4.0/'>"
+                    "Creative Commons Attribution 4.0 International (CC BY 4.0) license</a>: "
+                    "if you use it anywhere, you must attribute the online encyclopedia of "
+                    "quadrature rules. If you use this image anywhere online, please include a "
+                    "link to the online encyclopedia of quadrature rules; if you use this "
+                    "image in a paper, please <a href='/citing.html'>cite the online "
+                    "encyclopedia of quadrature rules</a>.</p>\n"
+                    "<ul>\n"
+                    f"<li><a href='{svg_image}'>Download SVG</a></li>"
+                    f"<li><a href='{png_image}'>Download PNG</a></li>"
+                    f"<li><a href='{tikz_image}'>Download TikZ</a></li>"
+                    "</ul>\n"
+                )
+                write_html_page(
+                    join(rpath, f"img-{r.title('filename')}.html"),
+                    img_title,
+                    img_page,
+                    False,
+                )
+                rule_content += (
+                    f"<a href='{html_local(rpath)}/img-{r.title('filename')}.html'>"
+                    f"<img src='{svg_image}'></a>"
+                )
                 rule_content += (
                     "<div>"
                     f"<a class='toggler' id='show-{domain}-{i}' "
@@ -204,13 +268,28 @@ for file in os.listdir(settings.rules_path):
         end = datetime.now()
         print(f" (completed in {(end - start).total_seconds():.2f}s)")
 
+# Make images
+render_images(image_jobs)
+
+# Make catalogue
+catalogue_files = [
+    join(settings.html_path, "catalogue.json"),
+    join(settings.html_path, "rules.bin"),
+]
+catalogue_hash = hash_strings(code_hash, *sorted(rule_hashes))
+if not manifest.up_to_date(catalogue_files, catalogue_hash):
+    with profiling.stage("website.catalogue") as info:
+        write_catalogue(rules, *catalogue_files)
+        info["bytes"] = profiling.file_size(*catalogue_files)
+    manifest.record(catalogue_files, catalogue_hash)
+
 
 # Make pages
 def make_pages(sub_dir=""):
     """Make pages recursively."""
     for file in os.listdir(join(settings.pages_path, sub_dir)):
         if os.path.isdir(join(settings.pages_path, sub_dir, file)):
-            os.mkdir(join(settings.html_path, sub_dir, file))
+            os.makedirs(join(settings.html_path, sub_dir, file), exist_ok=True)
             make_pages(join(sub_dir, file))
         elif file.endswith(".md"):
             start = datetime.now()
@@ -263,6 +342,15 @@ def make_pages(sub_dir=""):
 
 make_pages()
 
+# Punch card images are written by webtools while marking up Fortran 77 code
+if os.path.isdir(join(settings.html_path, "f77")):
+    manifest.record(
+        [
+            join(settings.html_path, "f77", file)
+            for file in os.listdir(join(settings.html_path, "f77"))
+        ]
+    )
+
 rules.sort(key=lambda q: q.code)
 
 # List of rules pages
@@ -323,7 +411,7 @@ write_html_page(
 )
 
 # Lists per integral
-integrals = list(set(q.integral() for q in rules))
+integrals = sorted(set(q.integral() for q in rules))
 content = heading("h1", "List of quadrature rules (by integral)")
 for n, i in enumerate(integrals):
     content += heading("h2", f"<a href='/rules-integral{n}.html'>{i}</a>")
@@ -385,8 +473,19 @@ def list_pages(folder: str) -> str:
 
 
 content = heading("h1", "List of all pages") + list_pages("")
-with open(join(settings.html_path, "sitemap.html"), "w") as f:
-    f.write(make_html_page(content))
+sitemap_file = join(settings.html_path, "sitemap.html")
+sitemap_hash = hash_strings(site_hash, content)
+if not manifest.up_to_date([sitemap_file], sitemap_hash):
+    with open(sitemap_file, "w") as f:
+        f.write(make_html_page(content))
+    manifest.record([sitemap_file], sitemap_hash)
+
+for file in manifest.remove_stale():
+    print(f"Removed {html_local(file)}")
+manifest.save()
+
+if args.profile is not None:
+    profiling.write_profile(args.profile, args.profile_format)
 
 end_all = datetime.now()
 print(f"Total time: {(end_all - start_all).total_seconds():.2f}s")